@@ -0,0 +1,198 @@
+"""
+Async Data Processor
+
+The synchronous Database.connect and save_data calls block an asyncio event loop. This module mirrors the
+dependency-inversion design for asyncio: AsyncDataProcessor depends on the AsyncDatabase abstraction, never on a
+concrete backend, and ThreadedDatabaseAdapter lets every existing synchronous Database implementation act as one by
+running its calls in a thread pool.
+
+Writes run concurrently up to a fixed limit. When the limit is reached, process_many stops pulling records from its
+source until a write finishes, so a fast producer cannot queue unbounded work.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+
+from .dependency_inversion_principle import Database
+
+
+class AsyncDatabase(ABC):
+    """
+    Abstract base class for an asyncio database.
+    """
+
+    @abstractmethod
+    async def connect(self):
+        pass
+
+    @abstractmethod
+    async def save_data(self, data: str):
+        pass
+
+    async def save_many(self, data: list):
+        """
+        Save several records in one call. The default saves them one by one.
+
+        Args:
+            data (list[str]): The records to save.
+        """
+        for item in data:
+            await self.save_data(item)
+
+
+class ThreadedDatabaseAdapter(AsyncDatabase):
+    """
+    An adapter that exposes a synchronous Database as an AsyncDatabase.
+
+    Every call runs in a thread pool, so the event loop keeps running while the backend blocks.
+    """
+
+    def __init__(self, database: Database, executor: Executor = None):
+        """
+        Initialize the adapter.
+
+        Args:
+            database (Database): The synchronous backend to adapt.
+            executor (Executor, optional): The pool to run calls in. Defaults to the event loop's default executor.
+        """
+        self.database = database
+        self._executor = executor
+
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    async def connect(self):
+        await self._run(self.database.connect)
+
+    async def save_data(self, data: str):
+        await self._run(self.database.save_data, data)
+
+    async def save_many(self, data: list):
+        await self._run(self.database.save_many, data)
+
+
+class AsyncDataProcessor:
+    """
+    A class for processing data and saving it to an asyncio database.
+
+    Like DataProcessor, it depends on an abstraction (AsyncDatabase) rather than a specific implementation.
+
+    Attributes:
+        max_concurrency (int): The maximum number of writes in flight at once.
+        output (Callable[[str], None]): Receives the log messages, print by default.
+    """
+
+    def __init__(self, database: AsyncDatabase, max_concurrency: int = 10, output=print):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.database = database
+        self.max_concurrency = max_concurrency
+        self.output = output
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _write(self, data: str):
+        self.output("Processing data...")
+        await self.database.connect()
+        await self.database.save_data(data)
+
+    async def process_data(self, data: str):
+        """
+        Process and save data to the database, waiting for a free slot if the concurrency limit is reached.
+
+        Args:
+            data (str): The data to be processed and saved.
+        """
+        async with self._semaphore:
+            await self._write(data)
+
+    async def process_many(self, records) -> int:
+        """
+        Process and save many records with pipelined, concurrent writes.
+
+        Records are pulled from the source only while fewer than max_concurrency writes are in flight, and no more
+        records are pulled once a write has failed.
+
+        Args:
+            records (Iterable[str] | AsyncIterable[str]): The records to process.
+
+        Returns:
+            int: The number of records saved.
+
+        Raises:
+            Exception: The first error raised by a write, after all started writes have finished.
+        """
+        pending = set()
+        errors = []
+        count = 0
+
+        def finished(task: asyncio.Task):
+            self._semaphore.release()
+            pending.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())
+
+        source = _as_async_iterator(records)
+        try:
+            while True:
+                # Wait for a free slot before pulling, so a failure seen meanwhile stops the pipeline.
+                await self._semaphore.acquire()
+                try:
+                    if errors:
+                        raise StopAsyncIteration
+                    data = await source.__anext__()
+                except BaseException:
+                    self._semaphore.release()
+                    raise
+                task = asyncio.ensure_future(self._write(data))
+                pending.add(task)
+                task.add_done_callback(finished)
+                count += 1
+        except StopAsyncIteration:
+            pass
+        finally:
+            await source.aclose()
+            if pending:
+                await asyncio.wait(set(pending))
+        if errors:
+            raise errors[0]
+        return count
+
+
+async def _as_async_iterator(records):
+    if hasattr(records, "__aiter__"):
+        async for data in records:
+            yield data
+    else:
+        for data in records:
+            yield data
+
+
+# Example Usage
+if __name__ == "__main__":
+    import time
+
+    class SlowDatabase(Database):
+        """
+        A synchronous backend whose writes take 50 milliseconds.
+        """
+
+        def connect(self):
+            pass
+
+        def save_data(self, data: str):
+            time.sleep(0.05)
+
+    async def main():
+        processor = AsyncDataProcessor(ThreadedDatabaseAdapter(SlowDatabase()), max_concurrency=5)
+        started = time.perf_counter()
+        saved = await processor.process_many(f"Record {index}" for index in range(10))
+        print(f"Saved {saved} records in {time.perf_counter() - started:.2f}s")
+
+    asyncio.run(main())
+
+"""
+AsyncDataProcessor keeps the event loop free while records are written, and overlapping writes finish in a fraction of
+the sequential time. Existing Database implementations are reused through ThreadedDatabaseAdapter, so the processor
+still depends only on an abstraction.
+"""
@@ -0,0 +1,251 @@
+"""
+Database Connection Pool
+
+DataProcessor calls connect() for every record, so a real backend pays its connection setup on every write.
+PooledDatabase is itself a Database: it keeps a bounded pool of backends that are connected once and reused, which
+lets many DataProcessor instances, on many threads, share the same connections without changing DataProcessor.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .dependency_inversion_principle import Database
+
+
+class _PooledConnection:
+    __slots__ = ("backend", "created_at", "last_used")
+
+    def __init__(self, backend: Database, now: float):
+        self.backend = backend
+        self.created_at = now
+        self.last_used = now
+
+
+class PooledDatabase(Database):
+    """
+    A thread-safe pool of connected Database backends.
+
+    Attributes:
+        max_size (int): The maximum number of backends, idle or checked out.
+        idle_timeout (float): Seconds an idle backend is kept before it is evicted, None to keep it forever.
+        max_lifetime (float): Seconds after which a backend is retired, even if in use, None for no limit.
+        created (int): The number of backends created so far.
+        reused (int): The number of checkouts served by an existing backend.
+        evicted (int): The number of backends discarded for being idle, too old or unhealthy.
+    """
+
+    def __init__(self, factory, max_size: int = 8, idle_timeout: float = 300.0, max_lifetime: float = 3600.0,
+                 health_check=None, checkout_timeout: float = None, clock=time.monotonic):
+        """
+        Initialize the pool.
+
+        Args:
+            factory (callable): Creates a new, unconnected backend, e.g. MySQLDatabase.
+            max_size (int): The maximum number of backends, idle or checked out.
+            idle_timeout (float): Seconds an idle backend is kept before it is evicted, None to keep it forever.
+            max_lifetime (float): Seconds after which a backend is retired, None for no limit.
+            health_check (callable, optional): Returns False, or raises, for a backend that must not be reused.
+            checkout_timeout (float, optional): Seconds to wait for a free backend before raising TimeoutError.
+            clock (callable): The monotonic clock used for timeouts.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        self._factory = factory
+        self._health_check = health_check
+        self._checkout_timeout = checkout_timeout
+        self._clock = clock
+        self._idle = deque()
+        self._checked_out = {}
+        self._size = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def connect(self):
+        """
+        Do nothing, pooled backends are connected when they are created.
+        """
+
+    def save_data(self, data: str):
+        with self.connection() as backend:
+            backend.save_data(data)
+
+    def save_many(self, data: list):
+        with self.connection() as backend:
+            backend.save_many(data)
+
+    @property
+    def size(self) -> int:
+        """
+        The number of backends currently owned by the pool.
+        """
+        with self._available:
+            return self._size
+
+    @contextmanager
+    def connection(self):
+        """
+        Check out a backend for the duration of a with block.
+
+        Yields:
+            Database: A connected backend.
+        """
+        backend = self.checkout()
+        try:
+            yield backend
+        finally:
+            self.checkin(backend)
+
+    def _expired(self, connection: _PooledConnection, now: float, idle: bool) -> bool:
+        if self.max_lifetime is not None and now - connection.created_at >= self.max_lifetime:
+            return True
+        return idle and self.idle_timeout is not None and now - connection.last_used >= self.idle_timeout
+
+    def _discard(self, connection: _PooledConnection):
+        self._size -= 1
+        self.evicted += 1
+        self._available.notify()
+
+    def evict_idle(self):
+        """
+        Discard idle backends that exceeded idle_timeout or max_lifetime.
+        """
+        with self._available:
+            now = self._clock()
+            for connection in list(self._idle):
+                if self._expired(connection, now, idle=True):
+                    self._idle.remove(connection)
+                    self._discard(connection)
+
+    def checkout(self) -> Database:
+        """
+        Take a connected backend out of the pool, creating one if the pool is not full.
+
+        Idle backends are health checked outside the pool's lock, so a slow check only delays its own caller. A
+        backend whose check returns False or raises is discarded and the next one is tried.
+
+        Returns:
+            Database: A connected backend that must be returned with checkin.
+        """
+        deadline = None if self._checkout_timeout is None else self._clock() + self._checkout_timeout
+        while True:
+            connection = self._take_idle_or_reserve(deadline)
+            if connection is None:
+                break
+            if self._health_check is None or self._healthy(connection.backend):
+                with self._available:
+                    self.reused += 1
+                    self._checked_out[id(connection.backend)] = connection
+                return connection.backend
+            with self._available:
+                self._discard(connection)
+
+        try:
+            backend = self._factory()
+            backend.connect()
+        except BaseException:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self.created += 1
+            self._checked_out[id(backend)] = _PooledConnection(backend, self._clock())
+        return backend
+
+    def _take_idle_or_reserve(self, deadline):
+        # Returns an unexpired idle connection, or None after reserving room for a new backend.
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The pool is closed.")
+                now = self._clock()
+                while self._idle:
+                    connection = self._idle.pop()
+                    if self._expired(connection, now, idle=True):
+                        self._discard(connection)
+                        continue
+                    return connection
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None
+                remaining = None if deadline is None else deadline - now
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No database connection became available.")
+                self._available.wait(remaining)
+
+    def _healthy(self, backend: Database) -> bool:
+        try:
+            return bool(self._health_check(backend))
+        except Exception:
+            return False
+
+    def checkin(self, backend: Database):
+        """
+        Return a backend obtained from checkout to the pool.
+
+        Args:
+            backend (Database): The backend to return.
+        """
+        with self._available:
+            connection = self._checked_out.pop(id(backend), None)
+            if connection is None:
+                raise ValueError("The backend was not checked out from this pool.")
+            connection.last_used = self._clock()
+            if self._closed or self._expired(connection, connection.last_used, idle=False):
+                self._discard(connection)
+                return
+            self._idle.append(connection)
+            self._available.notify()
+
+    def close(self):
+        """
+        Discard every idle backend and refuse further checkouts.
+        """
+        with self._available:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._available.notify_all()
+
+
+# Example Usage
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .dependency_inversion_principle import DataProcessor
+
+    class SlowConnectDatabase(Database):
+        """
+        An in-process fake backend whose connection setup takes 20 milliseconds.
+        """
+
+        def connect(self):
+            time.sleep(0.02)
+
+        def save_data(self, data: str):
+            pass
+
+    def run(database: Database, records: int = 20) -> float:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(DataProcessor(database).process_data, (f"Record {index}" for index in range(records))))
+        return time.perf_counter() - started
+
+    pool = PooledDatabase(SlowConnectDatabase, max_size=4)
+    direct = run(SlowConnectDatabase())
+    pooled = run(pool)
+    print(f"Direct: {direct:.3f}s, pooled: {pooled:.3f}s, connections created: {pool.created}, "
+          f"reused: {pool.reused}")
+
+"""
+Connection setup is now paid once per pooled backend instead of once per record. PooledDatabase is just another
+Database implementation, so DataProcessor benefits from pooling without depending on it.
+"""
@@ -44,8 +44,9 @@ class DataProcessor:
 
 
 # Example Usage
-processor = DataProcessor()
-processor.process_data("Sample Data")
+if __name__ == "__main__":
+    processor = DataProcessor()
+    processor.process_data("Sample Data")
 
 """
 The above code violates Dependency Inversion Principle as the DataProcessor class directly depends on the MySQLDatabase
@@ -72,27 +73,59 @@ class Database(ABC):
     def save_data(self, data: str):
         pass
 
+    def save_many(self, data: list):
+        """
+        Save several records in one call.
+
+        Backends that support batched writes override this method. The default simply saves the records one by one,
+        so every Database works with batching callers.
+
+        Args:
+            data (list[str]): The records to save.
+        """
+        for item in data:
+            self.save_data(item)
+
 
 class MySQLDatabase(Database):
     """
     A class representing a MySQL database.
+
+    Attributes:
+        output (Callable[[str], None]): Receives the log messages, print by default. Inject a sink from output_sinks
+            to buffer the messages, write them from a background thread or discard them.
     """
+    def __init__(self, output=print):
+        self.output = output
+
     def connect(self):
-        print("Connecting to MySQL database...")
+        self.output("Connecting to MySQL database...")
 
     def save_data(self, data: str):
-        print(f"Saving {data} to MySQL database.")
+        self.output(f"Saving {data} to MySQL database.")
+
+    def save_many(self, data: list):
+        self.output(f"Saving {len(data)} records to MySQL database.")
 
 
 class PostgreSQLDatabase(Database):
     """
     A class representing a PostgreSQL database.
+
+    Attributes:
+        output (Callable[[str], None]): Receives the log messages, print by default.
     """
+    def __init__(self, output=print):
+        self.output = output
+
     def connect(self):
-        print("Connecting to PostgreSQL database...")
+        self.output("Connecting to PostgreSQL database...")
 
     def save_data(self, data: str):
-        print(f"Saving {data} to PostgreSQL database.")
+        self.output(f"Saving {data} to PostgreSQL database.")
+
+    def save_many(self, data: list):
+        self.output(f"Saving {len(data)} records to PostgreSQL database.")
 
 
 class DataProcessor:
@@ -101,9 +134,13 @@ class DataProcessor:
 
     This class follows the Dependency Inversion Principle by depending
     on an abstraction (Database) rather than a specific implementation.
+
+    Attributes:
+        output (Callable[[str], None]): Receives the log messages, print by default.
     """
-    def __init__(self, database: Database):
+    def __init__(self, database: Database, output=print):
         self.database = database
+        self.output = output
 
     def process_data(self, data: str):
         """
@@ -112,20 +149,21 @@ class DataProcessor:
         Args:
             data (str): The data to be processed and saved.
         """
-        print("Processing data...")
+        self.output("Processing data...")
         self.database.connect()
         self.database.save_data(data)
 
 
 # Example Usage
-mysql_db = MySQLDatabase()
-postgres_db = PostgreSQLDatabase()
+if __name__ == "__main__":
+    mysql_db = MySQLDatabase()
+    postgres_db = PostgreSQLDatabase()
 
-processor1 = DataProcessor(mysql_db)
-processor1.process_data("Sample Data 1")
+    processor1 = DataProcessor(mysql_db)
+    processor1.process_data("Sample Data 1")
 
-processor2 = DataProcessor(postgres_db)
-processor2.process_data("Sample Data 2")
+    processor2 = DataProcessor(postgres_db)
+    processor2.process_data("Sample Data 2")
 
 """
 DataProcessor now depends on the abstraction Database rather than concrete implementations. The database implementation
@@ -0,0 +1,304 @@
+"""
+Output Sinks
+
+MySQLDatabase, PostgreSQLDatabase, DataProcessor and EmployeeDB log every operation with print, which writes to
+stdout and takes its lock on every call. They now depend on an injected output callable instead (print by default),
+so the hot write path decides nothing about how its messages reach the console.
+
+The sinks below are such callables:
+
+- BufferedSink collects messages and writes them in one call once enough have accumulated, or once the oldest one
+  has waited long enough.
+- BackgroundSink hands messages to a writer thread through a bounded queue; when the queue is full it either blocks
+  the caller or drops the message, and counts what it dropped.
+
+Both write out what they still hold when the interpreter exits, even if close was never called.
+- NullSink discards everything, e.g. for benchmarks.
+"""
+
+import atexit
+import sys
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import deque
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+
+class OutputSink(ABC):
+    """
+    An abstract destination for log messages. A sink is called with one message, like print.
+    """
+
+    @abstractmethod
+    def write(self, message: str):
+        """
+        Accept one message. A newline is appended when the message is written out.
+
+        Args:
+            message (str): The message.
+        """
+        pass
+
+    def __call__(self, message: str):
+        self.write(message)
+
+    def flush(self):
+        """
+        Write out every accepted message.
+        """
+        pass
+
+    def close(self):
+        """
+        Flush the sink and release its resources.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NullSink(OutputSink):
+    """
+    A sink that discards every message.
+    """
+
+    def write(self, message: str):
+        pass
+
+    __call__ = write
+
+
+def _write_batch(stream, batch: list):
+    stream = stream or sys.stdout
+    batch.append("")
+    stream.write("\n".join(batch))
+    stream.flush()
+
+
+def _flush_buffer(buffer: list, lock, stream):
+    # Takes the buffer rather than the sink, so a finalizer can call it without keeping the sink alive.
+    with lock:
+        if buffer:
+            batch = buffer[:]
+            buffer.clear()
+            _write_batch(stream, batch)
+
+
+def _flush_later(reference):
+    sink = reference()
+    if sink is not None:
+        sink._flush_timed()
+
+
+class BufferedSink(OutputSink):
+    """
+    A sink that writes messages in batches.
+
+    Buffered messages are also written when the sink is garbage collected and when the interpreter exits.
+
+    Attributes:
+        stream (TextIO, optional): Where messages are written. Defaults to the sys.stdout of the time of the flush.
+        max_messages (int): The number of buffered messages that triggers a flush.
+        max_delay (float): Seconds after which a buffered message is written even if max_messages was not reached,
+            None to wait for max_messages.
+    """
+
+    def __init__(self, stream=None, max_messages: int = 1024, max_delay: float = 1.0):
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1.")
+        if max_delay is not None and max_delay <= 0:
+            raise ValueError("max_delay must be positive.")
+        self.stream = stream
+        self.max_messages = max_messages
+        self.max_delay = max_delay
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._timer = None
+        self._finalizer = weakref.finalize(self, _flush_buffer, self._buffer, self._lock, stream)
+
+    def write(self, message: str):
+        with self._lock:
+            buffer = self._buffer
+            buffer.append(message)
+            if len(buffer) >= self.max_messages:
+                batch = buffer[:]
+                buffer.clear()
+                _write_batch(self.stream, batch)
+            elif self._timer is None and self.max_delay is not None:
+                # One timer at a time: it flushes whatever is buffered when it fires.
+                self._timer = threading.Timer(self.max_delay, _flush_later, (weakref.ref(self),))
+                self._timer.daemon = True
+                self._timer.start()
+
+    __call__ = write
+
+    def flush(self):
+        _flush_buffer(self._buffer, self._lock, self.stream)
+
+    def _flush_timed(self):
+        with self._lock:
+            # Cleared under the lock, so a write arriving once the lock is released arms a new timer.
+            self._timer = None
+            if self._buffer:
+                batch = self._buffer[:]
+                self._buffer.clear()
+                _write_batch(self.stream, batch)
+
+    def close(self):
+        """
+        Write the buffered messages and stop the flush timer.
+        """
+        self.flush()
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self._finalizer.detach()
+
+
+class BackgroundSink(OutputSink):
+    """
+    A sink that writes messages from a background thread, so callers never wait for the stream.
+
+    If the stream raises, the batch being written is lost and counted, and the writer thread keeps draining the queue.
+    The sink is closed, writing out the queued messages, when the interpreter exits.
+
+    Attributes:
+        stream (TextIO, optional): Where messages are written. Defaults to the sys.stdout of the time of the write.
+        max_queue (int): The number of messages that may wait for the writer thread.
+        policy (str): What happens when the queue is full: "block" waits for room, "drop" discards the message.
+        dropped (int): The number of discarded messages.
+        failed (int): The number of messages lost because writing them to the stream raised.
+        last_error (Exception): The last exception raised by the stream, None if it never raised.
+    """
+
+    def __init__(self, stream=None, max_queue: int = 10_000, policy: str = "block", batch_size: int = 1024):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {policy!r}, expected one of {OVERFLOW_POLICIES}")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1.")
+        self.stream = stream
+        self.max_queue = max_queue
+        self.policy = policy
+        self.dropped = 0
+        self.failed = 0
+        self.last_error = None
+        self._batch_size = batch_size
+        self._queue = deque()
+        self._writing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="background-sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, message: str):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The sink is closed.")
+            while len(self._queue) >= self.max_queue:
+                if self.policy == "drop":
+                    self.dropped += 1
+                    return
+                if not self._thread.is_alive():
+                    raise RuntimeError("The writer thread of the sink stopped.")
+                # Timed, so a writer thread that died without notifying cannot block callers forever.
+                self._condition.wait(0.1)
+            self._queue.append(message)
+            if len(self._queue) == 1:
+                self._condition.notify_all()
+
+    __call__ = write
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                count = min(len(self._queue), self._batch_size)
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._writing = count
+                # Wake callers blocked on a full queue.
+                self._condition.notify_all()
+            try:
+                _write_batch(self.stream, batch)
+            except Exception as error:
+                with self._condition:
+                    self.failed += count
+                    self.last_error = error
+            finally:
+                with self._condition:
+                    self._writing = 0
+                    self._condition.notify_all()
+
+    def flush(self):
+        """
+        Block until every accepted message has been written.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: not self._queue and not self._writing or not self._thread.is_alive())
+
+    def close(self):
+        """
+        Write the remaining messages and stop the writer thread.
+        """
+        atexit.unregister(self.close)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+
+# Example Usage
+if __name__ == "__main__":
+    import io
+    import os
+    import tempfile
+    import time
+
+    from .dependency_inversion_principle import MySQLDatabase, DataProcessor
+
+    with BufferedSink(max_messages=4) as sink:
+        processor = DataProcessor(MySQLDatabase(output=sink), output=sink)
+        processor.process_data("Sample Data 1")
+        processor.process_data("Sample Data 2")
+
+    # A line-buffered file behaves like a terminal: print costs one system call per message.
+    records = [f"record {index}" for index in range(100_000)]
+    with tempfile.TemporaryDirectory() as directory:
+        for name, make_sink in (("print", lambda: print), ("buffered", BufferedSink),
+                                ("background", BackgroundSink), ("null", NullSink)):
+            path = os.path.join(directory, f"{name}.log")
+            with open(path, "w", buffering=1) as stream:
+                sys.stdout, original = stream, sys.stdout
+                try:
+                    sink = make_sink()
+                    database = MySQLDatabase(output=sink)
+                    started = time.perf_counter()
+                    for record in records:
+                        database.save_data(record)
+                    elapsed = time.perf_counter() - started
+                    if isinstance(sink, OutputSink):
+                        sink.close()
+                finally:
+                    sys.stdout = original
+            print(f"{name}: {elapsed:.3f}s for {len(records)} writes, {os.path.getsize(path)} bytes written")
+
+    with BackgroundSink(stream=io.StringIO(), max_queue=10, policy="drop") as sink:
+        for record in records[:1000]:
+            sink(record)
+    print(f"Dropping background sink discarded {sink.dropped} of 1000 messages")
+
+"""
+The databases and processors depend on an abstraction of their output rather than on the console. Whether messages
+are printed immediately, batched, written by another thread or discarded is decided by whoever constructs them.
+"""
@@ -0,0 +1,280 @@
+"""
+Replicated Database
+
+Dual-writing during a migration with one DataProcessor per backend makes every record wait for each backend in turn.
+ReplicatedDatabase is a composite Database that sends each write to all of its backends at once, so a record costs
+about as long as the slowest backend (or less, with a weaker consistency level) instead of the sum of all of them.
+
+Each backend has its own single worker thread, which keeps writes to one backend in order and keeps a slow backend
+from holding up the others. A backend that falls behind cannot pile up work without bound: at most max_pending
+operations wait for or run on its worker, further operations fail for that backend straight away, and operations it
+has not started yet are cancelled once the consistency level is met or their timeout passes.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+
+from .dependency_inversion_principle import Database
+
+CONSISTENCY_LEVELS = ("all", "quorum", "first")
+
+
+class ReplicationError(Exception):
+    """
+    Raised when too few backends acknowledged a write to meet the consistency level.
+
+    Attributes:
+        failures (list[tuple[Database, BaseException]]): The backends that failed or timed out, with their errors.
+    """
+
+    def __init__(self, message: str, failures: list):
+        super().__init__(message)
+        self.failures = failures
+
+
+class BackendStats:
+    """
+    Latency statistics for one backend of a ReplicatedDatabase.
+
+    Attributes:
+        calls (int): The number of completed operations, successful or not.
+        failures (int): The number of operations that raised an error.
+        timeouts (int): The number of operations the caller stopped waiting for.
+        rejected (int): The number of operations not sent because max_pending operations were already pending.
+        cancelled (int): The number of operations cancelled before they started.
+        pending (int): The number of operations currently queued for or running on the backend.
+        total_latency (float): The summed duration of completed operations, in seconds.
+        max_latency (float): The longest completed operation, in seconds.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.cancelled = 0
+        self.pending = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        The mean duration of completed operations in seconds, 0.0 before the first one.
+        """
+        return self.total_latency / self.calls if self.calls else 0.0
+
+
+class ReplicatedDatabase(Database):
+    """
+    A Database that replicates every write to several backends in parallel.
+
+    Attributes:
+        backends (tuple[Database, ...]): The replicated backends.
+        consistency (str): "all" waits for every backend, "quorum" for a majority and "first" for the first success.
+        max_pending (int): The number of operations that may be queued for or running on one backend.
+        stats (tuple[BackendStats, ...]): Latency statistics, one entry per backend.
+    """
+
+    def __init__(self, backends, consistency: str = "all", timeout=None, max_pending: int = 64):
+        """
+        Initialize the composite database.
+
+        Args:
+            backends (Iterable[Database]): The backends to replicate to.
+            consistency (str): "all", "quorum" or "first".
+            timeout (float | Sequence[float], optional): Seconds to wait for each backend, either one value for all of
+                them or one per backend. None waits indefinitely.
+            max_pending (int): The number of operations that may be queued for or running on one backend. Once a
+                backend has that many, further operations fail for it without being queued.
+        """
+        self.backends = tuple(backends)
+        if not self.backends:
+            raise ValueError("At least one backend is required.")
+        if consistency not in CONSISTENCY_LEVELS:
+            raise ValueError(f"Unknown consistency {consistency!r}, expected one of {CONSISTENCY_LEVELS}")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        if timeout is None or isinstance(timeout, (int, float)):
+            timeout = (timeout,) * len(self.backends)
+        if len(timeout) != len(self.backends):
+            raise ValueError("Expected one timeout per backend.")
+        self.consistency = consistency
+        self.max_pending = max_pending
+        self.stats = tuple(BackendStats() for _ in self.backends)
+        self._timeouts = tuple(timeout)
+        self._lock = threading.Lock()
+        self._executors = tuple(ThreadPoolExecutor(max_workers=1) for _ in self.backends)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def required_acknowledgements(self) -> int:
+        """
+        The number of backends that must succeed for an operation to succeed.
+        """
+        if self.consistency == "all":
+            return len(self.backends)
+        if self.consistency == "quorum":
+            return len(self.backends) // 2 + 1
+        return 1
+
+    @property
+    def degraded_backends(self) -> tuple:
+        """
+        The backends that currently have max_pending operations pending and reject new ones.
+        """
+        with self._lock:
+            return tuple(backend for backend, stats in zip(self.backends, self.stats)
+                         if stats.pending >= self.max_pending)
+
+    def connect(self):
+        self._replicate("connect")
+
+    def save_data(self, data: str):
+        self._replicate("save_data", data)
+
+    def save_many(self, data: list):
+        self._replicate("save_many", data)
+
+    def close(self):
+        """
+        Wait for outstanding writes and stop the worker threads.
+        """
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+
+    def _call(self, index: int, operation: str, *args):
+        started = time.perf_counter()
+        try:
+            return getattr(self.backends[index], operation)(*args)
+        except BaseException:
+            with self._lock:
+                self.stats[index].failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                stats = self.stats[index]
+                stats.calls += 1
+                stats.total_latency += elapsed
+                stats.max_latency = max(stats.max_latency, elapsed)
+
+    def _submit(self, index: int, operation: str, *args):
+        with self._lock:
+            stats = self.stats[index]
+            if stats.pending >= self.max_pending:
+                stats.rejected += 1
+                return None
+            stats.pending += 1
+        try:
+            future = self._executors[index].submit(self._call, index, operation, *args)
+        except BaseException:
+            with self._lock:
+                stats.pending -= 1
+            raise
+        future.add_done_callback(partial(self._settle, index))
+        return future
+
+    def _settle(self, index: int, future):
+        with self._lock:
+            stats = self.stats[index]
+            stats.pending -= 1
+            if future.cancelled():
+                stats.cancelled += 1
+
+    def _replicate(self, operation: str, *args):
+        started = time.monotonic()
+        futures = {}
+        failures = []
+        for index in range(len(self.backends)):
+            future = self._submit(index, operation, *args)
+            if future is None:
+                error = RuntimeError(f"{operation} rejected, {self.max_pending} operations already pending")
+                failures.append((self.backends[index], error))
+            else:
+                futures[future] = index
+        deadlines = {
+            future: None if self._timeouts[index] is None else started + self._timeouts[index]
+            for future, index in futures.items()
+        }
+        required = self.required_acknowledgements
+        successes = 0
+        outstanding = set(futures)
+
+        try:
+            while successes < required <= successes + len(outstanding):
+                pending_deadlines = [deadlines[future] for future in outstanding if deadlines[future] is not None]
+                wait_for = max(0.0, min(pending_deadlines) - time.monotonic()) if pending_deadlines else None
+                done, outstanding = wait(outstanding, timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        successes += 1
+                    else:
+                        failures.append((self.backends[futures[future]], future.exception()))
+                if successes >= required:
+                    break
+
+                now = time.monotonic()
+                for future in [future for future in outstanding if deadlines[future] is not None
+                               and deadlines[future] <= now]:
+                    outstanding.discard(future)
+                    future.cancel()
+                    with self._lock:
+                        self.stats[futures[future]].timeouts += 1
+                    failures.append((self.backends[futures[future]], TimeoutError(f"{operation} timed out")))
+        finally:
+            # Whatever the outcome, operations nobody waits for any more are dropped unless already running.
+            for future in outstanding:
+                future.cancel()
+
+        if successes >= required:
+            return
+        raise ReplicationError(
+            f"{operation} succeeded on {successes} of {len(self.backends)} backends, {required} required.",
+            failures,
+        )
+
+
+# Example Usage
+if __name__ == "__main__":
+    from .dependency_inversion_principle import DataProcessor
+
+    class SlowDatabase(Database):
+        """
+        A fake backend whose writes take a fixed delay.
+        """
+
+        def __init__(self, name: str, delay: float):
+            self.name = name
+            self.delay = delay
+
+        def connect(self):
+            pass
+
+        def save_data(self, data: str):
+            time.sleep(self.delay)
+
+    with ReplicatedDatabase([SlowDatabase("MySQL", 0.05), SlowDatabase("PostgreSQL", 0.08)]) as replicated:
+        started = time.perf_counter()
+        DataProcessor(replicated).process_data("Sample Data")
+        print(f"Replicated write took {time.perf_counter() - started:.3f}s, sequential would take 0.130s")
+        for backend, stats in zip(replicated.backends, replicated.stats):
+            print(f"{backend.name}: {stats.calls} calls, mean latency {stats.mean_latency:.3f}s")
+
+    with ReplicatedDatabase([SlowDatabase("MySQL", 0.01), SlowDatabase("PostgreSQL", 0.5)],
+                            consistency="first") as replicated:
+        started = time.perf_counter()
+        replicated.save_data("Sample Data")
+        print(f"First-success write took {time.perf_counter() - started:.3f}s")
+
+"""
+ReplicatedDatabase is just another Database implementation, so DataProcessor dual-writes without knowing about it,
+and the latency of a write follows the backends the consistency level waits for rather than their sum.
+"""
@@ -0,0 +1,189 @@
+"""
+Device Registry
+
+Finding the devices that can scan or fax by calling isinstance on every printer costs time proportional to the fleet.
+DeviceRegistry checks a device's interfaces once, when it is registered (and only once per device class), and keeps
+an index from each interface to the devices implementing it. Listing the Faxable devices is then a dictionary lookup,
+and picking the least loaded capable device is a heap operation, whatever the size of the fleet.
+"""
+
+import heapq
+import itertools
+import threading
+from types import MappingProxyType
+
+from .interface_segregation_principle import Printable, Scannable, Faxable
+
+
+class DeviceRegistry:
+    """
+    A thread-safe index of devices by the interfaces they implement, with per-device load tracking.
+
+    Attributes:
+        interfaces (tuple[type, ...]): The interfaces devices are indexed by.
+    """
+
+    def __init__(self, interfaces=(Printable, Scannable, Faxable)):
+        self.interfaces = tuple(interfaces)
+        self._class_interfaces = {}
+        self._devices = {interface: {} for interface in self.interfaces}
+        self._loads = {}
+        self._heaps = {interface: [] for interface in self.interfaces}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._loads)
+
+    def __contains__(self, device) -> bool:
+        return id(device) in self._loads
+
+    def interfaces_of(self, device) -> tuple:
+        """
+        Return the indexed interfaces a device implements, computed once per device class.
+
+        Args:
+            device (object): The device to inspect.
+
+        Returns:
+            tuple[type, ...]: The implemented interfaces.
+        """
+        device_class = type(device)
+        implemented = self._class_interfaces.get(device_class)
+        if implemented is None:
+            implemented = self._class_interfaces[device_class] = tuple(
+                interface for interface in self.interfaces if issubclass(device_class, interface))
+        return implemented
+
+    def register(self, device):
+        """
+        Add a device to the index.
+
+        Args:
+            device (object): The device to add.
+
+        Raises:
+            ValueError: If the device is already registered or implements none of the indexed interfaces.
+        """
+        implemented = self.interfaces_of(device)
+        if not implemented:
+            raise ValueError(f"{type(device).__name__} implements none of the indexed interfaces.")
+        with self._lock:
+            if id(device) in self._loads:
+                raise ValueError("The device is already registered.")
+            self._loads[id(device)] = 0
+            for interface in implemented:
+                self._devices[interface][id(device)] = device
+                self._push(interface, device)
+
+    def unregister(self, device):
+        """
+        Remove a device from the index.
+
+        Args:
+            device (object): The device to remove.
+
+        Raises:
+            KeyError: If the device is not registered.
+        """
+        with self._lock:
+            del self._loads[id(device)]
+            for interface in self.interfaces_of(device):
+                del self._devices[interface][id(device)]
+
+    def devices(self, interface: type):
+        """
+        Return a live, read-only view of the devices implementing an interface.
+
+        Args:
+            interface (type): One of the indexed interfaces.
+
+        Returns:
+            ValuesView: The devices implementing the interface.
+        """
+        return MappingProxyType(self._devices[interface]).values()
+
+    def load(self, device) -> int:
+        """
+        Return the number of jobs currently assigned to a device.
+        """
+        return self._loads[id(device)]
+
+    def _push(self, interface: type, device):
+        heap = self._heaps[interface]
+        heapq.heappush(heap, (self._loads[id(device)], next(self._sequence), id(device)))
+        # Superseded entries are only dropped when they reach the top, so rebuild the heap before it grows unbounded.
+        if len(heap) > 2 * len(self._devices[interface]) + 64:
+            heap[:] = [(self._loads[key], next(self._sequence), key) for key in self._devices[interface]]
+            heapq.heapify(heap)
+
+    def acquire(self, interface: type):
+        """
+        Pick the least loaded device implementing an interface and count one more job against it.
+
+        Args:
+            interface (type): One of the indexed interfaces.
+
+        Returns:
+            object: The chosen device. Call release once its job is done.
+
+        Raises:
+            LookupError: If no registered device implements the interface.
+        """
+        with self._lock:
+            heap = self._heaps[interface]
+            devices = self._devices[interface]
+            while heap:
+                load, _, key = heap[0]
+                if key in devices and self._loads[key] == load:
+                    break
+                heapq.heappop(heap)
+            else:
+                raise LookupError(f"No registered device implements {interface.__name__}.")
+            device = devices[key]
+            self._loads[key] += 1
+            heapq.heapreplace(heap, (load + 1, next(self._sequence), key))
+            for other in self.interfaces_of(device):
+                if other is not interface:
+                    self._push(other, device)
+            return device
+
+    def release(self, device):
+        """
+        Count one job fewer against a device. Devices unregistered in the meantime are ignored.
+
+        Args:
+            device (object): A device returned by acquire.
+        """
+        with self._lock:
+            if id(device) not in self._loads:
+                return
+            self._loads[id(device)] -= 1
+            for interface in self.interfaces_of(device):
+                self._push(interface, device)
+
+
+# Example Usage
+if __name__ == "__main__":
+    from .interface_segregation_principle import AllInOnePrinter, BasicPrinter
+
+    registry = DeviceRegistry()
+    fleet = [AllInOnePrinter() for _ in range(3)] + [BasicPrinter() for _ in range(1000)]
+    for device in fleet:
+        registry.register(device)
+
+    print(f"Faxable devices: {len(registry.devices(Faxable))} of {len(registry)}")
+
+    first = registry.acquire(Faxable)
+    second = registry.acquire(Faxable)
+    assert first is not second
+    registry.release(first)
+    registry.unregister(second)
+    chosen = registry.acquire(Faxable)
+    print(f"Faxable devices after removing one: {len(registry.devices(Faxable))}, "
+          f"next fax goes to an idle device: {registry.load(chosen) == 1}")
+
+"""
+Interface checks happen once per device class instead of once per routing decision, and every lookup goes through
+the interface index, so the registry routes jobs to exactly the devices whose interfaces support them.
+"""
@@ -64,12 +64,13 @@ class BasicPrinter(Printer):
         raise NotImplementedError("Basic printers cannot fax.")
 
 # Example Usage
-printers = [AllInOnePrinter(), BasicPrinter()]
+if __name__ == "__main__":
+    printers = [AllInOnePrinter(), BasicPrinter()]
 
-for printer in printers:
-    print(printer.print_document("Hello World"))
-    print(printer.scan_document())  # Fails for BasicPrinter
-    print(printer.fax_document())  # Fails for BasicPrinter
+    for printer in printers:
+        print(printer.print_document("Hello World"))
+        print(printer.scan_document())  # Fails for BasicPrinter
+        print(printer.fax_document())  # Fails for BasicPrinter
 
 """
 The above code violates the Interface Segregation Principle because the BasicPrinter class is forced to implement
@@ -139,14 +140,15 @@ class BasicPrinter(Printable):
         return f"Printing: {content}"
 
 # Example Usage
-printers = [AllInOnePrinter(), BasicPrinter()]
-
-for printer in printers:
-    print(printer.print_document("Hello World"))
-    if isinstance(printer, Scannable):
-        print(printer.scan_document())
-    if isinstance(printer, Faxable):
-        print(printer.fax_document())
+if __name__ == "__main__":
+    printers = [AllInOnePrinter(), BasicPrinter()]
+
+    for printer in printers:
+        print(printer.print_document("Hello World"))
+        if isinstance(printer, Scannable):
+            print(printer.scan_document())
+        if isinstance(printer, Faxable):
+            print(printer.fax_document())
 
 """
 In this corrected version, we adhere to the Interface Segregation Principle by separating the Printable,
@@ -0,0 +1,267 @@
+"""
+Print Job Spooler
+
+Looping over a list of printers runs every operation one after another. PrintSpooler accepts print, scan and fax jobs,
+routes each job to a device that implements the matching interface (Printable, Scannable or Faxable) and keeps one
+priority queue and one worker thread per device, so jobs on different devices run at the same time.
+
+The spooler only relies on the segregated interfaces: a BasicPrinter is never offered a scan job, because it does
+not implement Scannable. Routing goes through a DeviceRegistry, so choosing a device does not scan the whole fleet.
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from queue import PriorityQueue
+
+from .device_registry import DeviceRegistry
+from .interface_segregation_principle import Printable, Scannable, Faxable
+
+JOB_KINDS = {
+    "print": (Printable, "print_document"),
+    "scan": (Scannable, "scan_document"),
+    "fax": (Faxable, "fax_document"),
+}
+
+
+class PrintJob:
+    """
+    A job waiting in a device queue.
+
+    Attributes:
+        kind (str): "print", "scan" or "fax".
+        args (tuple): The arguments passed to the device operation, e.g. the content to print.
+        priority (int): Lower values run first.
+        submitted_at (float): When the job was submitted, from time.perf_counter.
+        future (Future): Resolves to the operation's result.
+    """
+
+    __slots__ = ("kind", "args", "priority", "submitted_at", "future")
+
+    def __init__(self, kind: str, args: tuple, priority: int):
+        self.kind = kind
+        self.args = args
+        self.priority = priority
+        self.submitted_at = time.perf_counter()
+        self.future = Future()
+
+
+class DeviceStats:
+    """
+    Throughput and latency statistics for one device.
+
+    Attributes:
+        completed (int): Jobs that finished, successfully or not.
+        failed (int): Jobs whose operation raised an error.
+        busy_time (float): Seconds spent running operations.
+        total_latency (float): Summed seconds from submission to completion.
+        max_latency (float): The longest time from submission to completion, in seconds.
+        started_at (float): When the device joined the spooler, from time.perf_counter.
+    """
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.started_at = time.perf_counter()
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        The mean time from submission to completion in seconds, 0.0 before the first job.
+        """
+        return self.total_latency / self.completed if self.completed else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Completed jobs per second since the device joined the spooler.
+        """
+        elapsed = time.perf_counter() - self.started_at
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+
+class _DeviceWorker:
+    _STOP = float("inf")
+
+    def __init__(self, device, name: str, registry: DeviceRegistry):
+        self.device = device
+        self.stats = DeviceStats()
+        self._registry = registry
+        self._queue = PriorityQueue()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, job: PrintJob, sequence: int):
+        self._queue.put((job.priority, sequence, job))
+
+    def stop(self, sequence: int):
+        self._queue.put((self._STOP, sequence, None))
+
+    def join(self):
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            _, _, job = self._queue.get()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                self._finish(job, 0.0, failed=False)
+                continue
+            started = time.perf_counter()
+            try:
+                result = getattr(self.device, JOB_KINDS[job.kind][1])(*job.args)
+            except BaseException as error:
+                self._finish(job, time.perf_counter() - started, failed=True)
+                job.future.set_exception(error)
+            else:
+                self._finish(job, time.perf_counter() - started, failed=False)
+                job.future.set_result(result)
+
+    def _finish(self, job: PrintJob, busy: float, failed: bool):
+        latency = time.perf_counter() - job.submitted_at
+        self._registry.release(self.device)
+        with self._lock:
+            stats = self.stats
+            stats.completed += 1
+            stats.failed += failed
+            stats.busy_time += busy
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+
+
+class PrintSpooler:
+    """
+    Routes print, scan and fax jobs to capable devices, with one queue and one worker thread per device.
+
+    Jobs on the same device run one at a time in priority order (lower first, then submission order), jobs on
+    different devices run concurrently.
+    """
+
+    def __init__(self, devices=()):
+        self._registry = DeviceRegistry(tuple(interface for interface, _ in JOB_KINDS.values()))
+        self._workers = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+        for device in devices:
+            self.add_device(device)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def add_device(self, device):
+        """
+        Start spooling jobs to a device.
+
+        Args:
+            device (Printable | Scannable | Faxable): The device to add.
+        """
+        with self._lock:
+            if id(device) in self._workers:
+                raise ValueError("The device is already spooled.")
+            self._registry.register(device)
+            self._workers[id(device)] = _DeviceWorker(device, f"spooler-{type(device).__name__}-{id(device):x}",
+                                                      self._registry)
+
+    def remove_device(self, device):
+        """
+        Stop accepting jobs for a device. Jobs already queued on it still run.
+
+        Args:
+            device (Printable | Scannable | Faxable): The device to remove.
+        """
+        with self._lock:
+            worker = self._workers.pop(id(device))
+            self._registry.unregister(device)
+        worker.stop(next(self._sequence))
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict[object, DeviceStats]: The statistics of every spooled device.
+        """
+        with self._lock:
+            return {worker.device: worker.stats for worker in self._workers.values()}
+
+    def submit(self, kind: str, *args, priority: int = 0) -> Future:
+        """
+        Queue a job on the least busy device that supports it.
+
+        Args:
+            kind (str): "print", "scan" or "fax".
+            *args: The arguments of the device operation, e.g. the content to print.
+            priority (int): Lower values run first.
+
+        Returns:
+            Future: Resolves to the operation's result.
+
+        Raises:
+            LookupError: If no spooled device implements the job's interface.
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind {kind!r}, expected one of {tuple(JOB_KINDS)}")
+        job = PrintJob(kind, args, priority)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The spooler is shut down.")
+            device = self._registry.acquire(JOB_KINDS[kind][0])
+            self._workers[id(device)].put(job, next(self._sequence))
+        return job.future
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop accepting jobs and stop the worker threads once their queues are drained.
+
+        Args:
+            wait (bool): Block until every queued job has run.
+        """
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers.values())
+            self._workers.clear()
+            for worker in workers:
+                self._registry.unregister(worker.device)
+        for worker in workers:
+            worker.stop(next(self._sequence))
+        if wait:
+            for worker in workers:
+                worker.join()
+
+
+# Example Usage
+if __name__ == "__main__":
+    from .interface_segregation_principle import AllInOnePrinter, BasicPrinter
+
+    class SlowBasicPrinter(BasicPrinter):
+        """
+        A basic printer that needs 50 milliseconds per page.
+        """
+
+        def print_document(self, content: str):
+            time.sleep(0.05)
+            return super().print_document(content)
+
+    with PrintSpooler([AllInOnePrinter(), SlowBasicPrinter(), SlowBasicPrinter()]) as spooler:
+        started = time.perf_counter()
+        jobs = [spooler.submit("print", f"Page {index}") for index in range(6)]
+        jobs.append(spooler.submit("scan", priority=-1))
+        jobs.append(spooler.submit("fax"))
+        for job in jobs:
+            print(job.result())
+        print(f"Finished in {time.perf_counter() - started:.2f}s")
+        for device, stats in spooler.stats().items():
+            print(f"{type(device).__name__}: {stats.completed} jobs, mean latency {stats.mean_latency:.3f}s")
+
+"""
+Every device works through its own queue, so a slow printer does not hold up the others, and jobs are only ever sent
+to devices that implement the interface they need.
+"""
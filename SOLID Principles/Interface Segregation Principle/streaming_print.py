@@ -0,0 +1,193 @@
+"""
+Streaming Print
+
+Printable.print_document takes the whole document as one string and builds a second, full-size string from it, so a
+multi-gigabyte document needs twice its size in memory. StreamPrintable is a separate interface for printers that can
+take a document piece by piece: print_stream accepts a file, an iterator of chunks or a buffer (bytes, bytearray,
+memoryview) and handles it in fixed-size chunks, reporting progress as it goes.
+
+Following the Interface Segregation Principle, StreamPrintable does not extend Printable, so existing printers do not
+have to implement it. PrintableStreamAdapter makes any existing Printable usable as a StreamPrintable by calling its
+print_document once per chunk.
+"""
+
+import codecs
+from abc import ABC, abstractmethod
+
+from .interface_segregation_principle import Printable
+
+CHUNK_SIZE = 1 << 16
+
+
+def _source_size(source):
+    if isinstance(source, memoryview):
+        return source.nbytes
+    if isinstance(source, (str, bytes, bytearray)):
+        return len(source)
+    return None
+
+
+def iter_chunks(source, chunk_size: int = CHUNK_SIZE):
+    """
+    Split a document into chunks of at most chunk_size characters or bytes, without copying buffers.
+
+    Buffers (bytes, bytearray, memoryview) are sliced through a memoryview, and binary files are read into one reused
+    buffer, so a yielded memoryview is only valid until the next chunk is requested.
+
+    Args:
+        source (str | bytes | bytearray | memoryview | BinaryIO | TextIO | Iterable[str | bytes]): The document.
+        chunk_size (int): The maximum size of a chunk.
+
+    Yields:
+        str | memoryview | bytes: The chunks, in document order.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        with memoryview(source) as view, view.cast("B") as data:
+            for start in range(0, len(data), chunk_size):
+                yield data[start:start + chunk_size]
+    elif hasattr(source, "readinto"):
+        buffer = bytearray(chunk_size)
+        with memoryview(buffer) as view:
+            while True:
+                count = source.readinto(view)
+                if not count:
+                    break
+                yield view[:count]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        for chunk in source:
+            if len(chunk) <= chunk_size:
+                yield chunk
+            else:
+                yield from iter_chunks(chunk, chunk_size)
+
+
+class StreamPrintable(ABC):
+    """
+    An interface for printers that can print a document in chunks.
+    """
+
+    @abstractmethod
+    def print_stream(self, source, chunk_size: int = CHUNK_SIZE, progress=None) -> int:
+        """
+        Print a document chunk by chunk.
+
+        Args:
+            source (str | bytes | bytearray | memoryview | BinaryIO | TextIO | Iterable[str | bytes]): The document.
+            chunk_size (int): The maximum size of a chunk.
+            progress (Callable[[int, int | None], None], optional): Called after every chunk with the number of
+                characters or bytes printed so far and the document size, or None if the size is unknown.
+
+        Returns:
+            int: The number of characters or bytes printed.
+        """
+        pass
+
+
+class PrintableStreamAdapter(StreamPrintable):
+    """
+    Adapts an existing Printable to StreamPrintable by printing every chunk with print_document.
+
+    Binary chunks are decoded incrementally, so multi-byte characters split across chunks are decoded correctly.
+
+    Attributes:
+        printer (Printable): The adapted printer.
+        encoding (str): The encoding of binary documents.
+        output (Callable[[object], None], optional): Receives the result of every print_document call. The results
+            are discarded when it is None, so printing does not accumulate the document in memory.
+    """
+
+    def __init__(self, printer: Printable, encoding: str = "utf-8", output=None):
+        self.printer = printer
+        self.encoding = encoding
+        self.output = output
+
+    def print_stream(self, source, chunk_size: int = CHUNK_SIZE, progress=None) -> int:
+        total = _source_size(source)
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        done = 0
+        for chunk in iter_chunks(source, chunk_size):
+            done += len(chunk)
+            text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+            if text:
+                self._print(text)
+            if progress is not None:
+                progress(done, total)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            self._print(tail)
+        return done
+
+    def _print(self, text: str):
+        result = self.printer.print_document(text)
+        if self.output is not None:
+            self.output(result)
+
+
+class StreamingPrinter(Printable, StreamPrintable):
+    """
+    A printer that writes documents to a binary output without building them in memory.
+
+    Attributes:
+        target (BinaryIO): Where printed documents are written, e.g. an open file or a device handle.
+        encoding (str): The encoding used for text documents and chunks.
+    """
+
+    PREFIX = "Printing: "
+
+    def __init__(self, target, encoding: str = "utf-8"):
+        self.target = target
+        self.encoding = encoding
+
+    def print_document(self, content: str):
+        self.print_stream(content)
+        return f"{self.PREFIX}{content}"
+
+    def print_stream(self, source, chunk_size: int = CHUNK_SIZE, progress=None) -> int:
+        total = _source_size(source)
+        write = self.target.write
+        write(self.PREFIX.encode(self.encoding))
+        done = 0
+        for chunk in iter_chunks(source, chunk_size):
+            done += len(chunk)
+            write(chunk.encode(self.encoding) if isinstance(chunk, str) else chunk)
+            if progress is not None:
+                progress(done, total)
+        return done
+
+
+# Example Usage
+if __name__ == "__main__":
+    import io
+
+    from .interface_segregation_principle import BasicPrinter
+
+    adapter = PrintableStreamAdapter(BasicPrinter(), output=print)
+    adapter.print_stream("Hello World, one chunk at a time", chunk_size=12)
+
+    document = ("Grüße " * 200_000).encode("utf-8")
+    reports = []
+    printed = PrintableStreamAdapter(BasicPrinter()).print_stream(
+        io.BytesIO(document), chunk_size=1 << 20, progress=lambda done, total: reports.append(done))
+    print(f"Adapter printed {printed} bytes with {len(reports)} progress reports")
+
+    target = io.BytesIO()
+    printer = StreamingPrinter(target)
+    printer.print_stream(memoryview(document), progress=lambda done, total: None)
+    assert target.getvalue() == b"Printing: " + document
+    print(f"StreamingPrinter wrote {len(target.getvalue())} bytes, {printer.print_document('Hello World')}")
+
+"""
+Printers that can stream implement StreamPrintable next to Printable, and every other printer is streamed through the
+adapter. Clients that only print short strings keep depending on Printable alone.
+"""
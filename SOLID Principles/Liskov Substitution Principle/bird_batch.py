@@ -0,0 +1,92 @@
+"""
+Batch Bird Descriptions
+
+describe_bird checks isinstance(bird, FlyingBird) for every bird it describes. Every Bird subclass now computes its
+capabilities bitmask once, when the class is created, so describe_birds only needs one bit test per class. It also
+describes each class once: make_sound and fly are called for the first bird of every class and their results are
+reused for the rest of the flock, in the flock's original order.
+"""
+
+import sys
+
+from .liskov_substitution import Bird, BirdCapability
+
+
+def format_description(sound: str, flight: str = None) -> str:
+    """
+    Format the text describe_bird prints from a bird's make_sound and fly results.
+
+    Args:
+        sound (str): The result of make_sound.
+        flight (str, optional): The result of fly, None for birds that cannot fly.
+
+    Returns:
+        str: One line for the sound, followed by one for the flight if there is one.
+    """
+    if flight is None:
+        return f"{sound}\n"
+    return f"{sound}\n{flight}\n"
+
+
+def _description(bird: Bird) -> str:
+    sound = bird.make_sound()
+    return format_description(sound, bird.fly() if type(bird).capabilities & BirdCapability.FLY else None)
+
+
+def iter_descriptions(birds, memoize: bool = True):
+    """
+    Describe many birds, one description per bird, in input order.
+
+    Args:
+        birds (Iterable[Bird]): The birds to describe.
+        memoize (bool): Reuse each class's description for every bird of that class. Disable it for classes whose
+            make_sound or fly results vary between instances.
+
+    Yields:
+        str: The text describe_bird would print for each bird.
+    """
+    if not memoize:
+        yield from map(_description, birds)
+        return
+    descriptions = {}
+    for bird in birds:
+        description = descriptions.get(type(bird))
+        if description is None:
+            description = descriptions[type(bird)] = _description(bird)
+        yield description
+
+
+def describe_birds(birds, file=None, memoize: bool = True):
+    """
+    Describe many birds, printing exactly what describe_bird prints for each of them.
+
+    Args:
+        birds (Iterable[Bird]): The birds to describe.
+        file (TextIO, optional): Where to write the descriptions. Defaults to sys.stdout.
+        memoize (bool): Reuse each class's description for every bird of that class.
+    """
+    (sys.stdout if file is None else file).writelines(iter_descriptions(birds, memoize))
+
+
+# Example Usage
+if __name__ == "__main__":
+    import io
+    from contextlib import redirect_stdout
+
+    from .liskov_substitution import Sparrow, Ostrich, describe_bird
+
+    flock = [Sparrow(), Ostrich(), Sparrow(), Sparrow(), Ostrich()]
+    describe_birds(flock)
+
+    expected = io.StringIO()
+    with redirect_stdout(expected):
+        for bird in flock:
+            describe_bird(bird)
+    batched = io.StringIO()
+    describe_birds(flock, file=batched)
+    assert batched.getvalue() == expected.getvalue()
+
+"""
+The flock is described exactly as before, but the type check happens once per class, when the class is created,
+instead of once per bird. Sparrow and Ostrich can still be substituted for Bird anywhere.
+"""
@@ -0,0 +1,214 @@
+"""
+Bird Flyweights
+
+Sparrow, Ostrich and the other Bird subclasses carry no per-instance state, yet every bird in a flock is a separate
+object whose make_sound and fly return the same strings every time. BirdFactory applies the Flyweight pattern: it
+hands out one shared instance per class and caches that class's behavior strings. A Flock goes further and stores
+a bird as the one-byte index of its class, so a flock of a million birds costs a million bytes plus one object per
+class.
+
+The flyweights are ordinary Bird instances, so they can be substituted for any Bird, and descriptions are formatted
+from the cached behavior strings with the same format_description as describe_birds in bird_batch.
+"""
+
+import sys
+from array import array
+
+from .bird_batch import format_description
+from .liskov_substitution import Bird, BirdCapability
+
+
+class BirdFactory:
+    """
+    A factory that shares one instance per stateless Bird subclass.
+    """
+
+    def __init__(self):
+        self._instances = {}
+        self._behaviors = {}
+        self._descriptions = {}
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def get(self, bird_class: type) -> Bird:
+        """
+        Return the shared instance of a Bird subclass, creating it on first use.
+
+        Args:
+            bird_class (type): A Bird subclass whose constructor takes no arguments.
+
+        Returns:
+            Bird: The shared instance.
+        """
+        instance = self._instances.get(bird_class)
+        if instance is None:
+            if not (isinstance(bird_class, type) and issubclass(bird_class, Bird)):
+                raise TypeError("Flyweights can only be created for Bird subclasses.")
+            instance = self._instances[bird_class] = bird_class()
+        return instance
+
+    def behaviors(self, bird_class: type) -> tuple:
+        """
+        Return the cached make_sound and fly results of a Bird subclass.
+
+        Args:
+            bird_class (type): A Bird subclass whose constructor takes no arguments.
+
+        Returns:
+            tuple[str, str | None]: The sound, and the flying message or None if the class cannot fly.
+        """
+        behaviors = self._behaviors.get(bird_class)
+        if behaviors is None:
+            bird = self.get(bird_class)
+            behaviors = self._behaviors[bird_class] = (
+                bird.make_sound(),
+                bird.fly() if bird_class.capabilities & BirdCapability.FLY else None,
+            )
+        return behaviors
+
+    def make_sound(self, bird_class: type) -> str:
+        """
+        Return the cached make_sound result of a Bird subclass.
+        """
+        return self.behaviors(bird_class)[0]
+
+    def fly(self, bird_class: type):
+        """
+        Return the cached fly result of a Bird subclass, or None if the class cannot fly.
+        """
+        return self.behaviors(bird_class)[1]
+
+    def description(self, bird_class: type) -> str:
+        """
+        Return the text describe_bird prints for a bird of the given class, formatted once per class.
+        """
+        description = self._descriptions.get(bird_class)
+        if description is None:
+            description = self._descriptions[bird_class] = format_description(*self.behaviors(bird_class))
+        return description
+
+
+class Flock:
+    """
+    A compact collection of birds stored as class indexes.
+
+    Attributes:
+        factory (BirdFactory): The factory providing the shared bird instances.
+    """
+
+    def __init__(self, birds=(), factory: BirdFactory = None):
+        self.factory = BirdFactory() if factory is None else factory
+        self._classes = []
+        self._indexes = array("B")
+        self.extend(birds)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def __iter__(self):
+        instances = [self.factory.get(bird_class) for bird_class in self._classes]
+        for index in self._indexes:
+            yield instances[index]
+
+    def __getitem__(self, position: int) -> Bird:
+        return self.factory.get(self._classes[self._indexes[position]])
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the class index column.
+        """
+        return self._indexes.itemsize * len(self._indexes)
+
+    def _index_of(self, bird_class: type) -> int:
+        try:
+            return self._classes.index(bird_class)
+        except ValueError:
+            pass
+        if len(self._classes) > 255:
+            raise ValueError("A Flock supports at most 256 bird classes.")
+        self.factory.get(bird_class)
+        self._classes.append(bird_class)
+        return len(self._classes) - 1
+
+    def append(self, bird):
+        """
+        Add a bird to the flock, given either as a Bird instance or as its class.
+
+        Args:
+            bird (Bird | type): The bird to add. Instances are only used for their class.
+        """
+        self._indexes.append(self._index_of(bird if isinstance(bird, type) else type(bird)))
+
+    def extend(self, birds):
+        """
+        Add every bird of an iterable to the flock.
+
+        Args:
+            birds (Iterable[Bird | type]): The birds to add.
+        """
+        for bird in birds:
+            self.append(bird)
+
+    def add(self, bird_class: type, count: int):
+        """
+        Add many birds of the same class at once.
+
+        Args:
+            bird_class (type): The class of the new birds.
+            count (int): The number of birds to add.
+        """
+        self._indexes.extend(array("B", [self._index_of(bird_class)]) * count)
+
+    def counts(self) -> dict:
+        """
+        Count the birds of every class.
+
+        Returns:
+            dict[type, int]: The number of birds per class.
+        """
+        return {bird_class: self._indexes.count(index) for index, bird_class in enumerate(self._classes)}
+
+    def describe(self, file=None):
+        """
+        Print what describe_bird prints for every bird of the flock, in order.
+
+        Args:
+            file (TextIO, optional): Where to write the descriptions. Defaults to sys.stdout.
+        """
+        # One description per class, then one list lookup per bird.
+        descriptions = [self.factory.description(bird_class) for bird_class in self._classes]
+        (sys.stdout if file is None else file).writelines(map(descriptions.__getitem__, self._indexes))
+
+
+# Example Usage
+if __name__ == "__main__":
+    import tracemalloc
+
+    from .liskov_substitution import Sparrow, Ostrich
+
+    factory = BirdFactory()
+    assert factory.get(Sparrow) is factory.get(Sparrow)
+    print(factory.make_sound(Ostrich), factory.fly(Sparrow), factory.fly(Ostrich))
+
+    flock = Flock([Sparrow(), Ostrich()], factory)
+    flock.describe()
+
+    count = 1_000_000
+    tracemalloc.start()
+    birds = [Sparrow() if index % 2 else Ostrich() for index in range(count)]
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del birds
+
+    flock = Flock(factory=factory)
+    flock.add(Sparrow, count // 2)
+    flock.add(Ostrich, count // 2)
+    print(f"{count} birds as objects: {object_bytes} bytes, as a flock: {flock.nbytes} bytes, "
+          f"shared instances: {len(factory)}")
+
+"""
+Every class now has exactly one instance, and its behavior strings are computed once. Because the shared instances
+are still real Sparrow and Ostrich objects, they substitute for Bird anywhere, as LSP requires.
+"""
@@ -44,10 +44,11 @@ def make_bird_fly(bird: Bird):
     """
     print(bird.fly())
 
-birds = [Sparrow(), Ostrich()]  # Mixing both flying and non-flying birds
+if __name__ == "__main__":
+    birds = [Sparrow(), Ostrich()]  # Mixing both flying and non-flying birds
 
-for bird in birds:
-    make_bird_fly(bird)  # This will fail for Ostrich, violating LSP
+    for bird in birds:
+        make_bird_fly(bird)  # This will fail for Ostrich, violating LSP
 
 
 """
@@ -57,11 +58,34 @@ Bird superclass, specifically the ability to fly. When make_bird_fly calls bird.
 We can apply liskov substitution principle to the above class as follows
 """
 
+from enum import IntFlag
+
+
+class BirdCapability(IntFlag):
+    """
+    Optional behaviors a bird class may support, as a bitmask.
+    """
+
+    NONE = 0
+    FLY = 1
+
+
 class Bird:
     """
     A base class for birds.
+
+    Attributes:
+        capabilities (BirdCapability): The optional behaviors of the class, computed once when the class is created.
     """
 
+    capabilities = BirdCapability.NONE
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.capabilities = BirdCapability.NONE
+        for klass in cls.__mro__:
+            cls.capabilities |= vars(klass).get("provided_capabilities", BirdCapability.NONE)
+
     def make_sound(self) -> str:
         """
         Return a generic bird sound.
@@ -73,6 +97,8 @@ class FlyingBird(Bird):
     A base class for birds that can fly.
     """
 
+    provided_capabilities = BirdCapability.FLY
+
     def fly(self) -> str:
         """
         Return a flying message for the bird.
@@ -104,10 +130,11 @@ def describe_bird(bird: Bird):
     if isinstance(bird, FlyingBird):
         print(bird.fly())
 
-birds = [Sparrow(), Ostrich()]
+if __name__ == "__main__":
+    birds = [Sparrow(), Ostrich()]
 
-for bird in birds:
-    describe_bird(bird)  # Works correctly for both flying and non-flying birds
+    for bird in birds:
+        describe_bird(bird)  # Works correctly for both flying and non-flying birds
 
 
 """
@@ -0,0 +1,147 @@
+"""
+Legacy Shape Registry
+
+Legacy callers still build string-typed shapes such as LegacyShape("rectangle", 5, 10). The original Shape walks an
+if/elif chain and rejects any type it does not know, triangles included. This module replaces the chain with a
+dispatch table that maps each shape_type to its area function in a single dictionary lookup, and
+LegacyShape.calculate_area goes through it. New types are added with the register_shape_type decorator instead of
+another elif branch.
+
+calculate_areas handles many legacy shapes at once by grouping them per shape_type and evaluating each group with
+one vectorized call, reusing the kernels of the Shape class hierarchy.
+"""
+
+from array import array
+
+from .open_closed_principle import LegacyShape
+from .shape_batch import np, rectangle_area, circle_area, triangle_area
+
+
+
+class _AreaTable(dict):
+    # A missing shape_type raises here, so the lookup in the hot path needs no try/except.
+    def __missing__(self, shape_type: str):
+        raise ValueError("Unknown shape type")
+
+
+# shape_type -> a function that takes the legacy shape and returns its area. LegacyShape.calculate_area is one lookup
+# in this table and one call.
+AREA_FUNCTIONS = _AreaTable()
+# shape_type -> (area function over dimensions, number of dimensions), for the vectorized calculate_areas.
+_KERNELS = _AreaTable()
+
+
+def register_shape_type(shape_type: str, dimensions: int = 2):
+    """
+    Register the area function for a legacy shape type.
+
+    Args:
+        shape_type (str): The shape_type string the function handles, e.g. "rectangle".
+        dimensions (int): How many of dimension1 and dimension2 the function takes.
+
+    Returns:
+        callable: A decorator that registers the area function and returns it unchanged.
+    """
+    if dimensions not in (1, 2):
+        raise ValueError("Legacy shapes have one or two dimensions.")
+
+    def decorator(function):
+        if dimensions == 1:
+            def area(shape):
+                return function(shape.dimension1)
+        else:
+            def area(shape):
+                return function(shape.dimension1, shape.dimension2)
+        AREA_FUNCTIONS[shape_type] = area
+        _KERNELS[shape_type] = (function, dimensions)
+        return function
+
+    return decorator
+
+
+def unregister_shape_type(shape_type: str):
+    """
+    Remove a legacy shape type registered with register_shape_type.
+
+    Args:
+        shape_type (str): The shape_type string to remove.
+
+    Raises:
+        ValueError: If the shape type is not registered.
+    """
+    if shape_type not in _KERNELS:
+        raise ValueError("Unknown shape type")
+    del _KERNELS[shape_type]
+    del AREA_FUNCTIONS[shape_type]
+
+
+register_shape_type("rectangle")(rectangle_area)
+register_shape_type("circle", dimensions=1)(circle_area)
+register_shape_type("triangle")(triangle_area)
+
+
+def calculate_area(shape: LegacyShape) -> float:
+    """
+    Calculate the area of a legacy shape through the dispatch table.
+
+    Args:
+        shape (LegacyShape): The string-typed shape to measure.
+
+    Returns:
+        float: Area of the shape.
+    """
+    return AREA_FUNCTIONS[shape.shape_type](shape)
+
+
+def calculate_areas(shapes) -> array:
+    """
+    Calculate the areas of many legacy shapes, one vectorized call per shape_type.
+
+    Args:
+        shapes (Iterable[LegacyShape]): The string-typed shapes to measure.
+
+    Returns:
+        array: The areas as doubles, in input order.
+    """
+    shapes = list(shapes)
+    groups = {}
+    for index, shape in enumerate(shapes):
+        groups.setdefault(shape.shape_type, []).append(index)
+
+    areas = array("d", bytes(8 * len(shapes)))
+    for shape_type, indices in groups.items():
+        function, dimensions = _KERNELS[shape_type]
+        columns = [[shapes[index].dimension1 for index in indices]]
+        if dimensions == 2:
+            columns.append([shapes[index].dimension2 for index in indices])
+        if np is not None:
+            np.frombuffer(areas, dtype=float)[indices] = function(*(np.asarray(column, dtype=float)
+                                                                    for column in columns))
+        else:
+            for index, area in zip(indices, map(function, *columns)):
+                areas[index] = area
+    return areas
+
+
+# Example Usage
+if __name__ == "__main__":
+    @register_shape_type("square", dimensions=1)
+    def square_area(side):
+        return side * side
+
+    shapes = [
+        LegacyShape("rectangle", 5, 10),
+        LegacyShape("circle", 7),
+        LegacyShape("triangle", 6, 8),
+        LegacyShape("square", 3),
+    ]
+
+    for shape in shapes:
+        print(f"Area: {calculate_area(shape)}")
+
+    print(f"Bulk areas: {list(calculate_areas(shapes))}")
+
+"""
+Adding a shape type now means registering a function rather than editing calculate_area, and every lookup costs the
+same no matter how many types exist. The triangle that the legacy if/elif chain rejected is simply another entry.
+"""
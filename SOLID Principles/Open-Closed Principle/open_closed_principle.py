@@ -42,15 +42,43 @@ class Shape:
         else:
             raise ValueError("Unknown shape type")
 
-shapes = [
-    Shape("rectangle", 5, 10),
-    Shape("circle", 7),
-    Shape("triangle", 6, 8)
-]
+
+class LegacyShape(Shape):
+    """
+    The string-typed Shape above, kept importable for legacy callers as the name Shape is reused below.
+
+    Its areas come from the dispatch table of legacy_shape_registry instead of the if/elif chain, so every registered
+    shape type, triangles included, works without modifying this class.
+    """
+
+    def calculate_area(self):
+        areas = _legacy_areas
+        if areas is None:
+            areas = _load_legacy_areas()
+        return areas[self.shape_type](self)
+
+
+# The dispatch table of legacy_shape_registry, resolved on first use because that module imports this one.
+_legacy_areas = None
+
+
+def _load_legacy_areas() -> dict:
+    global _legacy_areas
+    from .legacy_shape_registry import AREA_FUNCTIONS
+    _legacy_areas = AREA_FUNCTIONS
+    return _legacy_areas
+
+
+if __name__ == "__main__":
+    shapes = [
+        Shape("rectangle", 5, 10),
+        Shape("circle", 7),
+        Shape("triangle", 6, 8)
+    ]
 
 
-for shape in shapes:
-    print(f"Area: {shape.calculate_area()}")
+    for shape in shapes:
+        print(f"Area: {shape.calculate_area()}")
 
 """
 The above class Shape violates open-closed principle because it cannot be closed against new type of shapes.If we add 
@@ -147,14 +175,15 @@ class Triangle(Shape):
 
 
 # Example Usage
-shapes = [
-    Rectangle(5, 10),
-    Circle(7),
-    Triangle(4, 8)  # Adding a triangle shape
-]
-
-for shape in shapes:
-    print(f"Area: {shape.calculate_area()}")
+if __name__ == "__main__":
+    shapes = [
+        Rectangle(5, 10),
+        Circle(7),
+        Triangle(4, 8)  # Adding a triangle shape
+    ]
+
+    for shape in shapes:
+        print(f"Area: {shape.calculate_area()}")
 
 """
 Shape now has a virtual method calculate_area. We have each shape extend the
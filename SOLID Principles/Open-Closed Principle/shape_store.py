@@ -0,0 +1,335 @@
+"""
+Columnar Shape Store
+
+Every Rectangle, Circle and Triangle object carries its own instance dictionary, which costs far more memory than
+the two or three numbers it actually holds. ShapeStore keeps shapes as columns instead: one byte-sized type tag per
+shape plus two columns of doubles for its dimensions, roughly 17 bytes per shape.
+
+The store understands any Shape subclass that has an area kernel registered in shape_batch, so new shapes are
+supported by registering a kernel, without modifying the store.
+"""
+
+from array import array
+
+from .open_closed_principle import Shape
+from .shape_batch import get_area_kernel, np
+
+MAX_DIMENSIONS = 2
+
+
+class ShapeView:
+    """
+    A lightweight, read-only view of one shape held in a ShapeStore.
+
+    The view exposes the shape's dimensions under their usual attribute names (e.g. width, radius) and supports
+    calculate_area, without allocating the shape object itself.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: "ShapeStore", index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def shape_class(self) -> type:
+        """
+        The Shape subclass this view stands for.
+        """
+        return self._store._classes[self._store._tags[self._index]]
+
+    @property
+    def dimensions(self) -> tuple:
+        """
+        The shape's dimensions in the order of its kernel's fields.
+        """
+        store = self._store
+        count = len(get_area_kernel(self.shape_class).fields)
+        return (store._dim1[self._index], store._dim2[self._index])[:count]
+
+    def __getattr__(self, name: str):
+        # Private and special names are never dimensions. Failing fast also keeps copy and pickle, which look up
+        # names such as __setstate__ on a view whose slots are not set yet, from recursing into shape_class.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        fields = get_area_kernel(self.shape_class).fields
+        if name in fields:
+            return self.dimensions[fields.index(name)]
+        raise AttributeError(f"{self.shape_class.__name__} view has no attribute {name!r}")
+
+    def __repr__(self) -> str:
+        return f"ShapeView({self.shape_class.__name__}{self.dimensions})"
+
+    def calculate_area(self) -> float:
+        """
+        Calculate the area of the viewed shape.
+
+        Returns:
+            float: Area of the shape.
+        """
+        return get_area_kernel(self.shape_class).function(*self.dimensions)
+
+    def to_shape(self) -> Shape:
+        """
+        Build a regular Shape object from the view.
+
+        The shape class must accept its kernel's fields as positional constructor arguments.
+
+        Returns:
+            Shape: A new shape with the same dimensions.
+        """
+        return self.shape_class(*self.dimensions)
+
+
+class ShapeStore:
+    """
+    A compact, array-backed collection of shapes.
+
+    Attributes:
+        shape_classes (tuple[type, ...]): The Shape subclasses present in the store, indexed by type tag.
+    """
+
+    def __init__(self, shapes=()):
+        self._classes = []
+        self._tags = array("B")
+        self._dim1 = array("d")
+        self._dim2 = array("d")
+        self.extend(shapes)
+
+    @classmethod
+    def from_columns(cls, shape_classes, tags, first_dimensions, second_dimensions) -> "ShapeStore":
+        """
+        Build a store directly from prepared columns, without per-shape appends.
+
+        Args:
+            shape_classes (Iterable[type]): The Shape subclasses, indexed by type tag.
+            tags (Iterable[int]): The type tag of every shape.
+            first_dimensions (Iterable[float]): The first dimension of every shape.
+            second_dimensions (Iterable[float]): The second dimension of every shape, 0.0 if it has none.
+
+        Returns:
+            ShapeStore: A store holding the given shapes.
+        """
+        store = cls()
+        for shape_class in shape_classes:
+            store._tag_for(shape_class)
+        store._tags = array("B", tags)
+        store._dim1 = array("d", first_dimensions)
+        store._dim2 = array("d", second_dimensions)
+        if not len(store._tags) == len(store._dim1) == len(store._dim2):
+            raise ValueError("All columns must have the same length.")
+        return store
+
+    @property
+    def shape_classes(self) -> tuple:
+        return tuple(self._classes)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the store's columns.
+        """
+        return sum(column.itemsize * len(column) for column in (self._tags, self._dim1, self._dim2))
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __iter__(self):
+        for index in range(len(self._tags)):
+            yield ShapeView(self, index)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._take(key)
+        if key < 0:
+            key += len(self._tags)
+        if not 0 <= key < len(self._tags):
+            raise IndexError("ShapeStore index out of range")
+        return ShapeView(self, key)
+
+    def _tag_for(self, shape_class: type) -> int:
+        try:
+            return self._classes.index(shape_class)
+        except ValueError:
+            pass
+        kernel = get_area_kernel(shape_class)
+        if kernel is None:
+            raise TypeError(f"{shape_class.__name__} has no registered area kernel.")
+        if len(kernel.fields) > MAX_DIMENSIONS:
+            raise ValueError(f"ShapeStore supports at most {MAX_DIMENSIONS} dimensions per shape.")
+        if len(self._classes) > 255:
+            raise ValueError("ShapeStore supports at most 256 shape classes.")
+        self._classes.append(shape_class)
+        return len(self._classes) - 1
+
+    def add(self, shape_class: type, *dimensions: float):
+        """
+        Add a shape by its class and dimensions, without creating a Shape object.
+
+        Args:
+            shape_class (type): The Shape subclass of the new shape.
+            *dimensions (float): The shape's dimensions, in the order of its kernel's fields.
+        """
+        tag = self._tag_for(shape_class)
+        if len(dimensions) != len(get_area_kernel(shape_class).fields):
+            raise ValueError(f"{shape_class.__name__} expects {len(get_area_kernel(shape_class).fields)} dimensions.")
+        self._tags.append(tag)
+        self._dim1.append(dimensions[0] if dimensions else 0.0)
+        self._dim2.append(dimensions[1] if len(dimensions) > 1 else 0.0)
+
+    def append(self, shape: Shape):
+        """
+        Add a shape object to the store. Only its dimensions are kept.
+
+        Args:
+            shape (Shape): The shape to add.
+        """
+        if isinstance(shape, ShapeView):
+            self.add(shape.shape_class, *shape.dimensions)
+            return
+        kernel = get_area_kernel(type(shape))
+        if kernel is None:
+            raise TypeError(f"{type(shape).__name__} has no registered area kernel.")
+        self.add(type(shape), *(getattr(shape, field) for field in kernel.fields))
+
+    def extend(self, shapes):
+        """
+        Add every shape of an iterable to the store.
+
+        Args:
+            shapes (Iterable[Shape]): The shapes to add.
+        """
+        for shape in shapes:
+            self.append(shape)
+
+    def _take(self, selector) -> "ShapeStore":
+        subset = ShapeStore()
+        subset._classes = list(self._classes)
+        if isinstance(selector, slice):
+            subset._tags = self._tags[selector]
+            subset._dim1 = self._dim1[selector]
+            subset._dim2 = self._dim2[selector]
+        else:
+            subset._tags = array("B", (self._tags[index] for index in selector))
+            subset._dim1 = array("d", (self._dim1[index] for index in selector))
+            subset._dim2 = array("d", (self._dim2[index] for index in selector))
+        return subset
+
+    def calculate_areas(self) -> array:
+        """
+        Calculate the area of every shape, one vectorized kernel call per shape class.
+
+        Returns:
+            array: The areas as doubles, in store order.
+        """
+        if np is not None:
+            return array("d", self._numpy_areas().tobytes())
+        functions = [_two_dimension_function(get_area_kernel(shape_class)) for shape_class in self._classes]
+        return array("d", map(lambda tag, first, second: functions[tag](first, second),
+                              self._tags, self._dim1, self._dim2))
+
+    def _numpy_tags(self):
+        return np.frombuffer(self._tags, dtype=np.uint8) if self._tags else np.empty(0, dtype=np.uint8)
+
+    def _numpy_areas(self):
+        tags = self._numpy_tags()
+        columns = [np.frombuffer(column, dtype=float) if column else np.empty(0) for column in (self._dim1, self._dim2)]
+        areas = np.empty(len(tags))
+        for tag, shape_class in enumerate(self._classes):
+            mask = tags == tag
+            if not mask.any():
+                continue
+            kernel = get_area_kernel(shape_class)
+            areas[mask] = kernel.function(*(column[mask] for column in columns[:len(kernel.fields)]))
+        return areas
+
+    def total_area(self) -> float:
+        """
+        Calculate the combined area of all shapes in the store.
+
+        Returns:
+            float: Sum of all areas.
+        """
+        if np is not None:
+            return float(self._numpy_areas().sum())
+        return sum(self.calculate_areas())
+
+    def filter(self, shape_class: type = None, min_area: float = None, max_area: float = None) -> "ShapeStore":
+        """
+        Select shapes by class and area range.
+
+        Args:
+            shape_class (type, optional): Keep only shapes of exactly this class.
+            min_area (float, optional): Keep only shapes with at least this area.
+            max_area (float, optional): Keep only shapes with at most this area.
+
+        Returns:
+            ShapeStore: A new store holding the matching shapes, in store order.
+        """
+        wanted_tag = None
+        if shape_class is not None:
+            if shape_class not in self._classes:
+                return self._take([])
+            wanted_tag = self._classes.index(shape_class)
+
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if wanted_tag is not None:
+                mask &= self._numpy_tags() == wanted_tag
+            if min_area is not None or max_area is not None:
+                areas = self._numpy_areas()
+                if min_area is not None:
+                    mask &= areas >= min_area
+                if max_area is not None:
+                    mask &= areas <= max_area
+            return self._take(np.flatnonzero(mask).tolist())
+
+        areas = self.calculate_areas() if min_area is not None or max_area is not None else None
+        return self._take([
+            index for index in range(len(self))
+            if (wanted_tag is None or self._tags[index] == wanted_tag)
+            and (min_area is None or areas[index] >= min_area)
+            and (max_area is None or areas[index] <= max_area)
+        ])
+
+
+def _two_dimension_function(kernel):
+    if len(kernel.fields) == 2:
+        return kernel.function
+    if len(kernel.fields) == 1:
+        return lambda first, second: kernel.function(first)
+    return lambda first, second: kernel.function()
+
+
+# Example Usage
+if __name__ == "__main__":
+    import tracemalloc
+
+    from .open_closed_principle import Rectangle, Circle, Triangle
+
+    store = ShapeStore([Rectangle(5, 10), Circle(7), Triangle(4, 8)])
+    store.add(Circle, 1)
+
+    for view in store:
+        print(f"{view!r} area: {view.calculate_area()}")
+
+    print(f"Areas of store[1:3]: {list(store[1:3].calculate_areas())}")
+    print(f"Circles larger than 10: {list(store.filter(Circle, min_area=10))}")
+
+    count = 100_000
+    tracemalloc.start()
+    objects = [Rectangle(index, 2) for index in range(count)]
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    columnar = ShapeStore()
+    for index in range(count):
+        columnar.add(Rectangle, index, 2)
+
+    print(f"{count} rectangles as objects: {object_bytes} bytes, as columns: {columnar.nbytes} bytes")
+
+"""
+The store holds the same shapes as a list of objects in a small fraction of the memory. Views and area queries go
+through the kernels registered for each class, so adding a new shape still only requires extending, not modifying,
+existing code.
+"""
@@ -0,0 +1,301 @@
+"""
+Streaming Area Aggregation
+
+Shape dumps can be far larger than memory, so they cannot be loaded into a list of shapes first. This module reads
+CSV or binary shape files chunk by chunk into ShapeStore columns, computes each chunk's areas with the registered
+batch kernels and folds them into running statistics. Only one chunk is held in memory at a time.
+
+The binary format is fixed-width, so it can be memory-mapped and sliced into columns without any parsing:
+
+    header:  b"SHAPES01", uint8 class count, then per class a uint8 name length and the ASCII class name
+    records: uint8 type tag, float64 first dimension, float64 second dimension (little-endian, unpadded)
+"""
+
+import csv
+import io
+import mmap
+import struct
+from bisect import bisect_right
+from itertools import islice
+
+from .shape_batch import np, registered_shape_classes
+from .shape_store import ShapeStore
+
+MAGIC = b"SHAPES01"
+RECORD = struct.Struct("<Bdd")
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _shape_types(shape_classes=None) -> dict:
+    return {shape_class.__name__.lower(): shape_class for shape_class in shape_classes or registered_shape_classes()}
+
+
+def chunked(shapes, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Group an iterable of shapes into ShapeStore chunks.
+
+    Args:
+        shapes (Iterable[Shape]): The shapes to group, e.g. a generator.
+        chunk_size (int): The maximum number of shapes per chunk.
+
+    Yields:
+        ShapeStore: Consecutive chunks of at most chunk_size shapes.
+    """
+    iterator = iter(shapes)
+    while True:
+        store = ShapeStore(islice(iterator, chunk_size))
+        if not len(store):
+            return
+        yield store
+
+
+def read_csv_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE, shape_classes=None, header: bool = False):
+    """
+    Read a CSV shape file in chunks.
+
+    Every row holds a shape type name (the lowercase class name, e.g. "circle") followed by the shape's dimensions.
+    Empty trailing fields are ignored, so rows padded to a common width such as "circle,7," are accepted.
+
+    Args:
+        source (str | TextIO): A file path or an open text file.
+        chunk_size (int): The maximum number of shapes per chunk.
+        shape_classes (Iterable[type], optional): The Shape subclasses that may appear in the file. Defaults to every
+            class with a registered area kernel.
+        header (bool): Whether the first row holds column names and is skipped.
+
+    Yields:
+        ShapeStore: Consecutive chunks of at most chunk_size shapes.
+
+    Raises:
+        ValueError: If a row names an unknown shape type or has invalid dimensions.
+    """
+    if isinstance(source, str):
+        with open(source, newline="") as file:
+            yield from read_csv_chunks(file, chunk_size, shape_classes, header)
+        return
+
+    shape_types = _shape_types(shape_classes)
+    rows = csv.reader(source)
+    if header:
+        next(rows, None)
+    store = ShapeStore()
+    for line_number, row in enumerate(rows, start=2 if header else 1):
+        if not row:
+            continue
+        try:
+            shape_class = shape_types[row[0].strip().lower()]
+        except KeyError:
+            raise ValueError(f"Unknown shape type {row[0]!r} on line {line_number}") from None
+        dimensions = row[1:]
+        while dimensions and not dimensions[-1].strip():
+            dimensions.pop()
+        try:
+            store.add(shape_class, *map(float, dimensions))
+        except ValueError as error:
+            raise ValueError(f"{error} on line {line_number}") from None
+        if len(store) == chunk_size:
+            yield store
+            store = ShapeStore()
+    if len(store):
+        yield store
+
+
+def write_binary(target, stores, shape_classes=None) -> int:
+    """
+    Write shapes in the fixed-width binary format.
+
+    Args:
+        target (str | BinaryIO): A file path or an open binary file.
+        stores (Iterable[ShapeStore]): The shapes to write, e.g. the chunks of read_csv_chunks.
+        shape_classes (Iterable[type], optional): The Shape subclasses that may appear. Defaults to every class with
+            a registered area kernel.
+
+    Returns:
+        int: The number of shapes written.
+    """
+    if isinstance(target, str):
+        with open(target, "wb") as file:
+            return write_binary(file, stores, shape_classes)
+
+    shape_classes = tuple(shape_classes or registered_shape_classes())
+    target.write(MAGIC + bytes([len(shape_classes)]))
+    for shape_class in shape_classes:
+        name = shape_class.__name__.lower().encode("ascii")
+        target.write(bytes([len(name)]) + name)
+
+    written = 0
+    for store in stores:
+        file_tags = bytes(shape_classes.index(shape_class) for shape_class in store.shape_classes)
+        buffer = bytearray(RECORD.size * len(store))
+        for offset, tag, first, second in zip(range(0, len(buffer), RECORD.size),
+                                              store._tags, store._dim1, store._dim2):
+            RECORD.pack_into(buffer, offset, file_tags[tag], first, second)
+        target.write(buffer)
+        written += len(store)
+    return written
+
+
+def read_binary_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, shape_classes=None):
+    """
+    Memory-map a binary shape file and yield it in chunks.
+
+    With NumPy available the records are sliced straight into columns, otherwise they are unpacked with struct.
+
+    Args:
+        path (str): Path of a file written by write_binary.
+        chunk_size (int): The maximum number of shapes per chunk.
+        shape_classes (Iterable[type], optional): The Shape subclasses that may appear in the file. Defaults to every
+            class with a registered area kernel.
+
+    Yields:
+        ShapeStore: Consecutive chunks of at most chunk_size shapes.
+    """
+    shape_types = _shape_types(shape_classes)
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if mapped[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a binary shape file.")
+        offset = len(MAGIC) + 1
+        classes = []
+        for _ in range(mapped[len(MAGIC)]):
+            length = mapped[offset]
+            name = mapped[offset + 1:offset + 1 + length].decode("ascii")
+            if name not in shape_types:
+                raise ValueError(f"Unknown shape type {name!r} in {path}")
+            classes.append(shape_types[name])
+            offset += 1 + length
+
+        count, remainder = divmod(len(mapped) - offset, RECORD.size)
+        if remainder:
+            raise ValueError(f"{path} ends with a truncated record.")
+
+        records = memoryview(mapped)
+        try:
+            for start in range(0, count, chunk_size):
+                stop = min(start + chunk_size, count)
+                chunk = records[offset + start * RECORD.size:offset + stop * RECORD.size]
+                try:
+                    yield _store_from_records(classes, chunk)
+                finally:
+                    chunk.release()
+        finally:
+            records.release()
+
+
+def _store_from_records(classes: list, chunk: memoryview) -> ShapeStore:
+    if np is not None:
+        fields = np.frombuffer(chunk, dtype=np.dtype([("tag", "u1"), ("first", "<f8"), ("second", "<f8")]))
+        columns = (fields["tag"].tobytes(), fields["first"].tobytes(), fields["second"].tobytes())
+        del fields
+    else:
+        tags, firsts, seconds = zip(*RECORD.iter_unpack(chunk)) if len(chunk) else ((), (), ())
+        columns = (tags, firsts, seconds)
+    return ShapeStore.from_columns(classes, *columns)
+
+
+class AreaStatistics:
+    """
+    Running statistics over a stream of shape areas.
+
+    Attributes:
+        count (int): The number of shapes seen.
+        total (float): The sum of all areas.
+        minimum (float): The smallest area seen, None before the first shape.
+        maximum (float): The largest area seen, None before the first shape.
+        bin_edges (tuple[float, ...]): The histogram's ascending bin edges.
+        histogram (list[int]): Shape counts per bin. Bin i holds areas in [bin_edges[i - 1], bin_edges[i]), with one
+            extra bin at each end for areas outside the edges.
+        totals_by_type (dict[str, float]): The summed area per shape class name.
+    """
+
+    def __init__(self, bin_edges=(1, 10, 100, 1000, 10000)):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.bin_edges = tuple(bin_edges)
+        self.histogram = [0] * (len(self.bin_edges) + 1)
+        self.totals_by_type = {}
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean area, None before the first shape.
+        """
+        return self.total / self.count if self.count else None
+
+    def update(self, store: ShapeStore):
+        """
+        Fold the areas of one chunk into the statistics.
+
+        Args:
+            store (ShapeStore): The chunk of shapes to add.
+        """
+        if not len(store):
+            return
+        areas = store.calculate_areas()
+        if np is not None:
+            values = np.frombuffer(areas, dtype=float)
+            tags = np.frombuffer(store._tags, dtype=np.uint8)
+            chunk_minimum, chunk_maximum = float(values.min()), float(values.max())
+            bins = np.bincount(np.searchsorted(self.bin_edges, values, side="right"),
+                               minlength=len(self.histogram))
+            per_tag = np.bincount(tags, weights=values, minlength=len(store.shape_classes))
+            self.total += float(values.sum())
+            del values, tags
+        else:
+            chunk_minimum, chunk_maximum = min(areas), max(areas)
+            bins = [0] * len(self.histogram)
+            per_tag = [0.0] * len(store.shape_classes)
+            for tag, area in zip(store._tags, areas):
+                bins[bisect_right(self.bin_edges, area)] += 1
+                per_tag[tag] += area
+            self.total += sum(areas)
+
+        self.count += len(store)
+        self.minimum = chunk_minimum if self.minimum is None else min(self.minimum, chunk_minimum)
+        self.maximum = chunk_maximum if self.maximum is None else max(self.maximum, chunk_maximum)
+        for index, bin_count in enumerate(bins):
+            self.histogram[index] += int(bin_count)
+        for shape_class, type_total in zip(store.shape_classes, per_tag):
+            name = shape_class.__name__
+            self.totals_by_type[name] = self.totals_by_type.get(name, 0.0) + float(type_total)
+
+
+def aggregate_areas(chunks, bin_edges=(1, 10, 100, 1000, 10000)) -> AreaStatistics:
+    """
+    Aggregate the areas of a stream of shape chunks.
+
+    Args:
+        chunks (Iterable[ShapeStore]): The chunks to aggregate, e.g. from read_csv_chunks or read_binary_chunks.
+        bin_edges (Iterable[float]): The histogram's ascending bin edges.
+
+    Returns:
+        AreaStatistics: The statistics over every shape in the stream.
+    """
+    statistics = AreaStatistics(bin_edges)
+    for chunk in chunks:
+        statistics.update(chunk)
+    return statistics
+
+
+# Example Usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    rows = io.StringIO("type,first,second\n" + "rectangle,5,10\ncircle,7,\ntriangle,4,8\ncircle,1,\n" * 1000)
+    statistics = aggregate_areas(read_csv_chunks(rows, chunk_size=512, header=True))
+    print(f"CSV: {statistics.count} shapes, total {statistics.total:.2f}, min {statistics.minimum}, "
+          f"max {statistics.maximum}, histogram {statistics.histogram}, per type {statistics.totals_by_type}")
+
+    rows.seek(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "shapes.bin")
+        write_binary(path, read_csv_chunks(rows, chunk_size=512, header=True))
+        statistics = aggregate_areas(read_binary_chunks(path, chunk_size=512))
+    print(f"Binary: {statistics.count} shapes, total {statistics.total:.2f}, per type {statistics.totals_by_type}")
+
+"""
+Both pipelines hold a single chunk at a time, so memory stays bounded however large the input is. Converting a CSV
+dump to the binary format once lets later runs memory-map the file and skip parsing altogether.
+"""
@@ -0,0 +1,144 @@
+"""
+Cached Employee Database
+
+Most traffic against the employee store is reads. CachedEmployeeDB is a decorator around any EmployeeDB that keeps the
+same save, read, update and delete methods: reads go through an LRU cache with an optional time-to-live, misses are
+read through from the wrapped store, and every write invalidates the cached copy once it has reached the store.
+
+Caching stays a responsibility of its own, neither Employee nor the wrapped EmployeeDB change.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .single_responsibility_principle import Employee, EmployeeDB
+
+
+class CachedEmployeeDB(EmployeeDB):
+    """
+    A read-through LRU/TTL cache in front of another EmployeeDB.
+
+    Attributes:
+        database (EmployeeDB): The wrapped store.
+        capacity (int): The maximum number of cached employees.
+        ttl (float): Seconds a cached employee stays valid, None to keep it until it is evicted or invalidated.
+        hits (int): Reads served from the cache.
+        misses (int): Reads forwarded to the wrapped store.
+        evictions (int): Employees dropped to make room for others.
+        expirations (int): Employees dropped because their time-to-live had passed.
+    """
+
+    def __init__(self, database: EmployeeDB, capacity: int = 1024, ttl: float = None, clock=time.monotonic):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.database = database
+        self.capacity = capacity
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, so a read that raced with a write never caches the value it read.
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, name: str) -> tuple:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                salary, expires_at = entry
+                if expires_at is None or self._clock() < expires_at:
+                    self._entries.move_to_end(name)
+                    self.hits += 1
+                    return Employee(name, salary), self._generation
+                del self._entries[name]
+                self.expirations += 1
+            self.misses += 1
+            return None, self._generation
+
+    def _store(self, employee: Employee, generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[employee.name] = (employee.salary, None if self.ttl is None else self._clock() + self.ttl)
+            self._entries.move_to_end(employee.name)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, employee: Employee = None):
+        """
+        Drop an employee from the cache, or every employee if none is given.
+
+        Args:
+            employee (Employee, optional): The employee to drop.
+        """
+        with self._lock:
+            self._generation += 1
+            if employee is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(employee.name, None)
+
+    def save(self, employee: Employee):
+        try:
+            self.database.save(employee)
+        finally:
+            self.invalidate(employee)
+
+    def delete(self, employee: Employee):
+        try:
+            self.database.delete(employee)
+        finally:
+            self.invalidate(employee)
+
+    def read(self, employee: Employee):
+        """
+        Read the employee from the cache, or from the wrapped store on a miss.
+
+        Args:
+            employee (Employee): The employee object to read, only its name is used.
+
+        Returns:
+            Employee: A copy of the stored employee, or whatever the wrapped store returned on a miss.
+        """
+        cached, generation = self._lookup(employee.name)
+        if cached is not None:
+            return cached
+        stored = self.database.read(employee)
+        if stored is not None:
+            self._store(stored, generation)
+        return stored
+
+    def update(self, employee: Employee):
+        try:
+            self.database.update(employee)
+        finally:
+            self.invalidate(employee)
+
+
+# Example Usage
+if __name__ == "__main__":
+    from .indexed_employee_db import IndexedEmployeeDB
+
+    employee_db = CachedEmployeeDB(IndexedEmployeeDB([Employee("John Doe", 50000), Employee("Jane Roe", 62000)]),
+                                   capacity=1, ttl=60)
+
+    for _ in range(3):
+        employee_db.read(Employee("John Doe", 0))
+    employee_db.update(Employee("John Doe", 55000))
+    print(employee_db.read(Employee("John Doe", 0)).get_details())
+    employee_db.read(Employee("Jane Roe", 0))
+
+    print(f"Hits: {employee_db.hits}, misses: {employee_db.misses}, evictions: {employee_db.evictions}")
+
+"""
+Repeated reads of the same employee are answered from memory, and writes can never leave a stale copy behind because
+they invalidate it. The wrapped store is unaware of the cache, so caching can be added to any EmployeeDB.
+"""
@@ -0,0 +1,103 @@
+"""
+Employee Report Rendering
+
+Reporting jobs call Employee.get_details for every employee on every run and collect the strings before writing them.
+write_report renders many employees (Employee objects, any iterable of them, or an EmployeeTable) and streams the lines
+straight into a file or buffer, without building the report in memory first.
+
+Lines are produced as they are written, so a roster of any size is written with constant memory. Each line comes from
+get_details, which Employee and EmployeeTable cache per employee until its name or salary is assigned, so repeated
+runs only format the employees that changed. The cache belongs to the employee rather than to its values: values that
+compare equal can format differently (Decimal("50000") and Decimal("50000.00"), 0.0 and -0.0).
+"""
+
+import io
+from itertools import repeat
+from operator import methodcaller
+
+from .employee_table import EmployeeTable
+from .single_responsibility_principle import Employee
+
+
+def _lines(employees):
+    if isinstance(employees, EmployeeTable):
+        details = map(employees.get_details, range(len(employees)))
+    else:
+        details = map(_get_details, employees)
+    return map(str.__add__, details, repeat("\n"))
+
+
+_get_details = methodcaller("get_details")
+
+
+def write_report(employees, target, buffer_size: int = 1 << 20) -> int:
+    """
+    Write one line per employee to a file or text buffer.
+
+    Args:
+        employees (Iterable[Employee] | EmployeeTable): The employees to report, e.g. a generator over a large roster.
+        target (str | TextIO): A file path, or an open text file or buffer to write to.
+        buffer_size (int): The write buffer size when target is a path.
+
+    Returns:
+        int: The number of lines written.
+    """
+    if isinstance(target, str):
+        with open(target, "w", buffering=buffer_size) as file:
+            return write_report(employees, file)
+
+    counter = _Counter()
+    target.writelines(map(counter, _lines(employees)))
+    return counter.count
+
+
+def render_report(employees) -> str:
+    """
+    Render the whole report as one string.
+
+    Args:
+        employees (Iterable[Employee] | EmployeeTable): The employees to report.
+
+    Returns:
+        str: One line per employee.
+    """
+    buffer = io.StringIO()
+    write_report(employees, buffer)
+    return buffer.getvalue()
+
+
+class _Counter:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, line: str) -> str:
+        self.count += 1
+        return line
+
+
+# Example Usage
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from decimal import Decimal
+    from itertools import repeat
+
+    employees = [Employee("John Doe", 50000), Employee("Jane Roe", 62000)]
+    print(render_report(employees), end="")
+    assert render_report(employees) == "".join(employee.get_details() + "\n" for employee in employees)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "report.txt")
+        roster = map(Employee, (f"Employee {index % 5000}" for index in range(1_000_000)), repeat(40000))
+        written = write_report(roster, path)
+        print(f"Streamed {written} lines, {os.path.getsize(path)} bytes")
+
+    salaries = [Decimal("50000"), Decimal("50000.00"), 0.0, -0.0]
+    print(render_report(Employee("John Doe", salary) for salary in salaries), end="")
+
+"""
+The report renderer only formats employees, it does not store or modify them, and every line is formatted
+exactly as get_details would format it.
+"""
@@ -0,0 +1,333 @@
+"""
+Employee Service
+
+The SRP example ends by noting that clients have to deal with both Employee and EmployeeDB, and suggests the Facade
+Pattern. EmployeeService is that facade: clients hire, look up, pay and fire employees through one object, and
+Employee and EmployeeDB each keep their single responsibility behind it.
+
+The service also acts as a unit of work. Inside "with service.unit_of_work():" it tracks the employees it hands out and
+the changes made to them, and writes nothing until the block ends. On commit, every change to the same employee
+collapses into one store call: an employee whose salary changed five times is updated once, an employee hired and
+fired in the same unit of work is never written at all, and the remaining writes go to the store as one batch.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from .single_responsibility_principle import Employee, EmployeeDB
+
+_NEW = "new"
+_CLEAN = "clean"
+_DIRTY = "dirty"
+_DELETED = "deleted"
+
+
+class UnitOfWork:
+    """
+    The employees loaded or changed during one unit of work, keyed by name.
+
+    Every employee is in one state: new (to be saved), clean (loaded, written only if it was changed in place), dirty
+    (to be updated) or deleted (to be deleted). Registering the same employee again moves it to the state that sums up
+    both changes, so the unit of work never holds more than one pending write per employee.
+    """
+
+    def __init__(self):
+        self._states = {}
+        self._employees = {}
+        self._snapshots = {}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, name: str):
+        """
+        Return the employee tracked under a name, None if it is not tracked or was deleted.
+        """
+        if self._states.get(name) == _DELETED:
+            return None
+        return self._employees.get(name)
+
+    def is_deleted(self, name: str) -> bool:
+        return self._states.get(name) == _DELETED
+
+    def register_clean(self, employee: Employee):
+        """
+        Track an employee read from the store. It is written on commit only if its salary changed in the meantime.
+        """
+        if employee.name not in self._states:
+            self._states[employee.name] = _CLEAN
+            self._employees[employee.name] = employee
+            self._snapshots[employee.name] = employee.salary
+
+    def register_new(self, employee: Employee):
+        """
+        Track an employee to be saved.
+
+        Raises:
+            ValueError: If an employee with the same name is already tracked and not deleted.
+        """
+        state = self._states.get(employee.name)
+        if state is None:
+            self._states[employee.name] = _NEW
+        elif state == _DELETED:
+            # Deleted and added again: the stored employee is overwritten rather than deleted.
+            self._states[employee.name] = _DIRTY
+        else:
+            raise ValueError(f"Employee {employee.name} already exists.")
+        self._employees[employee.name] = employee
+
+    def register_dirty(self, employee: Employee):
+        """
+        Track an employee to be updated.
+
+        Raises:
+            ValueError: If the employee was deleted in this unit of work.
+        """
+        state = self._states.get(employee.name)
+        if state == _DELETED:
+            raise ValueError(f"Employee {employee.name} was deleted.")
+        if state != _NEW:
+            self._states[employee.name] = _DIRTY
+        self._employees[employee.name] = employee
+
+    def register_deleted(self, employee: Employee):
+        """
+        Track an employee to be deleted. Deleting an employee added in the same unit of work cancels both changes.
+        """
+        state = self._states.get(employee.name)
+        if state == _NEW:
+            del self._states[employee.name]
+            del self._employees[employee.name]
+            return
+        self._states[employee.name] = _DELETED
+        self._employees[employee.name] = employee
+
+    def changes(self) -> tuple:
+        """
+        Coalesce the tracked changes into the writes the store needs.
+
+        Returns:
+            tuple[list[Employee], list[Employee], list[Employee]]: The employees to save, update and delete.
+        """
+        saves, updates, deletes = [], [], []
+        for name, state in self._states.items():
+            employee = self._employees[name]
+            if state == _NEW:
+                saves.append(employee)
+            elif state == _DIRTY:
+                updates.append(employee)
+            elif state == _DELETED:
+                deletes.append(employee)
+            elif employee.salary != self._snapshots[name]:
+                updates.append(employee)
+        return saves, updates, deletes
+
+
+class EmployeeService:
+    """
+    A facade over Employee and EmployeeDB that batches writes per unit of work.
+
+    Outside a unit of work every call is written to the store immediately. The active unit of work is tracked per
+    thread, so request handlers running in different threads can share one service.
+
+    Attributes:
+        database (EmployeeDB): The store. Stores with save_many, update_many and delete_many methods, or with a batch
+            context manager like IndexedEmployeeDB, receive each commit as one batch.
+    """
+
+    def __init__(self, database: EmployeeDB = None):
+        self.database = database if database is not None else EmployeeDB()
+        self._local = threading.local()
+
+    @property
+    def _unit(self):
+        return getattr(self._local, "unit", None)
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Collect changes until the with block exits, then commit them. If the block raises, nothing is written.
+
+        Units of work do not nest: a unit of work started inside another one joins it.
+
+        Yields:
+            UnitOfWork: The tracked changes.
+        """
+        if self._unit is not None:
+            yield self._unit
+            return
+        unit = self._local.unit = UnitOfWork()
+        try:
+            yield unit
+        except BaseException:
+            self._local.unit = None
+            raise
+        self._local.unit = None
+        self._commit(unit)
+
+    def _commit(self, unit: UnitOfWork):
+        saves, updates, deletes = unit.changes()
+        if not (saves or updates or deletes):
+            return
+        database = self.database
+        if hasattr(database, "batch"):
+            with database.batch() as batch:
+                for employee in deletes:
+                    batch.delete(employee)
+                for employee in saves:
+                    batch.save(employee)
+                for employee in updates:
+                    batch.update(employee)
+            return
+        for employees, many, one in ((deletes, "delete_many", "delete"), (saves, "save_many", "save"),
+                                     (updates, "update_many", "update")):
+            if not employees:
+                continue
+            write_many = getattr(database, many, None)
+            if write_many is not None:
+                write_many(employees)
+            else:
+                write = getattr(database, one)
+                for employee in employees:
+                    write(employee)
+
+    def hire(self, name: str, salary: float) -> Employee:
+        """
+        Add a new employee.
+
+        Args:
+            name (str): The employee's name.
+            salary (float): The employee's salary.
+
+        Returns:
+            Employee: The new employee.
+        """
+        employee = Employee(name, salary)
+        unit = self._unit
+        if unit is None:
+            self.database.save(employee)
+        else:
+            unit.register_new(employee)
+        return employee
+
+    def get(self, name: str):
+        """
+        Look up an employee. Inside a unit of work, the same object is returned for the same name every time, and
+        changes made to its salary are written on commit.
+
+        Args:
+            name (str): The employee's name.
+
+        Returns:
+            Employee: The employee, or None if there is none with that name.
+        """
+        unit = self._unit
+        if unit is not None:
+            if unit.is_deleted(name):
+                return None
+            employee = unit.get(name)
+            if employee is not None:
+                return employee
+        employee = self.database.read(Employee(name, 0))
+        if employee is not None and unit is not None:
+            unit.register_clean(employee)
+        return employee
+
+    def set_salary(self, employee: Employee, salary: float) -> Employee:
+        """
+        Change an employee's salary.
+
+        Args:
+            employee (Employee): The employee to change.
+            salary (float): The new salary.
+
+        Returns:
+            Employee: The changed employee.
+
+        Raises:
+            ValueError: If the employee was fired in the current unit of work. The employee is left unchanged.
+        """
+        unit = self._unit
+        if unit is None:
+            employee.salary = salary
+            self.database.update(employee)
+        else:
+            # Registered first, so an employee the unit of work refuses to track is not changed either.
+            unit.register_dirty(employee)
+            employee.salary = salary
+        return employee
+
+    def give_raise(self, employee: Employee, percent: float) -> Employee:
+        """
+        Raise an employee's salary by a percentage.
+
+        Args:
+            employee (Employee): The employee to change.
+            percent (float): The raise, e.g. 5 for 5%.
+
+        Returns:
+            Employee: The changed employee.
+        """
+        return self.set_salary(employee, employee.salary * (1 + percent / 100))
+
+    def fire(self, employee: Employee):
+        """
+        Remove an employee.
+
+        Args:
+            employee (Employee): The employee to remove.
+        """
+        unit = self._unit
+        if unit is None:
+            self.database.delete(employee)
+        else:
+            unit.register_deleted(employee)
+
+    def details(self, employee: Employee) -> str:
+        """
+        Return the formatted details of an employee.
+        """
+        return employee.get_details()
+
+
+# Example Usage
+if __name__ == "__main__":
+    from .indexed_employee_db import IndexedEmployeeDB
+
+    class CountingEmployeeDB(IndexedEmployeeDB):
+        """
+        An IndexedEmployeeDB that counts the store calls it receives.
+        """
+
+        def __init__(self, employees=()):
+            self.calls = 0
+            super().__init__(employees)
+
+        def batch(self):
+            self.calls += 1
+            return super().batch()
+
+    service = EmployeeService(EmployeeDB())
+    with service.unit_of_work():
+        john = service.hire("John Doe", 50000)
+        service.give_raise(john, 10)
+        service.set_salary(john, 60000)
+        temp = service.hire("Temp Worker", 20000)
+        service.fire(temp)
+    print(service.details(john))
+
+    database = CountingEmployeeDB([Employee(f"Employee {index}", 40000) for index in range(100)])
+    database.calls = 0
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        for index in range(100):
+            employee = service.get(f"Employee {index}")
+            for _ in range(5):
+                employee.salary += 1000
+        service.fire(service.get("Employee 0"))
+    print(f"{len(database)} employees, {database.get('Employee 1').get_details()}, store calls: {database.calls}")
+
+"""
+Clients now only talk to EmployeeService. Employee still only holds employee data and the store still only stores
+it, while the service decides when and how changes reach the store, turning many small writes into one batch.
+"""
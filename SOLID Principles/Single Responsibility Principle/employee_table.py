@@ -0,0 +1,230 @@
+"""
+Columnar Employee Table
+
+Employee declares __slots__, so a single employee no longer carries an instance dictionary. For rosters of millions
+of employees EmployeeTable goes further and drops the per-employee objects entirely: names are interned strings in a
+list and salaries sit in one array of doubles. Payroll aggregates run over the salary column at once (with NumPy when
+it is installed), and the table hands out EmployeeView objects wherever an Employee is expected.
+"""
+
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, aggregates then loop over the salary column.
+    np = None
+
+from .single_responsibility_principle import Employee
+
+
+class EmployeeView(Employee):
+    """
+    An Employee backed by one row of an EmployeeTable.
+
+    Reading or assigning name and salary goes straight to the table, so get_details and any other Employee code work
+    unchanged. The formatted details are cached per row by the table.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "EmployeeTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        return self._table._names[self._index]
+
+    @property
+    def salary(self) -> float:
+        return self._table._salaries[self._index]
+
+    @salary.setter
+    def salary(self, value: float):
+        self._table._salaries[self._index] = value
+        self._table._details[self._index] = None
+
+    def get_details(self) -> str:
+        return self._table.get_details(self._index)
+
+
+class EmployeeTable:
+    """
+    A columnar collection of employees.
+    """
+
+    def __init__(self, employees=()):
+        self._names = []
+        self._salaries = array("d")
+        self._details = []
+        self.extend(employees)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self):
+        for index in range(len(self._names)):
+            yield EmployeeView(self, index)
+
+    def __getitem__(self, index: int) -> EmployeeView:
+        if index < 0:
+            index += len(self._names)
+        if not 0 <= index < len(self._names):
+            raise IndexError("EmployeeTable index out of range")
+        return EmployeeView(self, index)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes used by the name list, the salary column and the details cache, excluding the shared name
+        strings and the cached details themselves.
+        """
+        return (sys.getsizeof(self._names) + self._salaries.itemsize * len(self._salaries)
+                + sys.getsizeof(self._details))
+
+    def get_details(self, index: int) -> str:
+        """
+        Get the details of one row, formatted like Employee.get_details and cached until its salary changes.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            str: Formatted details of the employee.
+        """
+        details = self._details[index]
+        if details is None:
+            details = self._details[index] = f"Employee: {self._names[index]}, Salary: {self._salaries[index]}"
+        return details
+
+    def add(self, name: str, salary: float) -> EmployeeView:
+        """
+        Add an employee by name and salary, without creating an Employee object.
+
+        Args:
+            name (str): The employee's name.
+            salary (float): The employee's salary.
+
+        Returns:
+            EmployeeView: A view of the new row.
+        """
+        self._names.append(sys.intern(name))
+        self._salaries.append(salary)
+        self._details.append(None)
+        return EmployeeView(self, len(self._names) - 1)
+
+    def append(self, employee: Employee):
+        """
+        Add an employee to the table. Only its name and salary are kept.
+
+        Args:
+            employee (Employee): The employee to add.
+        """
+        self.add(employee.name, employee.salary)
+
+    def extend(self, employees):
+        """
+        Add every employee of an iterable to the table.
+
+        Args:
+            employees (Iterable[Employee]): The employees to add.
+        """
+        for employee in employees:
+            self.append(employee)
+
+    def _salary_array(self):
+        return np.frombuffer(self._salaries, dtype=float) if self._salaries else np.empty(0)
+
+    def total_salary(self) -> float:
+        """
+        Returns:
+            float: The sum of all salaries.
+        """
+        if np is not None:
+            return float(self._salary_array().sum())
+        return sum(self._salaries)
+
+    def mean_salary(self) -> float:
+        """
+        Returns:
+            float: The mean salary.
+
+        Raises:
+            ValueError: If the table is empty.
+        """
+        if not self._salaries:
+            raise ValueError("Cannot compute the mean salary of an empty table.")
+        return self.total_salary() / len(self._salaries)
+
+    def salary_percentile(self, percent: float) -> float:
+        """
+        Compute a salary percentile, interpolating linearly between the two nearest salaries.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            float: The salary at that percentile.
+
+        Raises:
+            ValueError: If the table is empty or percent is out of range.
+        """
+        if not self._salaries:
+            raise ValueError("Cannot compute a salary percentile of an empty table.")
+        if not 0 <= percent <= 100:
+            raise ValueError("percent must lie between 0 and 100.")
+        if np is not None:
+            return float(np.percentile(self._salary_array(), percent))
+        ordered = sorted(self._salaries)
+        rank = percent / 100 * (len(ordered) - 1)
+        lower = int(rank)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+    def raise_by_percent(self, percent: float):
+        """
+        Raise every salary by a percentage, in place.
+
+        Args:
+            percent (float): The raise, e.g. 3.5 for 3.5 percent.
+        """
+        factor = 1 + percent / 100
+        self._details = [None] * len(self._names)
+        if np is not None:
+            if self._salaries:
+                salaries = self._salary_array()
+                salaries *= factor
+            return
+        self._salaries = array("d", (salary * factor for salary in self._salaries))
+
+
+# Example Usage
+if __name__ == "__main__":
+    import tracemalloc
+
+    table = EmployeeTable([Employee("John Doe", 50000), Employee("Jane Roe", 62000)])
+    table.add("Max Mustermann", 41000)
+    table.raise_by_percent(10)
+
+    for employee in table:
+        print(employee.get_details())
+    print(f"Total {table.total_salary():.2f}, mean {table.mean_salary():.2f}, "
+          f"median {table.salary_percentile(50):.2f}")
+
+    count = 100_000
+    names = [f"Employee {index % 1000}" for index in range(count)]
+    tracemalloc.start()
+    employees = [Employee(name, 30000.0 + index) for index, name in enumerate(names)]
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    table = EmployeeTable()
+    for index, name in enumerate(names):
+        table.add(name, 30000.0 + index)
+    print(f"{count} employees as objects: {object_bytes} bytes, as a table: {table.nbytes} bytes")
+
+"""
+The table stores two pointers (name and cached details) and one double per employee, and EmployeeView keeps it
+compatible with everything that works with an Employee. Employee still only manages employee properties, the table only stores many of them.
+"""
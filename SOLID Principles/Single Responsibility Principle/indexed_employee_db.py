@@ -0,0 +1,326 @@
+"""
+Indexed Employee Database
+
+EmployeeDB only simulates its operations. IndexedEmployeeDB keeps the same save, read, update and delete methods but
+actually stores employees in memory, with two indexes:
+
+- a primary index (a dictionary keyed by employee name) for constant-time lookups, and
+- a secondary index on salary, kept sorted, for logarithmic range and top-k queries.
+
+It still has a single responsibility, storing employees, and Employee stays unaware of how it is stored.
+"""
+
+import math
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from heapq import merge
+
+from .single_responsibility_principle import Employee, EmployeeDB
+
+_DELETED = object()
+
+
+class EmployeeBatch:
+    """
+    A set of staged changes that an IndexedEmployeeDB applies atomically.
+
+    Changes are validated as they are staged, against the database and the changes staged before them. Several changes
+    to the same employee collapse into the last one.
+    """
+
+    def __init__(self, database: "IndexedEmployeeDB"):
+        self._database = database
+        self._changes = {}
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def _exists(self, name: str) -> bool:
+        if name in self._changes:
+            return self._changes[name] is not _DELETED
+        return name in self._database._employees
+
+    def save(self, employee: Employee):
+        self._changes[employee.name] = employee.salary
+
+    def update(self, employee: Employee):
+        if not self._exists(employee.name):
+            raise KeyError(employee.name)
+        self._changes[employee.name] = employee.salary
+
+    def delete(self, employee: Employee):
+        if not self._exists(employee.name):
+            raise KeyError(employee.name)
+        self._changes[employee.name] = _DELETED
+
+    def commit(self):
+        """
+        Apply every staged change to the database at once.
+        """
+        changes, self._changes = self._changes, {}
+        self._database._apply(changes)
+
+
+class IndexedEmployeeDB(EmployeeDB):
+    """
+    An in-memory employee database with a primary name index and a sorted salary index.
+
+    Employees are copied on the way in and out, so changing an Employee object never corrupts the indexes behind the
+    database's back; call update to store a change.
+    """
+
+    def __init__(self, employees=()):
+        self._employees = {}
+        self._salary_index = []
+        for employee in employees:
+            self.save(employee)
+
+    def __len__(self) -> int:
+        return len(self._employees)
+
+    def __contains__(self, employee: Employee) -> bool:
+        return employee.name in self._employees
+
+    def _index(self, name: str, salary: float):
+        self._employees[name] = salary
+        insort(self._salary_index, (salary, name))
+
+    def _unindex(self, name: str):
+        salary = self._employees.pop(name)
+        del self._salary_index[bisect_left(self._salary_index, (salary, name))]
+
+    def save(self, employee: Employee):
+        """
+        Save the employee, replacing any stored employee with the same name.
+
+        Args:
+            employee (Employee): The employee object to save.
+        """
+        if employee.name in self._employees:
+            self._unindex(employee.name)
+        self._index(employee.name, employee.salary)
+
+    def delete(self, employee: Employee):
+        """
+        Delete the employee from the database.
+
+        Args:
+            employee (Employee): The employee object to delete.
+
+        Raises:
+            KeyError: If no employee with that name is stored.
+        """
+        if employee.name not in self._employees:
+            raise KeyError(employee.name)
+        self._unindex(employee.name)
+
+    def read(self, employee: Employee):
+        """
+        Read the stored version of the employee.
+
+        Args:
+            employee (Employee): The employee object to read, only its name is used.
+
+        Returns:
+            Employee: The stored employee, or None if no employee with that name is stored.
+        """
+        return self.get(employee.name)
+
+    def update(self, employee: Employee):
+        """
+        Update the stored employee with the same name.
+
+        Args:
+            employee (Employee): The employee object to update.
+
+        Raises:
+            KeyError: If no employee with that name is stored.
+        """
+        if employee.name not in self._employees:
+            raise KeyError(employee.name)
+        self._unindex(employee.name)
+        self._index(employee.name, employee.salary)
+
+    @contextmanager
+    def batch(self):
+        """
+        Stage changes and apply them as one atomic batch when the with block exits.
+
+        If the block raises, nothing is applied.
+
+        Yields:
+            EmployeeBatch: The batch to stage changes on.
+        """
+        batch = EmployeeBatch(self)
+        yield batch
+        batch.commit()
+
+    def _apply(self, changes: dict):
+        employees = self._employees
+        if len(changes) <= max(16, len(self._salary_index).bit_length()):
+            # A handful of changes: patch a copy of the sorted index instead of rebuilding it. Every patch shifts the
+            # list in O(n), so anything beyond about log n changes is cheaper as one merge pass.
+            salary_index = list(self._salary_index)
+            for name, salary in changes.items():
+                if name in employees:
+                    del salary_index[bisect_left(salary_index, (employees[name], name))]
+                if salary is not _DELETED:
+                    insort(salary_index, (salary, name))
+        else:
+            salary_index = list(merge(
+                (entry for entry in self._salary_index if entry[1] not in changes),
+                sorted((salary, name) for name, salary in changes.items() if salary is not _DELETED),
+            ))
+
+        previous = {}
+        try:
+            for name, salary in changes.items():
+                previous[name] = employees.get(name, _DELETED)
+                if salary is _DELETED:
+                    employees.pop(name, None)
+                else:
+                    employees[name] = salary
+        except BaseException:
+            for name, salary in previous.items():
+                if salary is _DELETED:
+                    employees.pop(name, None)
+                else:
+                    employees[name] = salary
+            raise
+        self._salary_index = salary_index
+
+    def save_many(self, employees) -> int:
+        """
+        Save many employees as one atomic batch.
+
+        Args:
+            employees (Iterable[Employee]): The employees to save, e.g. a generator.
+
+        Returns:
+            int: The number of distinct employees saved.
+        """
+        with self.batch() as batch:
+            for employee in employees:
+                batch.save(employee)
+            return len(batch)
+
+    def update_many(self, employees) -> int:
+        """
+        Update many employees as one atomic batch.
+
+        Args:
+            employees (Iterable[Employee]): The employees to update, e.g. a generator.
+
+        Returns:
+            int: The number of distinct employees updated.
+
+        Raises:
+            KeyError: If any employee is not stored, in which case nothing is updated.
+        """
+        with self.batch() as batch:
+            for employee in employees:
+                batch.update(employee)
+            return len(batch)
+
+    def delete_many(self, employees) -> int:
+        """
+        Delete many employees as one atomic batch.
+
+        Args:
+            employees (Iterable[Employee]): The employees to delete, e.g. a generator.
+
+        Returns:
+            int: The number of distinct employees deleted.
+
+        Raises:
+            KeyError: If any employee is not stored, in which case nothing is deleted.
+        """
+        with self.batch() as batch:
+            for employee in employees:
+                batch.delete(employee)
+            return len(batch)
+
+    def read_many(self, employees) -> list:
+        """
+        Read the stored versions of many employees.
+
+        Args:
+            employees (Iterable[Employee]): The employees to read, only their names are used.
+
+        Returns:
+            list[Employee]: The stored employees in input order, None for every employee that is not stored.
+        """
+        return [self.get(employee.name) for employee in employees]
+
+    def get(self, name: str):
+        """
+        Look up an employee by name.
+
+        Args:
+            name (str): The employee's name.
+
+        Returns:
+            Employee: The stored employee, or None if no employee with that name is stored.
+        """
+        salary = self._employees.get(name)
+        return None if salary is None else Employee(name, salary)
+
+    def salary_range(self, low: float, high: float) -> list:
+        """
+        Find every employee whose salary lies between low and high, both inclusive.
+
+        Args:
+            low (float): The lowest salary to include.
+            high (float): The highest salary to include.
+
+        Returns:
+            list[Employee]: The matching employees, ordered by salary and then name.
+        """
+        start = bisect_left(self._salary_index, (low,))
+        stop = bisect_left(self._salary_index, (math.nextafter(high, math.inf),))
+        return [Employee(name, salary) for salary, name in self._salary_index[start:stop]]
+
+    def top_k(self, k: int) -> list:
+        """
+        Find the k best-paid employees.
+
+        Args:
+            k (int): The number of employees to return.
+
+        Returns:
+            list[Employee]: Up to k employees, highest salary first.
+        """
+        if k <= 0:
+            return []
+        return [Employee(name, salary) for salary, name in reversed(self._salary_index[-k:])]
+
+
+# Example Usage
+if __name__ == "__main__":
+    employee_db = IndexedEmployeeDB([
+        Employee("John Doe", 50000),
+        Employee("Jane Roe", 62000),
+        Employee("Max Mustermann", 41000),
+        Employee("Erika Mustermann", 75000),
+    ])
+
+    print(employee_db.read(Employee("John Doe", 0)).get_details())
+
+    employee_db.update(Employee("John Doe", 58000))
+    employee_db.delete(Employee("Max Mustermann", 41000))
+
+    print("Earning 40k-60k:", [employee.get_details() for employee in employee_db.salary_range(40000, 60000)])
+    print("Top 2:", [employee.get_details() for employee in employee_db.top_k(2)])
+
+    employee_db.save_many(Employee(f"Employee {index}", 30000 + index) for index in range(100000))
+    try:
+        employee_db.update_many([Employee("Employee 1", 99000), Employee("Nobody", 1)])
+    except KeyError as error:
+        print(f"Batch rolled back, unknown employee {error}:", employee_db.get("Employee 1").get_details())
+    print(f"{len(employee_db)} employees after the bulk sync")
+
+"""
+Lookups by name are dictionary lookups and salary queries are binary searches over the sorted index, so neither scans
+every stored employee. IndexedEmployeeDB is a drop-in EmployeeDB, which keeps the responsibilities of Employee and its
+storage separate.
+"""
@@ -0,0 +1,449 @@
+"""
+Persistent Employee Databases
+
+Two EmployeeDB implementations that keep their data across restarts.
+
+MappedEmployeeDB stores employees as fixed-width records in a memory-mapped, append-only log. Saves, updates and
+deletes append a record instead of rewriting the file, and compaction periodically rewrites the log with only the
+latest record of every live employee. Names are found through an open-addressing hash table kept in a second
+memory-mapped file next to the log, so opening a store reads two headers instead of scanning the log, and no salary is
+decoded and no Employee object is created until it is read. The table is rebuilt from the log only if it is missing
+or does not match the log, and records appended after its last update (e.g. by a process that crashed) are replayed.
+
+SQLiteEmployeeDB keeps employees in a local SQLite table and serves as a baseline to benchmark against.
+
+File layout of MappedEmployeeDB:
+
+    log header:    b"EMPLOG01", uint64 end of the last record (little-endian)
+    log records:   uint8 operation (1 save, 2 delete), uint8 name length, uint8 salary type (0 float, 1 integer),
+                   5 padding bytes, float64 or int64 salary, 64 bytes of UTF-8 name
+    index header:  b"EMPIDX01", uint64 log end covered by the index, uint64 live employees, uint64 used slots
+    index slots:   uint64 offset of the employee's latest record (0 for an empty slot, 1 for a deleted one),
+                   uint64 CRC-32 of the name
+"""
+
+import mmap
+import os
+import sqlite3
+import struct
+import zlib
+
+from .single_responsibility_principle import Employee, EmployeeDB
+
+MAGIC = b"EMPLOG01"
+HEADER = struct.Struct("<8sQ")
+RECORD = struct.Struct("<BBB5xd64s")
+INTEGER_RECORD = struct.Struct("<BBB5xq64s")
+NAME_SIZE = 64
+SAVE, DELETE = 1, 2
+FLOAT, INTEGER = 0, 1
+INDEX_MAGIC = b"EMPIDX01"
+INDEX_HEADER = struct.Struct("<8sQQQ")
+_EMPTY, _DELETED = 0, 1
+_SLOT_SIZE = 16
+_SALARY_OFFSET = 8
+_NAME_OFFSET = 16
+_FLOAT64 = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+
+
+def _slot_count(employees: int) -> int:
+    # A power of two at least four times the number of employees, so the table is at most a quarter full after a
+    # resize and is resized again once half of its slots are used.
+    count = 1024
+    while count < 4 * employees:
+        count <<= 1
+    return count
+
+
+class MappedEmployeeDB(EmployeeDB):
+    """
+    An employee database stored in a memory-mapped, append-only log file and a hash index file next to it.
+
+    Integer salaries that fit in 64 bits are stored exactly, every other salary is stored as a float. Names are
+    limited to 64 bytes of UTF-8.
+
+    Attributes:
+        path (str): The log file. The index is kept in path + ".index".
+        compact_ratio (float): Compaction runs automatically once the log holds more than this many records per live
+            employee, None to compact only when compact is called.
+    """
+
+    def __init__(self, path: str, compact_ratio: float = 4.0, initial_capacity: int = 1 << 16):
+        """
+        Open the store, creating it if the file does not exist or is empty.
+
+        Raises:
+            ValueError: If the file is not empty and is not an employee log. The file is left untouched.
+        """
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self._index_path = f"{path}.index"
+        self._index_file = self._index_map = self._slots = None
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        self._file = open(path, "r+b" if size else "w+b")
+        if size and (size < HEADER.size or self._file.read(len(MAGIC)) != MAGIC):
+            self._file.close()
+            raise ValueError(f"{path} is not an employee log.")
+        if not size:
+            self._file.truncate(HEADER.size + initial_capacity * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        if size:
+            _, self._end = HEADER.unpack_from(self._map)
+            self._open_index()
+        else:
+            self._end = self._indexed_end = HEADER.size
+            self._write_header()
+            self._create_index(_slot_count(initial_capacity // 2), ())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, employee: Employee) -> bool:
+        encoded = employee.name.encode("utf-8")
+        return self._find(encoded, zlib.crc32(encoded))[1] is not None
+
+    def _write_header(self):
+        HEADER.pack_into(self._map, 0, MAGIC, self._end)
+
+    def _write_index_header(self):
+        INDEX_HEADER.pack_into(self._index_map, 0, INDEX_MAGIC, self._indexed_end, self._live, self._used)
+
+    def _open_index(self):
+        # Reuse the index if it covers a prefix of this log, otherwise rebuild it from every record.
+        if os.path.exists(self._index_path) and os.path.getsize(self._index_path) > INDEX_HEADER.size:
+            self._index_file = open(self._index_path, "r+b")
+            self._index_map = mmap.mmap(self._index_file.fileno(), 0)
+            magic, end, live, used = INDEX_HEADER.unpack_from(self._index_map)
+            slots = (len(self._index_map) - INDEX_HEADER.size) // _SLOT_SIZE
+            if magic == INDEX_MAGIC and HEADER.size <= end <= self._end and (end - HEADER.size) % RECORD.size == 0 \
+                    and slots & (slots - 1) == 0 and used * 2 <= slots:
+                self._slots = memoryview(self._index_map)[INDEX_HEADER.size:].cast("Q")
+                self._live, self._used, self._indexed_end = live, used, end
+                self._replay(end)
+                return
+        self._indexed_end = HEADER.size
+        self._create_index(_slot_count((self._end - HEADER.size) // RECORD.size // 2), ())
+        self._replay(HEADER.size)
+
+    def _create_index(self, slot_count: int, entries):
+        # Write a new table with slot_count slots holding entries, (offset, name hash) pairs of distinct names. The
+        # hashes are stored, so resizing never reads names back from the log.
+        self._close_index()
+        self._index_file = open(self._index_path, "w+b")
+        self._index_file.truncate(INDEX_HEADER.size + slot_count * _SLOT_SIZE)
+        self._index_map = mmap.mmap(self._index_file.fileno(), 0)
+        self._slots = slots = memoryview(self._index_map)[INDEX_HEADER.size:].cast("Q")
+        mask = slot_count - 1
+        self._live = self._used = 0
+        for offset, code in entries:
+            position = code & mask
+            while slots[2 * position] != _EMPTY:
+                position = (position + 1) & mask
+            slots[2 * position] = offset
+            slots[2 * position + 1] = code
+            self._live += 1
+            self._used += 1
+        self._write_index_header()
+
+    def _entries(self) -> list:
+        slots = self._slots
+        return [(slots[index], slots[index + 1]) for index in range(0, len(slots), 2) if slots[index] > _DELETED]
+
+    def _close_index(self):
+        if self._slots is not None:
+            self._slots.release()
+            self._slots = None
+        if self._index_map is not None and not self._index_map.closed:
+            self._index_map.flush()
+            self._index_map.close()
+        if self._index_file is not None:
+            self._index_file.close()
+
+    def _replay(self, start: int):
+        # Apply the records from start to the end of the log to the index. Until this finishes the index header still
+        # claims to cover the log up to start only, and replaying records the index already reflects is harmless.
+        for offset in range(start, self._end, RECORD.size):
+            encoded = self._name_at(offset)
+            code = zlib.crc32(encoded)
+            position, existing = self._find(encoded, code)
+            if self._map[offset] == SAVE:
+                self._set(position, existing, offset, code)
+            elif existing is not None:
+                self._remove(position)
+        self._indexed_end = self._end
+        self._write_index_header()
+
+    def _name_at(self, offset: int) -> bytes:
+        return self._map[offset + _NAME_OFFSET:offset + _NAME_OFFSET + self._map[offset + 1]]
+
+    def _find(self, encoded: bytes, code: int) -> tuple:
+        """
+        Look up a name in the hash table with linear probing.
+
+        Args:
+            encoded (bytes): The UTF-8 encoded name.
+            code (int): The CRC-32 of encoded.
+
+        Returns:
+            tuple[int, int | None]: The slot holding the name and the offset of its latest record, or the slot where
+                the name would be inserted and None.
+        """
+        mapped = self._map
+        slots = self._slots
+        mask = (len(slots) >> 1) - 1
+        length = len(encoded)
+        position = code & mask
+        free = None
+        while True:
+            offset = slots[2 * position]
+            if offset == _EMPTY:
+                return (position if free is None else free), None
+            if offset == _DELETED:
+                if free is None:
+                    free = position
+            elif slots[2 * position + 1] == code and mapped[offset + 1] == length and \
+                    mapped[offset + _NAME_OFFSET:offset + _NAME_OFFSET + length] == encoded:
+                return position, offset
+            position = (position + 1) & mask
+
+    def _set(self, position: int, existing, offset: int, code: int):
+        slots = self._slots
+        if existing is None:
+            if slots[2 * position] == _EMPTY:
+                self._used += 1
+            self._live += 1
+            slots[2 * position + 1] = code
+        slots[2 * position] = offset
+        if self._used * 4 > len(slots):
+            self._create_index(_slot_count(self._live), self._entries())
+
+    def _remove(self, position: int):
+        self._slots[2 * position] = _DELETED
+        self._live -= 1
+
+    def _append(self, operation: int, encoded: bytes, salary) -> int:
+        if self._end + RECORD.size > len(self._map):
+            self._map.close()
+            self._file.truncate(2 * (self._end - HEADER.size) + HEADER.size + RECORD.size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        offset = self._end
+        if isinstance(salary, int) and -1 << 63 <= salary < 1 << 63:
+            INTEGER_RECORD.pack_into(self._map, offset, operation, len(encoded), INTEGER, salary, encoded)
+        else:
+            RECORD.pack_into(self._map, offset, operation, len(encoded), FLOAT, salary, encoded)
+        self._end += RECORD.size
+        self._write_header()
+        return offset
+
+    def _after_write(self):
+        self._indexed_end = self._end
+        self._write_index_header()
+        records = (self._end - HEADER.size) // RECORD.size
+        if self.compact_ratio is not None and records > 1024 and records > self.compact_ratio * max(1, self._live):
+            self.compact()
+
+    @staticmethod
+    def _encode(name: str) -> bytes:
+        encoded = name.encode("utf-8")
+        if len(encoded) > NAME_SIZE:
+            raise ValueError(f"Employee names are limited to {NAME_SIZE} bytes.")
+        return encoded
+
+    def save(self, employee: Employee):
+        """
+        Save the employee, replacing any stored employee with the same name.
+
+        Args:
+            employee (Employee): The employee object to save.
+        """
+        encoded = self._encode(employee.name)
+        code = zlib.crc32(encoded)
+        position, existing = self._find(encoded, code)
+        self._set(position, existing, self._append(SAVE, encoded, employee.salary), code)
+        self._after_write()
+
+    def delete(self, employee: Employee):
+        """
+        Delete the employee from the database.
+
+        Args:
+            employee (Employee): The employee object to delete.
+
+        Raises:
+            KeyError: If no employee with that name is stored.
+        """
+        encoded = employee.name.encode("utf-8")
+        position, existing = self._find(encoded, zlib.crc32(encoded))
+        if existing is None:
+            raise KeyError(employee.name)
+        self._append(DELETE, encoded, 0.0)
+        self._remove(position)
+        self._after_write()
+
+    def read(self, employee: Employee):
+        """
+        Read the stored version of the employee.
+
+        Args:
+            employee (Employee): The employee object to read, only its name is used.
+
+        Returns:
+            Employee: The stored employee, or None if no employee with that name is stored.
+        """
+        encoded = employee.name.encode("utf-8")
+        offset = self._find(encoded, zlib.crc32(encoded))[1]
+        if offset is None:
+            return None
+        salary = _INT64 if self._map[offset + 2] == INTEGER else _FLOAT64
+        return Employee(employee.name, salary.unpack_from(self._map, offset + _SALARY_OFFSET)[0])
+
+    def update(self, employee: Employee):
+        """
+        Update the stored employee with the same name.
+
+        Args:
+            employee (Employee): The employee object to update.
+
+        Raises:
+            KeyError: If no employee with that name is stored.
+        """
+        if employee not in self:
+            raise KeyError(employee.name)
+        self.save(employee)
+
+    def compact(self):
+        """
+        Rewrite the log so that it only holds the latest record of every live employee, and rebuild the index.
+        """
+        live = self._entries()
+        temporary = f"{self.path}.compact"
+        with open(temporary, "wb") as target:
+            target.write(HEADER.pack(MAGIC, HEADER.size + len(live) * RECORD.size))
+            for source, _ in live:
+                target.write(self._map[source:source + RECORD.size])
+        # Remove the index first: an old index must never be paired with the compacted log.
+        self._close_index()
+        os.remove(self._index_path)
+        self._map.close()
+        self._file.close()
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "r+b")
+        self._end = self._indexed_end = HEADER.size + len(live) * RECORD.size
+        self._file.truncate(self._end + max(1024, len(live)) * RECORD.size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._create_index(_slot_count(len(live)),
+                           zip(range(HEADER.size, self._end, RECORD.size), (code for _, code in live)))
+
+    def flush(self):
+        """
+        Write every change through to disk.
+        """
+        self._map.flush()
+        self._index_map.flush()
+
+    def close(self):
+        """
+        Flush the store and close its files.
+        """
+        self._close_index()
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+        self._file.close()
+
+
+class SQLiteEmployeeDB(EmployeeDB):
+    """
+    An employee database stored in a local SQLite file, used as a benchmark baseline.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        # The salary column has no type affinity, so integer salaries come back as integers, like in the other stores.
+        self._connection.execute("CREATE TABLE IF NOT EXISTS employees (name TEXT PRIMARY KEY, salary NOT NULL)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS employees_salary ON employees (salary)")
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM employees").fetchone()[0]
+
+    def save(self, employee: Employee):
+        with self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO employees VALUES (?, ?)", (employee.name, employee.salary))
+
+    def save_many(self, employees):
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO employees VALUES (?, ?)",
+                                         ((employee.name, employee.salary) for employee in employees))
+
+    def delete(self, employee: Employee):
+        with self._connection:
+            if not self._connection.execute("DELETE FROM employees WHERE name = ?", (employee.name,)).rowcount:
+                raise KeyError(employee.name)
+
+    def read(self, employee: Employee):
+        row = self._connection.execute("SELECT salary FROM employees WHERE name = ?", (employee.name,)).fetchone()
+        return None if row is None else Employee(employee.name, row[0])
+
+    def update(self, employee: Employee):
+        with self._connection:
+            if not self._connection.execute("UPDATE employees SET salary = ? WHERE name = ?",
+                                            (employee.salary, employee.name)).rowcount:
+                raise KeyError(employee.name)
+
+    def close(self):
+        self._connection.close()
+
+
+# Example Usage
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    count = 2000
+    with tempfile.TemporaryDirectory() as directory:
+        for name, open_db in (("mmap", lambda: MappedEmployeeDB(os.path.join(directory, "employees.log"))),
+                              ("sqlite", lambda: SQLiteEmployeeDB(os.path.join(directory, "employees.sqlite")))):
+            with open_db() as employee_db:
+                started = time.perf_counter()
+                for index in range(count):
+                    employee_db.save(Employee(f"Employee {index}", 30000 + index))
+                saved = time.perf_counter() - started
+
+            started = time.perf_counter()
+            with open_db() as employee_db:
+                opened = time.perf_counter() - started
+                started = time.perf_counter()
+                for index in range(count):
+                    employee_db.read(Employee(f"Employee {index}", 0))
+                read = time.perf_counter() - started
+                print(f"{name}: {count} saves {saved:.3f}s, cold open {opened:.4f}s, {count} reads {read:.3f}s, "
+                      f"{employee_db.read(Employee('Employee 42', 0)).get_details()}")
+
+        notes = os.path.join(directory, "notes.txt")
+        with open(notes, "w") as file:
+            file.write("hi")
+        try:
+            MappedEmployeeDB(notes)
+        except ValueError as error:
+            print(f"{error} Its size is still {os.path.getsize(notes)} bytes.")
+
+"""
+Both stores keep EmployeeDB's interface, so the rest of the code does not know where employees are persisted. The
+memory-mapped log only ever appends fixed-width records, and reading an employee probes the index and decodes that
+single record.
+"""
@@ -52,11 +52,35 @@ class Employee:
 
     Responsibilities:
     - Manage employee properties (name and salary).
+
+    The formatted details are kept until name or salary is assigned again, so reports that call get_details for
+    every employee on every run only format the employees that changed.
     """
 
+    __slots__ = ("_name", "_salary", "_details")
+
     def __init__(self, name: str, salary: float):
-        self.name = name
-        self.salary = salary
+        self._name = name
+        self._salary = salary
+        self._details = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+        self._details = None
+
+    @property
+    def salary(self) -> float:
+        return self._salary
+
+    @salary.setter
+    def salary(self, value: float):
+        self._salary = value
+        self._details = None
 
     def get_details(self) -> str:
         """
@@ -65,7 +89,10 @@ class Employee:
         Returns:
             str: Formatted details of the employee.
         """
-        return f"Employee: {self.name}, Salary: {self.salary}"
+        details = self._details
+        if details is None:
+            details = self._details = f"Employee: {self._name}, Salary: {self._salary}"
+        return details
 
 class EmployeeDB:
     """
@@ -76,8 +103,15 @@ class EmployeeDB:
     - Delete employee data from the database.
     - Read employee data from the database.
     - Update employee data from the database.
+
+    Attributes:
+        output (Callable[[str], None]): Receives the log messages, print by default. Inject a buffered, background or
+            null sink to take the console writes off the hot path.
     """
 
+    def __init__(self, output=print):
+        self.output = output
+
     def save(self, employee: Employee):
         """
         Simulate saving the employee to the database.
@@ -85,7 +119,7 @@ class EmployeeDB:
         Args:
             employee (Employee): The employee object to save.
         """
-        print(f"Saved employee {employee.name} to the database.")
+        self.output(f"Saved employee {employee.name} to the database.")
 
     def delete(self, employee: Employee):
         """
@@ -94,7 +128,7 @@ class EmployeeDB:
         Args:
             employee (Employee): The employee object to delete.
         """
-        print(f"Deleted employee {employee.name} from the database.")
+        self.output(f"Deleted employee {employee.name} from the database.")
 
     def read(self, employee: Employee):
         """
@@ -103,7 +137,7 @@ class EmployeeDB:
         Args:
             employee (Employee): The employee object to read.
         """
-        print(f"Read employee {employee.name} from the database.")
+        self.output(f"Read employee {employee.name} from the database.")
 
     def update(self, employee: Employee):
         """
@@ -112,7 +146,7 @@ class EmployeeDB:
         Args:
             employee (Employee): The employee object to update.
         """
-        print(f"Updated employee {employee.name} in the database.")
+        self.output(f"Updated employee {employee.name} in the database.")
 
 """
 By separating responsibilities, the Employee class now solely manages employee data,
@@ -130,9 +164,10 @@ A common solution to this dilemma is to apply the Facade Pattern.
 """
 Below is an example for using the above defined classes
 """
-employee = Employee("John Doe", 50000)
+if __name__ == "__main__":
+    employee = Employee("John Doe", 50000)
 
-print(employee.get_details())
+    print(employee.get_details())
 
-employee_db = EmployeeDB()
-employee_db.save(employee)
+    employee_db = EmployeeDB()
+    employee_db.save(employee)
@@ -0,0 +1,104 @@
+"""
+SOLID Principles Package
+
+The examples live in folders named after each principle ("SOLID Principles/Open-Closed Principle" and so on), which are
+not importable package names. Each folder is mapped to a subpackage (solid_principles.open_closed and so on, see their
+__path__), so its modules import as solid_principles.open_closed.shape_store without adding anything to sys.path. This
+package also exposes their public classes and functions under one import:
+
+    from solid_principles import Rectangle, DataProcessor, EmployeeDB
+
+Nothing is loaded when the package itself is imported. Each name is resolved on first access (PEP 562 module
+__getattr__), which imports only the module defining it and the modules that one depends on. The example code of
+every module runs only when the module is run with "python -m", e.g. python -m solid_principles.open_closed.shape_store.
+"""
+
+_EXPORTS = {
+    # Single Responsibility Principle
+    "Employee": "single_responsibility.single_responsibility_principle",
+    "EmployeeDB": "single_responsibility.single_responsibility_principle",
+    "CachedEmployeeDB": "single_responsibility.cached_employee_db",
+    "render_report": "single_responsibility.employee_report",
+    "write_report": "single_responsibility.employee_report",
+    "EmployeeService": "single_responsibility.employee_service",
+    "UnitOfWork": "single_responsibility.employee_service",
+    "EmployeeTable": "single_responsibility.employee_table",
+    "EmployeeView": "single_responsibility.employee_table",
+    "EmployeeBatch": "single_responsibility.indexed_employee_db",
+    "IndexedEmployeeDB": "single_responsibility.indexed_employee_db",
+    "MappedEmployeeDB": "single_responsibility.persistent_employee_db",
+    "SQLiteEmployeeDB": "single_responsibility.persistent_employee_db",
+    # Open-Closed Principle
+    "Shape": "open_closed.open_closed_principle",
+    "Rectangle": "open_closed.open_closed_principle",
+    "Circle": "open_closed.open_closed_principle",
+    "Triangle": "open_closed.open_closed_principle",
+    "LegacyShape": "open_closed.open_closed_principle",
+    "register_shape_type": "open_closed.legacy_shape_registry",
+    "unregister_shape_type": "open_closed.legacy_shape_registry",
+    "parallel_areas": "open_closed.parallel_areas",
+    "AreaKernel": "open_closed.shape_batch",
+    "ShapeBatch": "open_closed.shape_batch",
+    "calculate_areas": "open_closed.shape_batch",
+    "register_area_kernel": "open_closed.shape_batch",
+    "ShapeStore": "open_closed.shape_store",
+    "ShapeView": "open_closed.shape_store",
+    "AreaStatistics": "open_closed.shape_stream",
+    "aggregate_areas": "open_closed.shape_stream",
+    "read_binary_chunks": "open_closed.shape_stream",
+    "read_csv_chunks": "open_closed.shape_stream",
+    "write_binary": "open_closed.shape_stream",
+    # Liskov Substitution Principle
+    "Bird": "liskov_substitution.liskov_substitution",
+    "BirdCapability": "liskov_substitution.liskov_substitution",
+    "FlyingBird": "liskov_substitution.liskov_substitution",
+    "Sparrow": "liskov_substitution.liskov_substitution",
+    "Ostrich": "liskov_substitution.liskov_substitution",
+    "describe_bird": "liskov_substitution.liskov_substitution",
+    "describe_birds": "liskov_substitution.bird_batch",
+    "format_description": "liskov_substitution.bird_batch",
+    "BirdFactory": "liskov_substitution.bird_flyweight",
+    "Flock": "liskov_substitution.bird_flyweight",
+    # Interface Segregation Principle
+    "Printable": "interface_segregation.interface_segregation_principle",
+    "Scannable": "interface_segregation.interface_segregation_principle",
+    "Faxable": "interface_segregation.interface_segregation_principle",
+    "AllInOnePrinter": "interface_segregation.interface_segregation_principle",
+    "BasicPrinter": "interface_segregation.interface_segregation_principle",
+    "DeviceRegistry": "interface_segregation.device_registry",
+    "PrintSpooler": "interface_segregation.print_spooler",
+    "StreamPrintable": "interface_segregation.streaming_print",
+    "PrintableStreamAdapter": "interface_segregation.streaming_print",
+    "StreamingPrinter": "interface_segregation.streaming_print",
+    # Dependency Inversion Principle
+    "Database": "dependency_inversion.dependency_inversion_principle",
+    "MySQLDatabase": "dependency_inversion.dependency_inversion_principle",
+    "PostgreSQLDatabase": "dependency_inversion.dependency_inversion_principle",
+    "DataProcessor": "dependency_inversion.dependency_inversion_principle",
+    "AsyncDatabase": "dependency_inversion.async_data_processor",
+    "AsyncDataProcessor": "dependency_inversion.async_data_processor",
+    "ThreadedDatabaseAdapter": "dependency_inversion.async_data_processor",
+    "BufferedDataProcessor": "dependency_inversion.buffered_data_processor",
+    "PooledDatabase": "dependency_inversion.database_pool",
+    "OutputSink": "dependency_inversion.output_sinks",
+    "BufferedSink": "dependency_inversion.output_sinks",
+    "BackgroundSink": "dependency_inversion.output_sinks",
+    "NullSink": "dependency_inversion.output_sinks",
+    "ReplicatedDatabase": "dependency_inversion.replicated_database",
+    "ReplicationError": "dependency_inversion.replicated_database",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib.import_module, so "python -X importtime" reports the modules it loads.
+    value = globals()[name] = getattr(__import__(f"{__name__}.{module}", fromlist=[name]), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,304 @@
+"""
+Benchmarks
+
+Measures the hot paths of the five principle examples at several data sizes, saves the results as a JSON baseline and
+compares two baselines for throughput and memory regressions.
+
+    python -m solid_principles.benchmarks run --sizes 1e3 1e4 1e5 --output baseline.json
+    python -m solid_principles.benchmarks run --sizes 1e3 1e4 1e5 --output current.json
+    python -m solid_principles.benchmarks compare baseline.json current.json --threshold 10
+
+Every benchmark builds its data first and only times the operation itself. The time reported is the fastest of
+several repeats; peak memory is measured in a separate, untimed run with tracemalloc, because tracing slows Python code
+down. compare exits with status 1 when a benchmark lost more throughput, or gained more peak memory, than the threshold.
+Sizes up to 1e7 are supported, but the largest sizes need several gigabytes of memory and minutes per benchmark.
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import solid_principles
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_THRESHOLD = 10.0
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark.
+
+    The decorated function receives the data size, builds its data and returns a function without arguments that
+    performs the measured work.
+
+    Args:
+        name (str): The benchmark name used in baselines.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+class _NullWriter:
+    # Discards the output of the examples that print, so the terminal is not part of the measurement.
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def writelines(self, lines):
+        for _ in lines:
+            pass
+
+    def flush(self):
+        pass
+
+
+def _shapes(size: int) -> list:
+    kinds = (lambda index: solid_principles.Rectangle(index % 7 + 1, index % 5 + 1),
+             lambda index: solid_principles.Circle(index % 3 + 1),
+             lambda index: solid_principles.Triangle(index % 11 + 1, index % 4 + 1))
+    return [kinds[index % 3](index) for index in range(size)]
+
+
+@benchmark("shape.calculate_area")
+def _shape_calculate_area(size: int):
+    shapes = _shapes(size)
+    return lambda: [shape.calculate_area() for shape in shapes]
+
+
+@benchmark("shape.calculate_areas")
+def _shape_calculate_areas(size: int):
+    shapes = _shapes(size)
+    calculate_areas = solid_principles.calculate_areas
+    return lambda: calculate_areas(shapes)
+
+
+@benchmark("shape_batch.calculate_areas")
+def _shape_batch_calculate_areas(size: int):
+    batch = solid_principles.ShapeBatch(_shapes(size))
+    return batch.calculate_areas
+
+
+@benchmark("data_processor.process_data")
+def _data_processor(size: int):
+    class FakeDatabase(solid_principles.Database):
+        def __init__(self):
+            self.saved = 0
+
+        def connect(self):
+            pass
+
+        def save_data(self, data: str):
+            self.saved += 1
+
+    processor = solid_principles.DataProcessor(FakeDatabase())
+    records = [f"record {index}" for index in range(size)]
+
+    def run():
+        with contextlib.redirect_stdout(_NullWriter()):
+            for record in records:
+                processor.process_data(record)
+    return run
+
+
+@benchmark("employee_db.crud")
+def _employee_crud(size: int):
+    database = solid_principles.EmployeeDB()
+    employees = [solid_principles.Employee(f"Employee {index}", 40000 + index) for index in range(size)]
+
+    def run():
+        with contextlib.redirect_stdout(_NullWriter()):
+            for employee in employees:
+                database.save(employee)
+                database.read(employee)
+                database.update(employee)
+                database.delete(employee)
+    return run
+
+
+@benchmark("employee.get_details")
+def _employee_get_details(size: int):
+    employees = [solid_principles.Employee(f"Employee {index}", 40000 + index) for index in range(size)]
+    return lambda: [employee.get_details() for employee in employees]
+
+
+@benchmark("bird.describe_bird")
+def _describe_bird(size: int):
+    kinds = (solid_principles.Sparrow, solid_principles.Ostrich)
+    birds = [kinds[index % 2]() for index in range(size)]
+    describe_bird = solid_principles.describe_bird
+
+    def run():
+        with contextlib.redirect_stdout(_NullWriter()):
+            for bird in birds:
+                describe_bird(bird)
+    return run
+
+
+@benchmark("printer.isinstance_dispatch")
+def _printer_dispatch(size: int):
+    kinds = (solid_principles.AllInOnePrinter, solid_principles.BasicPrinter)
+    printers = [kinds[index % 2]() for index in range(size)]
+    Scannable, Faxable = solid_principles.Scannable, solid_principles.Faxable
+
+    def run():
+        for printer in printers:
+            printer.print_document("Hello World")
+            if isinstance(printer, Scannable):
+                printer.scan_document()
+            if isinstance(printer, Faxable):
+                printer.fax_document()
+    return run
+
+
+def measure(name: str, size: int, repeat: int = 5) -> dict:
+    """
+    Run one benchmark at one size.
+
+    Args:
+        name (str): A registered benchmark name.
+        size (int): The number of items to process.
+        repeat (int): The number of timed runs. The fastest one is reported.
+
+    Returns:
+        dict: The benchmark name, size, seconds, items per second and peak traced memory in bytes.
+    """
+    run = BENCHMARKS[name](size)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "name": name,
+        "size": size,
+        "seconds": best,
+        "ops_per_sec": size / best if best > 0 else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, names=None, repeat: int = 5, report=None) -> dict:
+    """
+    Run benchmarks at every size.
+
+    Args:
+        sizes (Iterable[int]): The data sizes.
+        names (Iterable[str], optional): The benchmarks to run. Defaults to all of them.
+        repeat (int): The number of timed runs per benchmark and size.
+        report (Callable[[dict], None], optional): Called with every result as soon as it is measured.
+
+    Returns:
+        dict: A baseline holding the interpreter details and the list of results.
+    """
+    results = []
+    for name in names or BENCHMARKS:
+        for size in sizes:
+            result = measure(name, size, repeat)
+            results.append(result)
+            if report is not None:
+                report(result)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD,
+            memory_threshold: float = None) -> list:
+    """
+    Compare two baselines.
+
+    Args:
+        baseline (dict): The reference results, as returned by run_suite.
+        current (dict): The new results.
+        threshold (float): The allowed throughput loss in percent.
+        memory_threshold (float, optional): The allowed peak memory growth in percent. Defaults to threshold.
+
+    Returns:
+        list[dict]: One row per benchmark and size present in both baselines, with the throughput and memory change
+            in percent and whether either is a regression.
+    """
+    if memory_threshold is None:
+        memory_threshold = threshold
+    reference = {(result["name"], result["size"]): result for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        before = reference.get((result["name"], result["size"]))
+        if before is None:
+            continue
+        throughput = (result["ops_per_sec"] / before["ops_per_sec"] - 1) * 100
+        memory = (result["peak_bytes"] / before["peak_bytes"] - 1) * 100 if before["peak_bytes"] else 0.0
+        rows.append({
+            "name": result["name"],
+            "size": result["size"],
+            "throughput_change": throughput,
+            "memory_change": memory,
+            "regressed": throughput < -threshold or memory > memory_threshold,
+        })
+    return rows
+
+
+def _size(text: str) -> int:
+    return int(float(text))
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SOLID principle examples.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks and optionally save a baseline")
+    run_parser.add_argument("--sizes", type=_size, nargs="+", default=DEFAULT_SIZES, help="data sizes, e.g. 1e3 1e6")
+    run_parser.add_argument("--benchmarks", nargs="+", choices=sorted(BENCHMARKS), help="benchmarks to run")
+    run_parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark, the fastest counts")
+    run_parser.add_argument("--output", help="where to save the JSON baseline")
+
+    compare_parser = commands.add_parser("compare", help="compare two baselines")
+    compare_parser.add_argument("baseline", help="the reference JSON baseline")
+    compare_parser.add_argument("current", help="the JSON baseline to check")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="allowed throughput loss in percent")
+    compare_parser.add_argument("--memory-threshold", type=float, help="allowed peak memory growth in percent")
+
+    options = parser.parse_args(arguments)
+
+    if options.command == "run":
+        def report(result: dict):
+            print(f"{result['name']:<32} {result['size']:>10} {result['ops_per_sec']:>14,.0f} ops/s "
+                  f"{result['peak_bytes']:>14,} bytes peak")
+
+        suite = run_suite(options.sizes, options.benchmarks, options.repeat, report)
+        if options.output:
+            with open(options.output, "w") as file:
+                json.dump(suite, file, indent=2)
+        return 0
+
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+    with open(options.current) as file:
+        current = json.load(file)
+    rows = compare(baseline, current, options.threshold, options.memory_threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regressed"] else "ok"
+        print(f"{row['name']:<32} {row['size']:>10} throughput {row['throughput_change']:+7.1f}% "
+              f"memory {row['memory_change']:+7.1f}%  {flag}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
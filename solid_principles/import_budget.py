@@ -0,0 +1,106 @@
+"""
+Import Time Budget
+
+Checks that importing the package stays cheap and silent. Every check runs in a fresh interpreter, so nothing is
+already cached in sys.modules. It fails if the cold import of the package and of the names accessed through it takes
+longer than the total budget, if any single example module takes longer than the module budget, or if importing
+prints anything.
+
+    python -m solid_principles.import_budget                       # every exported name
+    python -m solid_principles.import_budget Rectangle EmployeeDB --budget-ms 100
+
+The total is measured with time.perf_counter inside the fresh interpreter; the per-module times come from
+"python -X importtime". The exit status is 1 when a check fails, so the command can gate a CI job.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 300.0
+DEFAULT_MODULE_BUDGET_MS = 25.0
+
+_REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_MARKER = "solid_principles import seconds:"
+
+_SCRIPT = f"""
+import sys, time
+started = time.perf_counter()
+import solid_principles
+for name in sys.argv[1:]:
+    getattr(solid_principles, name)
+sys.stderr.write("{_MARKER} %r\\n" % (time.perf_counter() - started))
+"""
+
+
+def measure_import(names=(), repeat: int = 3) -> tuple:
+    """
+    Measure the cold import of the package and of some of its names in fresh interpreters.
+
+    Args:
+        names (Iterable[str]): Names to access after importing the package, e.g. "Rectangle".
+        repeat (int): The number of fresh interpreters to run. The fastest run is reported.
+
+    Returns:
+        tuple[float, dict[str, float], str]: The total import time in milliseconds, the time each module of the
+            package spent importing itself (excluding the modules it imports) in milliseconds, from the fastest run,
+            and anything the import printed.
+    """
+    environment = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    best = None
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", _SCRIPT, *names], cwd=_REPOSITORY,
+                                   env=environment, capture_output=True, text=True, check=True)
+        total, modules = _parse_report(completed.stderr)
+        if best is None or total < best[0]:
+            best = (total, modules, completed.stdout)
+    return best
+
+
+def _parse_report(report: str) -> tuple:
+    # Each importtime line reads "import time: self [us] | cumulative | name", with nested imports indented.
+    total = 0.0
+    modules = {}
+    for line in report.splitlines():
+        if line.startswith(_MARKER):
+            total = float(line[len(_MARKER):]) * 1000
+        elif line.startswith("import time:") and line.count("|") == 2:
+            own, _, name = line[len("import time:"):].split("|")
+            name = name.strip()
+            if name.startswith("solid_principles") and own.strip().isdigit():
+                modules[name] = int(own) / 1000
+    return total, modules
+
+
+def main(arguments=None) -> int:
+    import solid_principles
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="names to access after importing the package, default all of them")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="the total import time budget")
+    parser.add_argument("--module-budget-ms", type=float, default=DEFAULT_MODULE_BUDGET_MS,
+                        help="the import time budget of each module")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters to run, the fastest counts")
+    options = parser.parse_args(arguments)
+
+    names = options.names or solid_principles.__all__
+    elapsed, modules, output = measure_import(names, options.repeat)
+    target = ", ".join(options.names) or "every exported name"
+    print(f"Importing {target}: {elapsed:.1f} ms in {len(modules)} modules (budget {options.budget_ms:.1f} ms)")
+    failed = False
+    if output:
+        print(f"FAIL: importing printed output:\n{output}")
+        failed = True
+    if elapsed > options.budget_ms:
+        print("FAIL: over the import time budget")
+        failed = True
+    for name, own in sorted(modules.items(), key=lambda item: -item[1]):
+        if own > options.module_budget_ms:
+            print(f"FAIL: {name} took {own:.1f} ms (module budget {options.module_budget_ms:.1f} ms)")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""
+Instrumentation
+
+Records how often the operations of the example classes run, how long they take and how large their payloads are:
+Database.connect/save_data/save_many, EmployeeDB.save/read/update/delete and the printer operations
+print_document/scan_document/fax_document.
+
+Instrumentation.attach wraps the operations of a class in place and detach restores the original methods, so a class
+that is not attached runs exactly as before, with no overhead at all. While attached, disabling the instrumentation
+leaves only the wrapper call and a flag check, and sampling times only every n-th call; call counts stay exact.
+Metrics are handed to pluggable exporters: InMemoryExporter keeps snapshots for inspection and PrometheusExporter
+renders the Prometheus text exposition format.
+
+    instrumentation = Instrumentation(sample_rate=0.1, exporters=[PrometheusExporter("metrics.prom")])
+    instrumentation.attach(MySQLDatabase)
+    ...
+    instrumentation.export()
+"""
+
+import functools
+import itertools
+import threading
+import time
+from bisect import bisect_left
+
+DEFAULT_OPERATIONS = (
+    "connect", "save_data", "save_many",
+    "save", "read", "update", "delete",
+    "print_document", "scan_document", "fax_document",
+)
+
+# Upper bounds of the latency histogram buckets, in seconds.
+DEFAULT_BUCKETS = (0.000_01, 0.000_1, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+
+def payload_size(args: tuple) -> int:
+    """
+    Return the size of an operation's payload: the length of its first argument if it is a string, a buffer or a
+    batch of records, otherwise 0.
+
+    Args:
+        args (tuple): The positional arguments of the call, without self.
+
+    Returns:
+        int: Characters, bytes or records.
+    """
+    if not args:
+        return 0
+    payload = args[0]
+    if isinstance(payload, memoryview):
+        return payload.nbytes
+    if isinstance(payload, (str, bytes, bytearray, list, tuple)):
+        return len(payload)
+    return 0
+
+
+class OperationMetrics:
+    """
+    The metrics of one operation.
+
+    Attributes:
+        calls (int): Every call, sampled or not.
+        sampled (int): Calls whose latency and payload were recorded.
+        errors (int): Sampled calls that raised.
+        latency_sum (float): Summed latency of the sampled calls, in seconds.
+        bucket_counts (list[int]): Sampled calls per latency bucket, the last one counting calls above every bound.
+        payload_sum (int): Summed payload size of the sampled calls.
+    """
+
+    __slots__ = ("calls", "sampled", "errors", "latency_sum", "bucket_counts", "payload_sum")
+
+    def __init__(self, bucket_count: int):
+        self.calls = 0
+        self.sampled = 0
+        self.errors = 0
+        self.latency_sum = 0.0
+        self.bucket_counts = [0] * (bucket_count + 1)
+        self.payload_sum = 0
+
+    def copy(self):
+        other = OperationMetrics(len(self.bucket_counts) - 1)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            setattr(other, name, list(value) if isinstance(value, list) else value)
+        return other
+
+
+class MetricsSnapshot:
+    """
+    A consistent copy of every operation's metrics, as handed to exporters.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds of the latency buckets, in seconds.
+        operations (dict[str, OperationMetrics]): The metrics per operation, e.g. "MySQLDatabase.save_data".
+        taken_at (float): When the snapshot was taken, from time.time.
+    """
+
+    def __init__(self, buckets: tuple, operations: dict):
+        self.buckets = buckets
+        self.operations = operations
+        self.taken_at = time.time()
+
+
+class _Operation:
+    __slots__ = ("metrics", "counter", "peeks")
+
+    def __init__(self, bucket_count: int):
+        self.metrics = OperationMetrics(bucket_count)
+        # next() on itertools.count is atomic, so calls are counted without taking the lock. Reading the count also
+        # advances it, so snapshots keep track of how many values they consumed.
+        self.counter = itertools.count(1)
+        self.peeks = 0
+
+    def calls(self) -> int:
+        self.peeks += 1
+        return next(self.counter) - self.peeks
+
+
+class Instrumentation:
+    """
+    Collects per-operation metrics from the classes attached to it.
+
+    Attributes:
+        enabled (bool): Record metrics. When False, attached operations skip counting, timing and sampling.
+        sample_every (int): Time one call in this many; 1 records every call.
+        buckets (tuple[float, ...]): The upper bounds of the latency buckets, in seconds.
+        exporters (list): Objects with an export(snapshot) method, called by export.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, exporters=(), buckets=DEFAULT_BUCKETS, clock=time.perf_counter,
+                 payload=payload_size):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1].")
+        self.enabled = True
+        self.sample_every = max(1, round(1 / sample_rate))
+        self.buckets = tuple(sorted(buckets))
+        self.exporters = list(exporters)
+        self._clock = clock
+        self._payload = payload
+        self._operations = {}
+        self._attached = []
+        self._lock = threading.Lock()
+
+    def _operation(self, name: str) -> _Operation:
+        with self._lock:
+            operation = self._operations.get(name)
+            if operation is None:
+                operation = self._operations[name] = _Operation(len(self.buckets))
+            return operation
+
+    def wrap(self, function, name: str):
+        """
+        Wrap a function so that its calls are recorded as an operation.
+
+        Args:
+            function (Callable): The function or method to wrap.
+            name (str): The operation name, e.g. "MySQLDatabase.save_data".
+
+        Returns:
+            Callable: The wrapper.
+        """
+        operation = self._operation(name)
+        clock = self._clock
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not self.enabled or next(operation.counter) % self.sample_every:
+                return function(*args, **kwargs)
+            started = clock()
+            failed = True
+            try:
+                result = function(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._record(operation, clock() - started, self._payload(args[1:]), failed)
+
+        wrapper.__instrumented__ = function
+        return wrapper
+
+    def _record(self, operation: _Operation, latency: float, size: int, failed: bool):
+        bucket = bisect_left(self.buckets, latency)
+        with self._lock:
+            metrics = operation.metrics
+            metrics.sampled += 1
+            metrics.errors += failed
+            metrics.latency_sum += latency
+            metrics.bucket_counts[bucket] += 1
+            metrics.payload_sum += size
+
+    def attach(self, cls: type, operations=None) -> type:
+        """
+        Instrument the operations of a class, in place.
+
+        Args:
+            cls (type): The class to instrument, e.g. MySQLDatabase or BasicPrinter.
+            operations (Iterable[str], optional): The method names to instrument. Defaults to those of
+                DEFAULT_OPERATIONS the class has.
+
+        Returns:
+            type: The class, so attach can be used as a class decorator.
+        """
+        for name in operations or DEFAULT_OPERATIONS:
+            function = getattr(cls, name, None)
+            if function is None or hasattr(function, "__instrumented__"):
+                continue
+            self._attached.append((cls, name, vars(cls).get(name)))
+            setattr(cls, name, self.wrap(function, f"{cls.__name__}.{name}"))
+        return cls
+
+    def detach(self):
+        """
+        Restore the original methods of every attached class.
+        """
+        while self._attached:
+            cls, name, original = self._attached.pop()
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Returns:
+            MetricsSnapshot: A copy of the current metrics.
+        """
+        with self._lock:
+            operations = {}
+            for name, operation in self._operations.items():
+                metrics = operation.metrics.copy()
+                metrics.calls = operation.calls()
+                operations[name] = metrics
+        return MetricsSnapshot(self.buckets, operations)
+
+    def reset(self):
+        """
+        Forget every recorded metric. Attached classes stay attached.
+        """
+        with self._lock:
+            for operation in self._operations.values():
+                operation.metrics = OperationMetrics(len(self.buckets))
+                operation.counter = itertools.count(1)
+                operation.peeks = 0
+
+    def export(self) -> MetricsSnapshot:
+        """
+        Hand a snapshot of the current metrics to every exporter.
+
+        Returns:
+            MetricsSnapshot: The exported snapshot.
+        """
+        snapshot = self.snapshot()
+        for exporter in self.exporters:
+            exporter.export(snapshot)
+        return snapshot
+
+
+class InMemoryExporter:
+    """
+    Keeps exported snapshots in memory, e.g. for tests or an admin endpoint.
+
+    Attributes:
+        snapshots (list[MetricsSnapshot]): The exported snapshots, oldest first.
+        limit (int): The number of snapshots kept.
+    """
+
+    def __init__(self, limit: int = 100):
+        self.snapshots = []
+        self.limit = limit
+
+    @property
+    def latest(self):
+        """
+        The most recent snapshot, or None before the first export.
+        """
+        return self.snapshots[-1] if self.snapshots else None
+
+    def export(self, snapshot: MetricsSnapshot):
+        self.snapshots.append(snapshot)
+        del self.snapshots[:-self.limit]
+
+
+class PrometheusExporter:
+    """
+    Renders snapshots in the Prometheus text exposition format.
+
+    Attributes:
+        path (str, optional): A file rewritten on every export, e.g. for the node exporter's textfile collector.
+        prefix (str): The prefix of every metric name.
+        text (str): The last rendered exposition.
+    """
+
+    def __init__(self, path: str = None, prefix: str = "solid_operation"):
+        self.path = path
+        self.prefix = prefix
+        self.text = ""
+
+    def render(self, snapshot: MetricsSnapshot) -> str:
+        """
+        Render a snapshot.
+
+        Args:
+            snapshot (MetricsSnapshot): The metrics to render.
+
+        Returns:
+            str: The exposition text.
+        """
+        prefix = self.prefix
+        lines = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        operations = sorted(snapshot.operations.items())
+        family("calls_total", "counter", "Calls per operation.")
+        for name, metrics in operations:
+            lines.append(f'{prefix}_calls_total{{operation="{name}"}} {metrics.calls}')
+        family("errors_total", "counter", "Sampled calls that raised.")
+        for name, metrics in operations:
+            lines.append(f'{prefix}_errors_total{{operation="{name}"}} {metrics.errors}')
+        family("payload_total", "counter", "Summed payload size of sampled calls.")
+        for name, metrics in operations:
+            lines.append(f'{prefix}_payload_total{{operation="{name}"}} {metrics.payload_sum}')
+        family("latency_seconds", "histogram", "Latency of sampled calls.")
+        for name, metrics in operations:
+            cumulative = 0
+            bounds = [repr(bound) for bound in snapshot.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, metrics.bucket_counts):
+                cumulative += count
+                lines.append(f'{prefix}_latency_seconds_bucket{{operation="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_latency_seconds_sum{{operation="{name}"}} {metrics.latency_sum!r}')
+            lines.append(f'{prefix}_latency_seconds_count{{operation="{name}"}} {metrics.sampled}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, snapshot: MetricsSnapshot):
+        self.text = self.render(snapshot)
+        if self.path is not None:
+            with open(self.path, "w") as file:
+                file.write(self.text)
+
+
+# Example Usage
+if __name__ == "__main__":
+    import contextlib
+    import io
+
+    import solid_principles
+
+    memory = InMemoryExporter()
+    prometheus = PrometheusExporter()
+    instrumentation = Instrumentation(sample_rate=0.5, exporters=[memory, prometheus])
+    instrumentation.attach(solid_principles.MySQLDatabase, ["save_data"])
+    instrumentation.attach(solid_principles.BasicPrinter)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        database = solid_principles.MySQLDatabase()
+        for index in range(10):
+            database.save_data(f"record {index}")
+    solid_principles.BasicPrinter().print_document("Hello World")
+
+    instrumentation.export()
+    print(prometheus.text)
+    instrumentation.detach()
+    assert not hasattr(solid_principles.MySQLDatabase.save_data, "__instrumented__")
+    print(f"save_data calls: {memory.latest.operations['MySQLDatabase.save_data'].calls}")
@@ -0,0 +1,11 @@
+"""
+The Interface Segregation Principle examples.
+
+The modules live in "SOLID Principles/Interface Segregation Principle", a folder name that is not a valid package name, so this package
+points its __path__ there and they are imported as solid_principles.interface_segregation.<module>.
+"""
+
+import os
+
+__path__ = [os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         "SOLID Principles", "Interface Segregation Principle")]
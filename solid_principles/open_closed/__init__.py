@@ -0,0 +1,11 @@
+"""
+The Open-Closed Principle examples.
+
+The modules live in "SOLID Principles/Open-Closed Principle", a folder name that is not a valid package name, so this package
+points its __path__ there and they are imported as solid_principles.open_closed.<module>.
+"""
+
+import os
+
+__path__ = [os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         "SOLID Principles", "Open-Closed Principle")]
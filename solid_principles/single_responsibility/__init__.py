@@ -0,0 +1,11 @@
+"""
+The Single Responsibility Principle examples.
+
+The modules live in "SOLID Principles/Single Responsibility Principle", a folder name that is not a valid package name, so this package
+points its __path__ there and they are imported as solid_principles.single_responsibility.<module>.
+"""
+
+import os
+
+__path__ = [os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         "SOLID Principles", "Single Responsibility Principle")]
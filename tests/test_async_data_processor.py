@@ -0,0 +1,78 @@
+"""
+Tests for AsyncDataProcessor.process_many.
+"""
+
+import asyncio
+
+import pytest
+
+from solid_principles.dependency_inversion.async_data_processor import AsyncDatabase, AsyncDataProcessor
+from solid_principles.dependency_inversion.output_sinks import NullSink
+
+
+class FakeAsyncDatabase(AsyncDatabase):
+    """
+    A backend whose writes take a while and fail for one record.
+    """
+
+    def __init__(self, latency: float = 0.01, fail_on: str = None):
+        self.latency = latency
+        self.fail_on = fail_on
+        self.saved = []
+        self.active = 0
+        self.peak = 0
+
+    async def connect(self):
+        pass
+
+    async def save_data(self, data: str):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            if data == self.fail_on:
+                raise ConnectionError(f"could not save {data}")
+            self.saved.append(data)
+        finally:
+            self.active -= 1
+
+
+def test_writes_overlap_up_to_max_concurrency():
+    database = FakeAsyncDatabase()
+    processor = AsyncDataProcessor(database, max_concurrency=4, output=NullSink())
+    saved = asyncio.run(processor.process_many(f"record {index}" for index in range(40)))
+    assert saved == 40
+    assert sorted(database.saved) == sorted(f"record {index}" for index in range(40))
+    assert database.peak == 4
+
+
+def test_no_records_are_pulled_after_a_failed_write():
+    pulled = []
+
+    def records():
+        for index in range(1000):
+            pulled.append(index)
+            yield f"record {index}"
+
+    database = FakeAsyncDatabase(fail_on="record 2")
+    processor = AsyncDataProcessor(database, max_concurrency=3, output=NullSink())
+    with pytest.raises(ConnectionError):
+        asyncio.run(processor.process_many(records()))
+    # Records 0-2 fail or finish together, so at most one more batch of 3 can start before the failure is seen.
+    assert len(pulled) <= 6
+
+
+def test_async_sources_are_closed_after_a_failure():
+    closed = []
+
+    async def records():
+        try:
+            for index in range(1000):
+                yield f"record {index}"
+        finally:
+            closed.append(True)
+
+    processor = AsyncDataProcessor(FakeAsyncDatabase(fail_on="record 0"), max_concurrency=1, output=NullSink())
+    with pytest.raises(ConnectionError):
+        asyncio.run(processor.process_many(records()))
+    assert closed == [True]
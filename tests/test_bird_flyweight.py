@@ -0,0 +1,53 @@
+"""
+Tests for the bird flyweights.
+"""
+
+import io
+
+from solid_principles.liskov_substitution.bird_batch import describe_birds
+from solid_principles.liskov_substitution.bird_flyweight import BirdFactory, Flock
+from solid_principles.liskov_substitution.liskov_substitution import Ostrich, Sparrow
+
+
+def test_factory_shares_instances():
+    factory = BirdFactory()
+    assert factory.get(Sparrow) is factory.get(Sparrow)
+    assert factory.fly(Ostrich) is None
+    assert len(factory) == 2
+
+
+def test_descriptions_match_describe_birds():
+    birds = [Sparrow(), Ostrich(), Sparrow(), Ostrich(), Ostrich()]
+    expected = io.StringIO()
+    describe_birds(birds, file=expected)
+
+    described = io.StringIO()
+    Flock(birds).describe(file=described)
+    assert described.getvalue() == expected.getvalue()
+
+    factory = BirdFactory()
+    assert "".join(factory.description(type(bird)) for bird in birds) == expected.getvalue()
+
+
+class CountingSparrow(Sparrow):
+    """
+    A sparrow that counts how often it is asked for its sound.
+    """
+
+    sounds = 0
+
+    def make_sound(self) -> str:
+        CountingSparrow.sounds += 1
+        return super().make_sound()
+
+
+def test_descriptions_reuse_the_cached_behaviors():
+    CountingSparrow.sounds = 0
+    factory = BirdFactory()
+    flock = Flock([CountingSparrow, Ostrich, CountingSparrow], factory)
+    for _ in range(3):
+        factory.description(CountingSparrow)
+        flock.describe(file=io.StringIO())
+    assert factory.make_sound(CountingSparrow) == Sparrow().make_sound()
+    assert CountingSparrow.sounds == 1
+    assert flock.factory is factory
@@ -0,0 +1,114 @@
+"""
+Tests for BufferedDataProcessor.
+"""
+
+import time
+
+import pytest
+
+from solid_principles.dependency_inversion.buffered_data_processor import BufferedDataProcessor
+from solid_principles.dependency_inversion.dependency_inversion_principle import Database
+
+
+class FakeDatabase(Database):
+    """
+    A backend that records its batches and fails while failures remain.
+    """
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.batches = []
+
+    def connect(self):
+        pass
+
+    def save_data(self, data: str):
+        self.save_many([data])
+
+    def save_many(self, data: list):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append(list(data))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _wait_for(condition, timeout: float = 2):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_flushes_when_the_buffer_is_full():
+    database = FakeDatabase()
+    with BufferedDataProcessor(database, max_size=2, max_delay=None, output=lambda message: None) as processor:
+        for index in range(5):
+            processor.process_data(f"record {index}")
+        assert database.batches == [["record 0", "record 1"], ["record 2", "record 3"]]
+        assert processor.pending == 1
+    assert database.batches[-1] == ["record 4"]
+
+
+def test_age_is_checked_on_process_data_and_poll():
+    database, clock = FakeDatabase(), FakeClock()
+    processor = BufferedDataProcessor(database, max_delay=60, clock=clock, output=lambda message: None)
+    processor.process_data("record 0")
+    clock.now = 30
+    processor.process_data("record 1")
+    assert processor.poll() == 0
+    clock.now = 60
+    assert processor.poll() == 2
+    assert database.batches == [["record 0", "record 1"]]
+
+    processor.process_data("record 2")
+    clock.now = 120
+    processor.process_data("record 3")
+    assert database.batches[-1] == ["record 2", "record 3"]
+    processor.close()
+
+
+def test_timer_flushes_a_quiet_buffer():
+    database = FakeDatabase()
+    with BufferedDataProcessor(database, max_delay=0.05, output=lambda message: None) as processor:
+        processor.process_data("record 0")
+        assert _wait_for(lambda: database.batches == [["record 0"]])
+        processor.process_data("record 1")
+        assert _wait_for(lambda: database.batches == [["record 0"], ["record 1"]])
+        assert processor.pending == 0
+
+
+def test_failed_flush_keeps_the_records():
+    database = FakeDatabase(failures=1)
+    processor = BufferedDataProcessor(database, max_size=2, max_delay=None, output=lambda message: None)
+    processor.process_data("record 0")
+    with pytest.raises(ConnectionError):
+        processor.process_data("record 1")
+    assert processor.pending == 2
+    processor.process_data("record 2")
+    assert database.batches == [["record 0", "record 1", "record 2"]]
+    processor.close()
+
+
+def test_failed_timed_flush_is_retried():
+    database = FakeDatabase(failures=1)
+    with BufferedDataProcessor(database, max_delay=0.05, output=lambda message: None) as processor:
+        processor.process_data("record 0")
+        assert _wait_for(lambda: database.batches == [["record 0"]])
+        assert isinstance(processor.last_error, ConnectionError)
+
+
+def test_close_stops_the_timer():
+    database = FakeDatabase()
+    processor = BufferedDataProcessor(database, max_delay=0.05, output=lambda message: None)
+    processor.process_data("record 0")
+    processor.close()
+    assert processor._timer is None
+    assert database.batches == [["record 0"]]
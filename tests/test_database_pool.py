@@ -0,0 +1,174 @@
+"""
+Tests for PooledDatabase, using a fake backend that injects connect, save and health check latency.
+"""
+
+import threading
+import time
+
+import pytest
+
+from solid_principles.dependency_inversion.database_pool import PooledDatabase
+from solid_principles.dependency_inversion.dependency_inversion_principle import Database
+
+
+class FakeDatabase(Database):
+    """
+    A backend that sleeps on connect and save and records what it saved.
+    """
+
+    def __init__(self, connect_latency: float = 0.0, save_latency: float = 0.0):
+        self.connect_latency = connect_latency
+        self.save_latency = save_latency
+        self.connects = 0
+        self.saved = []
+
+    def connect(self):
+        time.sleep(self.connect_latency)
+        self.connects += 1
+
+    def save_data(self, data: str):
+        time.sleep(self.save_latency)
+        self.saved.append(data)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_threads(target, count: int):
+    threads = [threading.Thread(target=target, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_backends_are_connected_once_and_reused():
+    backends = []
+    pool = PooledDatabase(lambda: backends.append(FakeDatabase()) or backends[-1], max_size=4)
+    for index in range(10):
+        pool.save_data(f"record {index}")
+    assert pool.created == 1
+    assert pool.reused == 9
+    assert backends[0].connects == 1
+    assert len(backends[0].saved) == 10
+
+
+def test_concurrent_writers_never_exceed_max_size():
+    pool = PooledDatabase(lambda: FakeDatabase(save_latency=0.01), max_size=2)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def write(index):
+        with pool.connection() as backend:
+            with lock:
+                active.append(backend)
+                peak.append(len(active))
+            backend.save_data(f"record {index}")
+            with lock:
+                active.remove(backend)
+
+    run_threads(write, 8)
+    assert pool.created <= 2
+    assert max(peak) <= 2
+    assert pool.size == pool.created
+
+
+def test_pooled_writes_are_faster_than_connecting_per_write():
+    def make():
+        return FakeDatabase(connect_latency=0.02)
+
+    started = time.perf_counter()
+    for index in range(10):
+        backend = make()
+        backend.connect()
+        backend.save_data(f"record {index}")
+    direct = time.perf_counter() - started
+
+    pool = PooledDatabase(make, max_size=1)
+    started = time.perf_counter()
+    for index in range(10):
+        pool.save_data(f"record {index}")
+    pooled = time.perf_counter() - started
+    assert pool.created == 1
+    assert pooled < direct / 2
+
+
+def test_checkout_times_out_when_the_pool_is_exhausted():
+    pool = PooledDatabase(FakeDatabase, max_size=1, checkout_timeout=0.05)
+    backend = pool.checkout()
+    with pytest.raises(TimeoutError):
+        pool.checkout()
+    pool.checkin(backend)
+    assert pool.checkout() is backend
+
+
+def test_failed_health_check_discards_the_backend():
+    pool = PooledDatabase(FakeDatabase, max_size=1, health_check=lambda backend: False)
+    first = pool.checkout()
+    pool.checkin(first)
+    second = pool.checkout()
+    assert second is not first
+    assert pool.evicted == 1
+    assert pool.size == 1
+
+
+def test_raising_health_check_does_not_leak_a_slot():
+    def health_check(backend):
+        raise ConnectionError("ping failed")
+
+    pool = PooledDatabase(FakeDatabase, max_size=1, health_check=health_check, checkout_timeout=0.5)
+    for _ in range(3):
+        backend = pool.checkout()
+        pool.checkin(backend)
+    assert pool.created == 3
+    assert pool.evicted == 2
+    assert pool.size == 1
+
+
+def test_slow_health_check_does_not_block_other_checkouts():
+    started = threading.Event()
+
+    def health_check(backend):
+        started.set()
+        time.sleep(0.3)
+        return True
+
+    pool = PooledDatabase(FakeDatabase, max_size=2, health_check=health_check)
+    pool.checkin(pool.checkout())
+    checker = threading.Thread(target=lambda: pool.checkin(pool.checkout()))
+    checker.start()
+    assert started.wait(1)
+    begun = time.perf_counter()
+    backend = pool.checkout()
+    elapsed = time.perf_counter() - begun
+    pool.checkin(backend)
+    checker.join()
+    assert elapsed < 0.15
+    assert pool.created == 2
+
+
+def test_idle_backends_are_evicted():
+    clock = FakeClock()
+    pool = PooledDatabase(FakeDatabase, max_size=2, idle_timeout=10, clock=clock)
+    first = pool.checkout()
+    pool.checkin(first)
+    clock.now = 11
+    second = pool.checkout()
+    assert second is not first
+    assert pool.evicted == 1
+    assert pool.size == 1
+
+
+def test_closed_pool_refuses_checkouts():
+    pool = PooledDatabase(FakeDatabase)
+    pool.checkin(pool.checkout())
+    pool.close()
+    assert pool.size == 0
+    with pytest.raises(RuntimeError):
+        pool.checkout()
@@ -0,0 +1,40 @@
+"""
+Tests for the employee report renderer.
+"""
+
+from decimal import Decimal
+
+from solid_principles.single_responsibility.employee_report import render_report
+from solid_principles.single_responsibility.employee_table import EmployeeTable
+from solid_principles.single_responsibility.single_responsibility_principle import Employee
+
+
+def test_lines_match_get_details():
+    employees = [Employee("John Doe", 50000), Employee("Jane Roe", 62000.5)]
+    assert render_report(employees) == "".join(employee.get_details() + "\n" for employee in employees)
+
+
+def test_equal_salaries_keep_their_own_formatting():
+    salaries = [Decimal("50000"), Decimal("50000.00"), 50000, 50000.0, 0.0, -0.0]
+    employees = [Employee("John Doe", salary) for salary in salaries]
+    assert render_report(employees).splitlines() == [employee.get_details() for employee in employees]
+
+
+def test_cached_lines_follow_assignments():
+    employee = Employee("John Doe", 50000)
+    assert render_report([employee]) == "Employee: John Doe, Salary: 50000\n"
+    assert employee.get_details() is employee.get_details()
+    employee.salary = Decimal("51000.00")
+    assert render_report([employee]) == "Employee: John Doe, Salary: 51000.00\n"
+    employee.name = "John Roe"
+    assert render_report([employee]) == "Employee: John Roe, Salary: 51000.00\n"
+
+
+def test_table_rows_are_rerendered_after_salary_changes():
+    table = EmployeeTable([Employee("John Doe", 50000), Employee("Jane Roe", 62000)])
+    assert render_report(table) == "Employee: John Doe, Salary: 50000.0\nEmployee: Jane Roe, Salary: 62000.0\n"
+    table[0].salary = 51000
+    assert render_report(table) == "Employee: John Doe, Salary: 51000.0\nEmployee: Jane Roe, Salary: 62000.0\n"
+    table.raise_by_percent(50)
+    assert render_report(table) == "Employee: John Doe, Salary: 76500.0\nEmployee: Jane Roe, Salary: 93000.0\n"
+    assert render_report(table) == "".join(employee.get_details() + "\n" for employee in table)
@@ -0,0 +1,192 @@
+"""
+Tests for EmployeeService and its unit of work.
+"""
+
+import pytest
+
+from solid_principles.single_responsibility.employee_service import EmployeeService, UnitOfWork
+from solid_principles.single_responsibility.indexed_employee_db import IndexedEmployeeDB
+from solid_principles.single_responsibility.single_responsibility_principle import Employee, EmployeeDB
+
+
+class RecordingDB(EmployeeDB):
+    """
+    An in-memory store that records every write it receives, one call per row.
+    """
+
+    def __init__(self, employees=()):
+        super().__init__(output=lambda message: None)
+        self.salaries = {employee.name: employee.salary for employee in employees}
+        self.calls = []
+
+    def save(self, employee: Employee):
+        self.calls.append(("save", employee.name))
+        self.salaries[employee.name] = employee.salary
+
+    def update(self, employee: Employee):
+        self.calls.append(("update", employee.name))
+        self.salaries[employee.name] = employee.salary
+
+    def delete(self, employee: Employee):
+        self.calls.append(("delete", employee.name))
+        del self.salaries[employee.name]
+
+    def read(self, employee: Employee):
+        salary = self.salaries.get(employee.name)
+        return None if salary is None else Employee(employee.name, salary)
+
+
+class RecordingManyDB(RecordingDB):
+    """
+    A RecordingDB that also accepts writes in bulk.
+    """
+
+    def save_many(self, employees):
+        self.calls.append(("save_many", [employee.name for employee in employees]))
+
+    def update_many(self, employees):
+        self.calls.append(("update_many", [employee.name for employee in employees]))
+
+    def delete_many(self, employees):
+        self.calls.append(("delete_many", [employee.name for employee in employees]))
+
+
+class CountingIndexedDB(IndexedEmployeeDB):
+    def __init__(self, employees=()):
+        super().__init__(employees)
+        self.batches = 0
+
+    def batch(self):
+        self.batches += 1
+        return super().batch()
+
+
+def _names(changes) -> tuple:
+    return tuple([employee.name for employee in employees] for employees in changes)
+
+
+def test_unit_of_work_states():
+    unit = UnitOfWork()
+    clean, dirty, deleted = Employee("Clean", 1), Employee("Dirty", 2), Employee("Deleted", 3)
+    unit.register_clean(clean)
+    unit.register_clean(dirty)
+    unit.register_dirty(dirty)
+    unit.register_clean(deleted)
+    unit.register_deleted(deleted)
+    unit.register_new(Employee("New", 4))
+    assert _names(unit.changes()) == (["New"], ["Dirty"], ["Deleted"])
+    assert unit.get("Deleted") is None and unit.is_deleted("Deleted")
+    assert unit.get("Clean") is clean
+
+    with pytest.raises(ValueError):
+        unit.register_new(Employee("Clean", 5))
+    with pytest.raises(ValueError):
+        unit.register_dirty(deleted)
+
+
+def test_new_then_deleted_is_never_written():
+    unit = UnitOfWork()
+    temp = Employee("Temp", 1)
+    unit.register_new(temp)
+    unit.register_dirty(temp)
+    unit.register_deleted(temp)
+    assert len(unit) == 0
+    assert _names(unit.changes()) == ([], [], [])
+
+
+def test_delete_then_rehire_becomes_an_update():
+    database = RecordingDB([Employee("John Doe", 50000)])
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        service.fire(service.get("John Doe"))
+        assert service.get("John Doe") is None
+        service.hire("John Doe", 60000)
+    assert database.calls == [("update", "John Doe")]
+    assert database.salaries == {"John Doe": 60000}
+
+
+def test_clean_employees_are_written_only_if_changed_in_place():
+    database = RecordingDB([Employee("John Doe", 50000), Employee("Jane Roe", 62000)])
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        john = service.get("John Doe")
+        assert service.get("John Doe") is john
+        for _ in range(5):
+            john.salary += 1000
+        jane = service.get("Jane Roe")
+        jane.salary += 1000
+        jane.salary -= 1000
+    assert database.calls == [("update", "John Doe")]
+    assert database.salaries["John Doe"] == 55000
+
+
+def test_per_row_commit_path():
+    database = RecordingDB([Employee("John Doe", 50000), Employee("Jane Roe", 62000)])
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        service.hire("Max Mustermann", 41000)
+        service.give_raise(service.get("John Doe"), 10)
+        service.fire(service.get("Jane Roe"))
+    assert database.calls == [("delete", "Jane Roe"), ("save", "Max Mustermann"), ("update", "John Doe")]
+    assert database.salaries == pytest.approx({"John Doe": 55000, "Max Mustermann": 41000})
+
+
+def test_bulk_commit_path():
+    database = RecordingManyDB([Employee("John Doe", 50000), Employee("Jane Roe", 62000)])
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        service.hire("Max Mustermann", 41000)
+        service.hire("Erika Mustermann", 75000)
+        service.set_salary(service.get("John Doe"), 51000)
+        service.fire(service.get("Jane Roe"))
+    assert database.calls == [("delete_many", ["Jane Roe"]), ("save_many", ["Max Mustermann", "Erika Mustermann"]),
+                              ("update_many", ["John Doe"])]
+
+
+def test_batch_commit_path():
+    database = CountingIndexedDB([Employee(f"Employee {index}", 40000) for index in range(10)])
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        for index in range(10):
+            service.get(f"Employee {index}").salary += 1000
+        service.fire(service.get("Employee 0"))
+        service.hire("Max Mustermann", 41000)
+    assert database.batches == 1
+    assert len(database) == 10
+    assert database.get("Employee 0") is None
+    assert database.get("Employee 9").salary == 41000
+    assert database.get("Max Mustermann").salary == 41000
+
+
+def test_nothing_is_written_when_the_block_raises():
+    database = RecordingDB([Employee("John Doe", 50000)])
+    service = EmployeeService(database)
+    with pytest.raises(RuntimeError):
+        with service.unit_of_work():
+            service.hire("Max Mustermann", 41000)
+            service.get("John Doe").salary = 1
+            raise RuntimeError("request failed")
+    assert database.calls == []
+    with service.unit_of_work():
+        assert service.get("John Doe").salary == 50000
+
+
+def test_writes_outside_a_unit_of_work_are_immediate():
+    database = RecordingDB()
+    service = EmployeeService(database)
+    john = service.hire("John Doe", 50000)
+    service.set_salary(john, 51000)
+    service.fire(john)
+    assert database.calls == [("save", "John Doe"), ("update", "John Doe"), ("delete", "John Doe")]
+
+
+def test_set_salary_on_a_fired_employee_leaves_it_unchanged():
+    database = RecordingDB([Employee("John Doe", 50000)])
+    service = EmployeeService(database)
+    with service.unit_of_work():
+        john = service.get("John Doe")
+        service.fire(john)
+        with pytest.raises(ValueError):
+            service.set_salary(john, 99000)
+        assert john.salary == 50000
+    assert database.calls == [("delete", "John Doe")]
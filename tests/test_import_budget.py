@@ -0,0 +1,9 @@
+"""
+Checks that importing the package stays within its import time budget.
+"""
+
+from solid_principles import import_budget
+
+
+def test_import_stays_within_budget():
+    assert import_budget.main([]) == 0
@@ -0,0 +1,103 @@
+"""
+Tests for IndexedEmployeeDB batches and its salary index.
+"""
+
+import pytest
+
+from solid_principles.single_responsibility import indexed_employee_db
+from solid_principles.single_responsibility.indexed_employee_db import IndexedEmployeeDB
+from solid_principles.single_responsibility.single_responsibility_principle import Employee
+
+
+def _database(count: int = 100) -> IndexedEmployeeDB:
+    return IndexedEmployeeDB(Employee(f"Employee {index}", 30000 + index % 10 * 1000) for index in range(count))
+
+
+def _snapshot(database: IndexedEmployeeDB) -> tuple:
+    return dict(database._employees), list(database._salary_index)
+
+
+def _assert_index_consistent(database: IndexedEmployeeDB):
+    assert database._salary_index == sorted((salary, name) for name, salary in database._employees.items())
+
+
+@pytest.fixture
+def merges(monkeypatch):
+    """
+    Count the batches applied by rebuilding the salary index with a merge pass.
+    """
+    calls = []
+    merge = indexed_employee_db.merge
+
+    def counting_merge(*iterables):
+        calls.append(True)
+        return merge(*iterables)
+
+    monkeypatch.setattr(indexed_employee_db, "merge", counting_merge)
+    return calls
+
+
+@pytest.mark.parametrize("method, employees", [
+    ("update_many", [Employee("Employee 1", 99000), Employee("Employee 2", 98000), Employee("Nobody", 1)]),
+    ("delete_many", [Employee("Employee 1", 0), Employee("Nobody", 0), Employee("Employee 2", 0)]),
+])
+def test_batch_is_rolled_back_on_a_key_error(method, employees):
+    database = _database()
+    before = _snapshot(database)
+    with pytest.raises(KeyError, match="Nobody"):
+        getattr(database, method)(employees)
+    assert _snapshot(database) == before
+
+
+def test_batch_block_that_raises_applies_nothing():
+    database = _database()
+    before = _snapshot(database)
+    with pytest.raises(KeyError):
+        with database.batch() as batch:
+            batch.save(Employee("Max Mustermann", 41000))
+            batch.delete(Employee("Employee 1", 0))
+            batch.update(Employee("Employee 1", 50000))
+    assert _snapshot(database) == before
+
+
+def test_staged_changes_are_validated_against_each_other():
+    database = _database(3)
+    with database.batch() as batch:
+        batch.save(Employee("Max Mustermann", 41000))
+        batch.update(Employee("Max Mustermann", 42000))
+        batch.delete(Employee("Employee 0", 0))
+        batch.save(Employee("Employee 0", 10000))
+        assert len(batch) == 2
+    assert database.get("Max Mustermann").salary == 42000
+    assert database.get("Employee 0").salary == 10000
+    _assert_index_consistent(database)
+
+
+def test_small_batches_patch_the_index(merges):
+    database = _database()
+    with database.batch() as batch:
+        batch.update(Employee("Employee 1", 99000))
+        batch.delete(Employee("Employee 2", 0))
+        batch.save(Employee("Max Mustermann", 1000))
+    assert merges == []
+    _assert_index_consistent(database)
+    assert [employee.name for employee in database.top_k(1)] == ["Employee 1"]
+    assert [employee.name for employee in database.salary_range(0, 29999)] == ["Max Mustermann"]
+    assert len(database) == 100
+
+
+def test_large_batches_rebuild_the_index(merges):
+    database = _database()
+    with database.batch() as batch:
+        for index in range(0, 100, 2):
+            batch.update(Employee(f"Employee {index}", 60000 + index))
+        for index in range(1, 40, 2):
+            batch.delete(Employee(f"Employee {index}", 0))
+        for index in range(20):
+            batch.save(Employee(f"New {index}", 20000 + index))
+    assert merges == [True]
+    _assert_index_consistent(database)
+    assert len(database) == 100
+    assert [employee.name for employee in database.top_k(2)] == ["Employee 98", "Employee 96"]
+    assert [employee.salary for employee in database.salary_range(0, 20001)] == [20000, 20001]
+    assert database.get("Employee 1") is None
@@ -0,0 +1,45 @@
+"""
+Tests for the legacy shape dispatch table.
+"""
+
+import pytest
+
+from solid_principles.open_closed.legacy_shape_registry import (AREA_FUNCTIONS, calculate_areas, register_shape_type,
+                                                                 unregister_shape_type)
+from solid_principles.open_closed.open_closed_principle import LegacyShape
+
+
+def test_legacy_shapes_use_the_dispatch_table():
+    assert LegacyShape("rectangle", 5, 10).calculate_area() == 50
+    assert LegacyShape("circle", 7).calculate_area() == pytest.approx(153.86)
+    assert LegacyShape("triangle", 6, 8).calculate_area() == 24
+
+
+@pytest.fixture
+def square():
+    register_shape_type("square", dimensions=1)(lambda side: side * side)
+    yield "square"
+    unregister_shape_type("square")
+
+
+def test_registered_types_need_no_change_to_legacy_shape(square):
+    assert LegacyShape(square, 3).calculate_area() == 9
+    assert list(calculate_areas([LegacyShape(square, 3), LegacyShape("rectangle", 2, 3)])) == [9, 6]
+
+
+def test_unregistered_types_are_rejected_again(square):
+    unregister_shape_type(square)
+    with pytest.raises(ValueError):
+        LegacyShape(square, 3).calculate_area()
+    register_shape_type(square, dimensions=1)(lambda side: side * side)
+    assert sorted(AREA_FUNCTIONS) == ["circle", "rectangle", "square", "triangle"]
+
+
+def test_unknown_types_are_rejected():
+    with pytest.raises(ValueError):
+        LegacyShape("hexagon", 1).calculate_area()
+
+
+def test_bulk_areas_match_single_areas():
+    shapes = [LegacyShape("rectangle", 5, 10), LegacyShape("circle", 7), LegacyShape("triangle", 6, 8)]
+    assert list(calculate_areas(shapes)) == pytest.approx([shape.calculate_area() for shape in shapes])
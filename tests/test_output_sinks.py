@@ -0,0 +1,130 @@
+"""
+Tests for the output sinks.
+"""
+
+import gc
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from solid_principles.dependency_inversion import output_sinks
+from solid_principles.dependency_inversion.output_sinks import BackgroundSink, BufferedSink
+
+
+class FlakyStream(io.StringIO):
+    """
+    A text stream whose first writes raise the given exception.
+    """
+
+    def __init__(self, failures: int = 1, error=OSError):
+        super().__init__()
+        self.failures = failures
+        self.error = error
+
+    def write(self, text: str) -> int:
+        if self.failures:
+            self.failures -= 1
+            raise self.error("disk full")
+        return super().write(text)
+
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str) -> str:
+    completed = subprocess.run([sys.executable, "-c", code], cwd=REPOSITORY, capture_output=True, text=True,
+                               check=True, timeout=30)
+    return completed.stdout
+
+
+def test_buffered_sink_writes_full_batches():
+    stream = io.StringIO()
+    sink = BufferedSink(stream, max_messages=3, max_delay=None)
+    for index in range(4):
+        sink(f"message {index}")
+    assert stream.getvalue() == "message 0\nmessage 1\nmessage 2\n"
+    sink.close()
+    assert stream.getvalue().endswith("message 3\n")
+
+
+def test_buffered_sink_flushes_after_max_delay():
+    stream = io.StringIO()
+    sink = BufferedSink(stream, max_delay=0.05)
+    sink("message")
+    deadline = time.monotonic() + 2
+    while not stream.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.getvalue() == "message\n"
+    sink.close()
+
+
+def test_write_right_after_a_timed_flush_arms_a_new_timer(monkeypatch):
+    flushed = threading.Event()
+    flush_later = output_sinks._flush_later
+
+    def slow_timer_exit(reference):
+        flush_later(reference)
+        flushed.set()
+        # Hold the timer thread between its flush and the end of Timer.run.
+        time.sleep(0.5)
+
+    monkeypatch.setattr(output_sinks, "_flush_later", slow_timer_exit)
+    stream = io.StringIO()
+    sink = BufferedSink(stream, max_delay=0.05)
+    sink("first")
+    assert flushed.wait(2)
+    sink("second")
+    deadline = time.monotonic() + 0.4
+    while stream.getvalue() != "first\nsecond\n" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.getvalue() == "first\nsecond\n"
+    sink.close()
+
+
+def test_buffered_sink_flushes_when_collected():
+    stream = io.StringIO()
+    sink = BufferedSink(stream, max_delay=None)
+    sink("message")
+    del sink
+    gc.collect()
+    assert stream.getvalue() == "message\n"
+
+
+def test_sinks_flush_at_exit_without_close():
+    code = ("from solid_principles import BufferedSink, BackgroundSink; "
+            "buffered = BufferedSink(max_delay=None); buffered('buffered message'); "
+            "background = BackgroundSink(); [background(f'background {index}') for index in range(1000)]")
+    output = run_python(code).splitlines()
+    assert "buffered message" in output
+    assert "background 999" in output
+
+
+def test_background_sink_keeps_writing_after_a_stream_error():
+    stream = FlakyStream(failures=1)
+    with BackgroundSink(stream, max_queue=1, policy="block", batch_size=1) as sink:
+        writer = threading.Thread(target=lambda: [sink(f"message {index}") for index in range(50)])
+        writer.start()
+        writer.join(5)
+        assert not writer.is_alive()
+    assert sink.failed == 1
+    assert isinstance(sink.last_error, OSError)
+    assert stream.getvalue().count("\n") == 49
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_blocked_write_fails_when_the_writer_thread_died():
+    class Stop(BaseException):
+        pass
+
+    sink = BackgroundSink(FlakyStream(failures=1, error=Stop), max_queue=1, policy="block")
+    sink("message 0")
+    sink._thread.join(5)
+    sink("message 1")
+    with pytest.raises(RuntimeError):
+        sink("message 2")
+    sink.close()
@@ -0,0 +1,107 @@
+"""
+Tests for MappedEmployeeDB.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from solid_principles.single_responsibility.persistent_employee_db import MappedEmployeeDB
+from solid_principles.single_responsibility.single_responsibility_principle import Employee
+
+
+def read(employee_db, name):
+    return employee_db.read(Employee(name, 0))
+
+
+def test_employees_survive_a_reopen(tmp_path):
+    path = str(tmp_path / "employees.log")
+    with MappedEmployeeDB(path) as employee_db:
+        for index in range(5000):
+            employee_db.save(Employee(f"Employee {index}", 30000 + index))
+        employee_db.update(Employee("Employee 7", 99000.5))
+        employee_db.delete(Employee("Employee 8", 0))
+    with MappedEmployeeDB(path) as employee_db:
+        assert len(employee_db) == 4999
+        assert read(employee_db, "Employee 42").get_details() == "Employee: Employee 42, Salary: 30042"
+        assert read(employee_db, "Employee 7").salary == 99000.5
+        assert read(employee_db, "Employee 8") is None
+        assert Employee("Employee 4999", 0) in employee_db
+
+
+def test_salaries_keep_their_type(tmp_path):
+    salaries = {"integer": 30042, "float": 30042.0, "negative": -5, "huge": 1 << 70}
+    with MappedEmployeeDB(str(tmp_path / "employees.log")) as employee_db:
+        for name, salary in salaries.items():
+            employee_db.save(Employee(name, salary))
+    with MappedEmployeeDB(str(tmp_path / "employees.log")) as employee_db:
+        stored = {name: read(employee_db, name).salary for name in salaries}
+    assert stored == salaries
+    assert [type(salary) for salary in stored.values()] == [int, float, int, float]
+    assert Employee("integer", stored["integer"]).get_details() == "Employee: integer, Salary: 30042"
+
+
+def test_refuses_files_that_are_not_employee_logs(tmp_path):
+    for content in (b"hi", b"not an employee log, just some notes"):
+        path = tmp_path / "notes.txt"
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            MappedEmployeeDB(str(path))
+        assert path.read_bytes() == content
+
+
+def test_empty_file_becomes_a_log(tmp_path):
+    path = tmp_path / "employees.log"
+    path.write_bytes(b"")
+    with MappedEmployeeDB(str(path)) as employee_db:
+        employee_db.save(Employee("John Doe", 50000))
+    with MappedEmployeeDB(str(path)) as employee_db:
+        assert read(employee_db, "John Doe").salary == 50000
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    path = str(tmp_path / "employees.log")
+    with MappedEmployeeDB(path) as employee_db:
+        for index in range(100):
+            employee_db.save(Employee(f"Employee {index}", index))
+        employee_db.delete(Employee("Employee 3", 0))
+    os.remove(path + ".index")
+    with MappedEmployeeDB(path) as employee_db:
+        assert len(employee_db) == 99
+        assert read(employee_db, "Employee 3") is None
+        assert read(employee_db, "Employee 99").salary == 99
+
+
+def test_records_appended_after_the_index_are_replayed(tmp_path):
+    path = str(tmp_path / "employees.log")
+    with MappedEmployeeDB(path) as employee_db:
+        employee_db.save(Employee("John Doe", 50000))
+        employee_db.save(Employee("Jane Roe", 60000))
+        employee_db.flush()
+        shutil.copy(path + ".index", path + ".old")
+        employee_db.delete(Employee("John Doe", 0))
+        employee_db.save(Employee("Temp Worker", 20000))
+    # An index last written before the final records, as a crashed process would leave it.
+    os.replace(path + ".old", path + ".index")
+    with MappedEmployeeDB(path) as employee_db:
+        assert len(employee_db) == 2
+        assert read(employee_db, "John Doe") is None
+        assert read(employee_db, "Temp Worker").salary == 20000
+
+
+def test_compaction_keeps_live_employees(tmp_path):
+    path = str(tmp_path / "employees.log")
+    with MappedEmployeeDB(path, compact_ratio=None) as employee_db:
+        for round_ in range(5):
+            for index in range(500):
+                employee_db.save(Employee(f"Employee {index}", round_ * 1000 + index))
+        for index in range(0, 500, 2):
+            employee_db.delete(Employee(f"Employee {index}", 0))
+        employee_db.compact()
+        assert len(employee_db) == 250
+    with MappedEmployeeDB(path) as employee_db:
+        assert len(employee_db) == 250
+        assert read(employee_db, "Employee 0") is None
+        assert read(employee_db, "Employee 1").salary == 4001
+
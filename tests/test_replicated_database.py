@@ -0,0 +1,129 @@
+"""
+Tests for ReplicatedDatabase.
+"""
+
+import threading
+import time
+
+import pytest
+
+from solid_principles.dependency_inversion.dependency_inversion_principle import Database
+from solid_principles.dependency_inversion.replicated_database import ReplicatedDatabase, ReplicationError
+
+
+class FakeDatabase(Database):
+    """
+    A backend that records its writes, optionally after a delay, until released or failing.
+    """
+
+    def __init__(self, delay: float = 0.0, fail: bool = False, blocked: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.saved = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not blocked:
+            self.release.set()
+
+    def connect(self):
+        pass
+
+    def save_data(self, data: str):
+        self.started.set()
+        self.release.wait(5)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError(f"could not save {data}")
+        self.saved.append(data)
+
+
+def test_all_waits_for_every_backend():
+    backends = [FakeDatabase(0.02), FakeDatabase(0.05)]
+    with ReplicatedDatabase(backends) as replicated:
+        started = time.monotonic()
+        replicated.save_data("record")
+        elapsed = time.monotonic() - started
+    assert [backend.saved for backend in backends] == [["record"], ["record"]]
+    assert elapsed < 0.07 + 0.05
+
+
+def test_all_fails_when_one_backend_fails():
+    failing = FakeDatabase(fail=True)
+    with ReplicatedDatabase([FakeDatabase(), failing]) as replicated:
+        with pytest.raises(ReplicationError) as raised:
+            replicated.save_data("record")
+    assert [(backend, type(error)) for backend, error in raised.value.failures] == [(failing, ConnectionError)]
+    assert replicated.stats[1].failures == 1
+    assert replicated.stats[1].calls == 1
+
+
+def test_quorum_tolerates_a_minority_of_failures():
+    with ReplicatedDatabase([FakeDatabase(), FakeDatabase(), FakeDatabase(fail=True)], "quorum") as replicated:
+        replicated.save_data("record")
+    with ReplicatedDatabase([FakeDatabase(), FakeDatabase(fail=True), FakeDatabase(fail=True)], "quorum") as replicated:
+        with pytest.raises(ReplicationError):
+            replicated.save_data("record")
+
+
+def test_first_returns_after_the_fastest_backend():
+    slow = FakeDatabase(blocked=True)
+    with ReplicatedDatabase([FakeDatabase(), slow], "first") as replicated:
+        started = time.monotonic()
+        replicated.save_data("record")
+        assert time.monotonic() - started < 1
+        slow.release.set()
+    assert slow.saved == ["record"]
+
+
+def test_per_backend_timeouts():
+    slow = FakeDatabase(blocked=True)
+    with ReplicatedDatabase([FakeDatabase(), slow], timeout=(None, 0.05)) as replicated:
+        with pytest.raises(ReplicationError) as raised:
+            replicated.save_data("record")
+        slow.release.set()
+    assert [(backend, type(error)) for backend, error in raised.value.failures] == [(slow, TimeoutError)]
+    assert replicated.stats[1].timeouts == 1
+    assert replicated.stats[0].timeouts == 0
+
+
+def test_stats_record_latency():
+    with ReplicatedDatabase([FakeDatabase(0.02), FakeDatabase()]) as replicated:
+        replicated.save_data("first")
+        replicated.save_data("second")
+    stats = replicated.stats[0]
+    assert stats.calls == 2
+    assert stats.failures == stats.timeouts == stats.rejected == stats.cancelled == stats.pending == 0
+    assert stats.max_latency >= stats.mean_latency >= 0.02
+
+
+def test_unstarted_writes_are_cancelled_once_consistency_is_met():
+    slow = FakeDatabase(blocked=True)
+    with ReplicatedDatabase([FakeDatabase(0.05), slow], "first") as replicated:
+        replicated.save_data("first")
+        assert slow.started.wait(1)
+        # The slow backend is still busy with the first write, so the second one is queued and then cancelled.
+        replicated.save_data("second")
+        slow.release.set()
+    assert slow.saved == ["first"]
+    assert replicated.stats[1].cancelled == 1
+    assert replicated.stats[1].pending == 0
+
+
+def test_full_backends_fail_fast_and_are_reported_degraded():
+    slow = FakeDatabase(blocked=True)
+    with ReplicatedDatabase([FakeDatabase(0.05), slow], "first", max_pending=1) as replicated:
+        replicated.save_data("first")
+        assert slow.started.wait(1)
+        assert replicated.degraded_backends == (slow,)
+        replicated.save_data("second")
+        assert replicated.stats[1].rejected == 1
+
+        replicated.consistency = "all"
+        started = time.monotonic()
+        with pytest.raises(ReplicationError) as raised:
+            replicated.save_data("third")
+        assert time.monotonic() - started < 1
+        assert [(backend, type(error)) for backend, error in raised.value.failures] == [(slow, RuntimeError)]
+        slow.release.set()
+    assert slow.saved == ["first"]
+    assert replicated.degraded_backends == ()
@@ -0,0 +1,76 @@
+"""
+Tests for ShapeBatch and calculate_areas.
+"""
+
+import pytest
+
+from solid_principles.open_closed import shape_batch
+from solid_principles.open_closed.open_closed_principle import Circle, Rectangle, Shape, Triangle
+from solid_principles.open_closed.shape_batch import ShapeBatch, calculate_areas, register_area_kernel
+
+
+class Square(Shape):
+    def __init__(self, side: float):
+        self.side = side
+
+    def calculate_area(self) -> float:
+        return self.side * self.side
+
+
+@pytest.fixture
+def kernels(monkeypatch):
+    """
+    Let a test register kernels without leaving them behind.
+    """
+    monkeypatch.setattr(shape_batch, "_KERNELS", dict(shape_batch._KERNELS))
+
+
+def _shapes() -> list:
+    return [Rectangle(5, 10.5), Circle(7), Triangle(4.25, 8), Square(3.5), Circle(1.1), Rectangle(0.3, 0.7)] * 50
+
+
+def test_areas_equal_calculate_area_exactly():
+    shapes = _shapes()
+    expected = [shape.calculate_area() for shape in shapes]
+    batch = ShapeBatch(shapes)
+    assert len(batch) == len(shapes)
+    assert list(batch.calculate_areas()) == expected
+    assert list(calculate_areas(shapes)) == expected
+    assert list(calculate_areas(batch)) == expected
+    assert batch.total_area() == pytest.approx(sum(expected))
+
+
+def test_empty_batch():
+    batch = ShapeBatch()
+    assert len(batch.calculate_areas()) == 0
+    assert batch.total_area() == 0
+
+
+def test_each_class_is_evaluated_with_one_kernel_call(kernels):
+    np = pytest.importorskip("numpy")
+    calls = []
+
+    @register_area_kernel(Rectangle, "width", "height")
+    def counted_rectangle_area(width, height):
+        calls.append(type(width))
+        return width * height
+
+    batch = ShapeBatch(_shapes())
+    batch.calculate_areas()
+    batch.total_area()
+    assert calls == [np.ndarray, np.ndarray]
+
+
+def test_newly_registered_kernel_is_picked_up(kernels):
+    pytest.importorskip("numpy")
+    calls = []
+
+    @register_area_kernel(Square, "side")
+    def square_area(side):
+        calls.append(len(side))
+        return side * side
+
+    shapes = _shapes()
+    areas = ShapeBatch(shapes).calculate_areas()
+    assert calls == [50]
+    assert list(areas) == [shape.calculate_area() for shape in shapes]
@@ -0,0 +1,34 @@
+"""
+Tests for ShapeStore and ShapeView.
+"""
+
+import copy
+
+import pytest
+
+from solid_principles.open_closed.open_closed_principle import Circle, Rectangle
+from solid_principles.open_closed.shape_store import ShapeStore
+
+
+def test_views_expose_dimensions_and_areas():
+    store = ShapeStore([Rectangle(5, 10), Circle(7)])
+    rectangle, circle = store
+    assert (rectangle.width, rectangle.height) == (5, 10)
+    assert circle.radius == 7
+    assert [view.calculate_area() for view in store] == pytest.approx([50, 153.86])
+    with pytest.raises(AttributeError):
+        circle.width
+
+
+def test_views_can_be_copied():
+    store = ShapeStore([Rectangle(5, 10)])
+    view = store[0]
+    for duplicate in (copy.copy(view), copy.deepcopy(view)):
+        assert duplicate.dimensions == (5, 10)
+        assert duplicate.calculate_area() == 50
+
+
+def test_private_names_fail_fast():
+    view = ShapeStore([Rectangle(5, 10)])[0]
+    with pytest.raises(AttributeError):
+        view._missing
@@ -0,0 +1,90 @@
+"""
+Tests for the streaming shape readers, the binary format and AreaStatistics.
+"""
+
+import io
+
+import pytest
+
+from solid_principles.open_closed.open_closed_principle import Circle, Rectangle, Triangle
+from solid_principles.open_closed.shape_store import ShapeStore
+from solid_principles.open_closed.shape_stream import (
+    aggregate_areas, chunked, read_binary_chunks, read_csv_chunks, write_binary,
+)
+
+ROWS = "rectangle,5,10\ncircle,7\ntriangle,4,8\ncircle,1\n"
+
+
+def _dimensions(chunks) -> list:
+    return [(view.shape_class, view.dimensions) for chunk in chunks for view in chunk]
+
+
+def test_csv_accepts_headers_padding_and_blank_lines():
+    text = "type,first,second\nrectangle, 5,10\ncircle,7,\n\nCircle,1,  \ntriangle,4,8\n"
+    chunks = list(read_csv_chunks(io.StringIO(text), header=True))
+    assert _dimensions(chunks) == [(Rectangle, (5, 10)), (Circle, (7,)), (Circle, (1,)), (Triangle, (4, 8))]
+
+
+def test_csv_errors_name_the_line():
+    with pytest.raises(ValueError, match="Unknown shape type 'type' on line 1"):
+        list(read_csv_chunks(io.StringIO("type,first,second\ncircle,7\n")))
+    with pytest.raises(ValueError, match="on line 3"):
+        list(read_csv_chunks(io.StringIO("type,first,second\ncircle,7\ncircle,x\n"), header=True))
+    with pytest.raises(ValueError, match="expects 2 dimensions.* on line 1"):
+        list(read_csv_chunks(io.StringIO("rectangle,5\n")))
+
+
+@pytest.mark.parametrize("chunk_size, sizes", [(1, [1] * 8), (3, [3, 3, 2]), (4, [4, 4]), (8, [8]), (100, [8])])
+def test_chunk_boundaries(chunk_size, sizes, tmp_path):
+    csv_chunks = list(read_csv_chunks(io.StringIO(ROWS * 2), chunk_size=chunk_size))
+    assert [len(chunk) for chunk in csv_chunks] == sizes
+
+    path = str(tmp_path / "shapes.bin")
+    assert write_binary(path, csv_chunks) == 8
+    binary_chunks = list(read_binary_chunks(path, chunk_size=chunk_size))
+    assert [len(chunk) for chunk in binary_chunks] == sizes
+    assert _dimensions(binary_chunks) == _dimensions(csv_chunks)
+
+    shapes = [view.to_shape() for chunk in csv_chunks for view in chunk]
+    assert [len(chunk) for chunk in chunked(shapes, chunk_size)] == sizes
+
+
+def test_binary_round_trip_through_a_file(tmp_path):
+    csv_path = tmp_path / "shapes.csv"
+    csv_path.write_text("type,first,second\n" + ROWS * 3)
+    binary_path = str(tmp_path / "shapes.bin")
+    assert write_binary(binary_path, read_csv_chunks(str(csv_path), chunk_size=5, header=True)) == 12
+    expected = _dimensions(read_csv_chunks(str(csv_path), header=True))
+    assert _dimensions(read_binary_chunks(binary_path)) == expected
+
+
+def test_empty_binary_file(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    assert write_binary(path, []) == 0
+    assert list(read_binary_chunks(path)) == []
+
+
+def test_area_statistics():
+    statistics = aggregate_areas(read_csv_chunks(io.StringIO(ROWS * 5), chunk_size=3), bin_edges=(10, 100))
+    assert statistics.count == 20
+    assert statistics.total == pytest.approx(5 * (50 + 153.86 + 16 + 3.14))
+    assert statistics.mean == pytest.approx(statistics.total / 20)
+    assert statistics.minimum == pytest.approx(3.14)
+    assert statistics.maximum == pytest.approx(153.86)
+    assert statistics.histogram == [5, 10, 5]
+    assert statistics.totals_by_type == pytest.approx({"Rectangle": 250, "Circle": 5 * (153.86 + 3.14),
+                                                      "Triangle": 80})
+
+
+def test_area_statistics_do_not_depend_on_chunking():
+    whole = aggregate_areas([ShapeStore(view.to_shape() for view in next(read_csv_chunks(io.StringIO(ROWS * 7))))])
+    chunked_statistics = aggregate_areas(read_csv_chunks(io.StringIO(ROWS * 7), chunk_size=5))
+    assert chunked_statistics.histogram == whole.histogram
+    assert chunked_statistics.count == whole.count
+    assert chunked_statistics.total == pytest.approx(whole.total)
+    assert chunked_statistics.totals_by_type == pytest.approx(whole.totals_by_type)
+
+
+def test_area_statistics_before_any_shape():
+    statistics = aggregate_areas([ShapeStore()])
+    assert (statistics.count, statistics.mean, statistics.minimum, statistics.maximum) == (0, None, None, None)